@@ -0,0 +1,407 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import numpy as np
+
+# Driver de vídeo dummy: os benchmarks de renderização não abrem janela
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Garantir que o diretório do jogo está no path
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(GAME_DIR)
+
+import config
+from src.environment import RocketEnvironment
+from src.entities.rocket import Rocket
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Folga absoluta antes de acusar regressão de memória
+MEMORY_SLACK_BYTES = 64 * 1024
+
+BENCHMARKS = []
+
+def benchmark(name, requires=None):
+    """
+    Registra um benchmark.
+
+    A função decorada prepara o cenário e retorna (op, operações por chamada),
+    onde `op` é uma função sem argumentos medida repetidamente.
+    `requires` é um módulo opcional; sem ele o benchmark é pulado.
+    """
+    def register(setup):
+        BENCHMARKS.append((name, setup, requires))
+        return setup
+    return register
+
+# --- Física e ambiente ---
+
+@benchmark("rocket.atualizar")
+def bench_rocket_update():
+    rocket = Rocket(200, 20, 50)
+    rocket.potencia_motor = 90
+    dt = 1.0 / config.FPS
+    def op():
+        for _ in range(1000):
+            rocket.atualizar(dt)
+        rocket.reset()
+    return op, 1000
+
+@benchmark("rocket.compute_metrics+read")
+def bench_compute_metrics_read():
+    env = RocketEnvironment()
+    rocket, target, platform_ = env.rocket, env.target, env.landing_platform
+    def op():
+        # As métricas são calculadas na leitura: custo com as quatro lidas, como em env.step
+        for _ in range(1000):
+            rocket.compute_metrics(target, platform_)
+            rocket.distance_to_target, rocket.angle_difference
+            rocket.distance_to_landing_platform_x, rocket.distance_to_landing_platform_y
+    return op, 1000
+
+@benchmark("env.step")
+def bench_env_step():
+    env = RocketEnvironment(seed=0)
+    actions = env.np_random.integers(env.ACTION_SPACE_SIZE, size=1000)
+    env.reset()
+    def op():
+        for action in actions:
+            state, reward, done, info = env.step(action)
+            if done:
+                env.reset()
+    return op, len(actions)
+
+def _env_repeat_benchmark(adaptive):
+    # Uma ação a cada 8 passos de física: sobe com potência e plana com ações
+    # aleatórias até o fim do episódio; ops/s em ações por segundo, com e sem
+    # passo adaptativo
+    def setup():
+        env = RocketEnvironment(seed=0, action_repeat=8, adaptive=adaptive)
+        rng = np.random.default_rng(0)
+        actions = [1] * 40 + rng.choice([0, 0, 0, 1, 2, 3, 4], 160).tolist()
+        def op():
+            env.reset()
+            for action in actions:
+                state, reward, done, info = env.step(action)
+                if done:
+                    break
+        op()
+        return op, env.total_steps
+    return setup
+
+benchmark("env.step[repeat8]")(_env_repeat_benchmark(False))
+benchmark("env.step[repeat8,adaptive]")(_env_repeat_benchmark(True))
+
+@benchmark("env.reset")
+def bench_env_reset():
+    env = RocketEnvironment()
+    def op():
+        for _ in range(100):
+            env.reset()
+    return op, 100
+
+@benchmark("env._get_state")
+def bench_get_state():
+    env = RocketEnvironment()
+    def op():
+        for _ in range(1000):
+            env._get_state()
+    return op, 1000
+
+@benchmark("physics.RocketBatch.step[400]")
+def bench_batch_step():
+    from src.physics import RocketBatch, world_from_environment
+    env = RocketEnvironment()
+    batch = RocketBatch(400, world_from_environment(env))
+    actions = np.random.default_rng(0).integers(env.ACTION_SPACE_SIZE, size=(100, 400))
+    def op():
+        batch.fill(600, 400, 0, 0, 90, 0, 80)
+        for row in actions:
+            batch.step(row)
+    return op, len(actions)
+
+@benchmark("mpc.act")
+def bench_mpc_act():
+    from src.mpc import CEMController
+    env = RocketEnvironment(seed=0)
+    controller = CEMController(np.random.default_rng(0), env)
+    state = env.reset()
+    def op():
+        for _ in range(5):
+            controller.act(state)
+    return op, 5
+
+def _swarm_benchmark(n):
+    # Densidade constante (~1 foguete a cada 100 x 100 pixels): o custo por
+    # foguete deve ficar estável de 10 a 10.000 foguetes
+    def setup():
+        from src.swarm import SwarmWorld
+        rng = np.random.default_rng(0)
+        side = 100.0 * np.sqrt(n)
+        x = rng.uniform(0, side, n)
+        y = 200.0 + rng.uniform(0, side, n)
+        swarm = SwarmWorld(n, collisions_crash=False)
+        actions = rng.integers(RocketEnvironment.ACTION_SPACE_SIZE, size=(20, n))
+        def op():
+            swarm.reset(x, y, potencia=83)
+            for row in actions:
+                swarm.step(row)
+        return op, len(actions) * n
+    return setup
+
+# ops/s em foguete-passos por segundo
+for _swarm_size in (10, 100, 1000, 10000):
+    benchmark(f"swarm.step[{_swarm_size}]")(_swarm_benchmark(_swarm_size))
+
+@benchmark("course.capture+contact[1000x64]")
+def bench_course():
+    # 1000 foguetes num percurso de 64 targets (qualquer ordem) e 32 plataformas;
+    # ops/s em foguete-passos por segundo
+    from src.course import Course
+    from src.entities.platform import Platform
+    from src.entities.target import Target
+    rng = np.random.default_rng(0)
+    targets = [Target(float(x), float(y), 30, 30)
+               for x, y in zip(rng.uniform(0, 6400, 64), rng.uniform(100, 800, 64))]
+    platforms = [Platform(200.0 * i, 100.0) for i in range(32)]
+    course = Course(targets, platforms, landing=range(1, 32, 2), ordered=False)
+    n = 1000
+    x = rng.uniform(0, 6400, n)
+    y = rng.uniform(0, 800, n)
+    vx = rng.normal(0, 100, n)
+    vy = rng.normal(0, 100, n)
+    power = np.zeros(n)
+    collected, next_target = course.new_progress(n)
+    def op():
+        for _ in range(10):
+            course.capture_batch(x, y, collected, next_target)
+            course.ground_contact(x, y, vx, vy, power, 20.0, 200.0)
+    return op, 10 * n
+
+# --- Agente DQN (requer TensorFlow) ---
+
+def _make_agent():
+    from train_dqn import DQNAgent
+    env = RocketEnvironment(seed=0)
+    agent = DQNAgent(env.get_state_size(), env.ACTION_SPACE_SIZE, seed=0)
+    return env, agent
+
+@benchmark("dqn.act", requires="tensorflow")
+def bench_dqn_act():
+    env, agent = _make_agent()
+    agent.epsilon = 0.0  # mede sempre a inferência
+    state = env.reset()
+    def op():
+        for _ in range(20):
+            agent.act(state)
+    return op, 20
+
+@benchmark("dqn.act_batch[256]", requires="tensorflow")
+def bench_dqn_act_batch():
+    # 256 ambientes com epsilons Ape-X; ops/s em ações por segundo
+    from src.exploration import apex_epsilons
+    env, agent = _make_agent()
+    states = np.random.default_rng(0).random((256, env.get_state_size()))
+    epsilons = apex_epsilons(256)
+    def op():
+        agent.act_batch(states, epsilons)
+    return op, 256
+
+def _replay_benchmark(batch_size):
+    def setup():
+        env, agent = _make_agent()
+        rng = np.random.default_rng(0)
+        state_size = env.get_state_size()
+        for _ in range(2000):
+            agent.remember(rng.random(state_size), int(rng.integers(env.ACTION_SPACE_SIZE)),
+                           float(rng.normal()), rng.random(state_size), bool(rng.random() < 0.01))
+        def op():
+            agent.replay(batch_size)
+        return op, 1
+    return setup
+
+for _batch_size in (32, 64, 256):
+    benchmark(f"dqn.replay[batch={_batch_size}]", requires="tensorflow")(_replay_benchmark(_batch_size))
+
+@benchmark("dqn.load_model", requires="tensorflow")
+def bench_load_model():
+    from tensorflow.keras.models import load_model
+    env, agent = _make_agent()
+    path = os.path.join(tempfile.mkdtemp(), "model.h5")
+    agent.model.save(path)
+    def op():
+        load_model(path, compile=False)
+    return op, 1
+
+# --- Renderização (pygame com driver dummy) ---
+
+def _render_benchmark(dirty_rects):
+    def setup():
+        import pygame
+        from src.rendering.rocket_sprite import RocketSpriteCache
+        from src.rendering.hud import Hud
+        from src.rendering.frame_renderer import make_renderer
+        from src.rendering.scene import draw_world
+
+        pygame.init()
+        screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+        try:
+            background = pygame.image.load(os.path.join(GAME_DIR, "src/images/Fundo.png")).convert()
+        except (FileNotFoundError, pygame.error):
+            background = pygame.Surface((config.WIDTH, config.HEIGHT))
+        background = pygame.transform.scale(background, (config.WIDTH, config.HEIGHT))
+        renderer = make_renderer(screen, background, dirty_rects=dirty_rects)
+        font = pygame.font.Font(os.path.join(GAME_DIR, "src/utils/JetBrainsMono-Regular.ttf"), 18)
+        hud = Hud(font, config.WIDTH, config.HEIGHT)
+        env = RocketEnvironment(render_mode='human', seed=0)
+        sprites = RocketSpriteCache(env.rocket_width, env.rocket_height)
+        origin = (env.rocket_initial_x, env.rocket_initial_y)
+
+        # Mesmo frame do main.py: fundo, cena, HUD e apresentação na tela
+        def op():
+            for i in range(20):
+                state, reward, done, info = env.step(1 if i % 2 else 3)
+                if done:
+                    env.reset()
+                renderer.begin_frame()
+                for rect in draw_world(screen, env, sprites):
+                    renderer.add(rect)
+                renderer.add(hud.draw(screen, env.rocket, origin, i / config.FPS))
+                renderer.present()
+        return op, 20
+    return setup
+
+benchmark("render.frame[full]", requires="pygame")(_render_benchmark(False))
+benchmark("render.frame[dirty]", requires="pygame")(_render_benchmark(True))
+
+# --- Execução ---
+
+def _available(module):
+    if module is None:
+        return True
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+def measure(op, ops_per_call, rounds, min_time):
+    """
+    Mede `op` em `rounds` rodadas de pelo menos `min_time` segundos.
+
+    Usa a melhor rodada: interferências externas (outros processos, frequência da
+    CPU) só deixam uma rodada mais lenta, nunca mais rápida.
+
+    Returns:
+        (ops/s da melhor rodada, pico de memória alocada por uma chamada em bytes)
+    """
+    # Aquecimento e calibração do número de chamadas por rodada
+    start = time.perf_counter()
+    op()
+    single = max(time.perf_counter() - start, 1e-9)
+    calls = max(1, int(min_time / single))
+
+    rates = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            op()
+        rates.append(calls * ops_per_call / (time.perf_counter() - start))
+
+    # Memória medida à parte: o tracemalloc deixa a execução mais lenta
+    tracemalloc.start()
+    for _ in range(3):
+        op()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return max(rates), peak
+
+def run(selected, rounds, min_time):
+    results = {}
+    for name, setup, requires in BENCHMARKS:
+        if selected and not any(s in name for s in selected):
+            continue
+        if not _available(requires):
+            print(f"{name:<28} pulado ({requires} não instalado)")
+            continue
+        op, ops_per_call = setup()
+        ops_per_sec, peak = measure(op, ops_per_call, rounds, min_time)
+        results[name] = {"ops_per_sec": ops_per_sec, "peak_memory_bytes": peak}
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Imprime a tabela de resultados e retorna a lista de regressões em relação ao baseline.
+    """
+    regressions = []
+    print(f"{'benchmark':<28} {'ops/s':>14} {'baseline':>14} {'razão':>7} {'memória':>10}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        line = f"{name:<28} {result['ops_per_sec']:>14,.1f}"
+        if base is None:
+            line += f" {'-':>14} {'-':>7}"
+            flag = ""
+        else:
+            ratio = result["ops_per_sec"] / base["ops_per_sec"]
+            line += f" {base['ops_per_sec']:>14,.1f} {ratio:>7.2f}"
+            flag = ""
+            if ratio < 1 - threshold:
+                flag = "  REGRESSÃO (tempo)"
+                regressions.append(name)
+            # Variações de algumas dezenas de kB são ruído (caches de texto, alocador)
+            elif result["peak_memory_bytes"] > base["peak_memory_bytes"] * (1 + threshold) + MEMORY_SLACK_BYTES:
+                flag = "  REGRESSÃO (memória)"
+                regressions.append(name)
+        line += f" {result['peak_memory_bytes'] / 1024:>8.1f}kB{flag}"
+        print(line)
+    return regressions
+
+def machine_info():
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "cpu_count": os.cpu_count(),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmarks da simulação, do treinamento e da renderização')
+    parser.add_argument('names', nargs='*', help='Roda só os benchmarks cujo nome contém um destes textos')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Arquivo JSON de baseline')
+    parser.add_argument('--save-baseline', action='store_true', help='Grava os resultados como novo baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Queda relativa tolerada antes de acusar regressão (padrão: 0.25)')
+    parser.add_argument('--rounds', type=int, default=7, help='Rodadas por benchmark (padrão: 7)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Duração mínima de cada rodada em segundos')
+    parser.add_argument('--output', default=None, help='Grava os resultados em JSON neste arquivo')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results = run(args.names, args.rounds, args.min_time)
+    regressions = compare(results, baseline, args.threshold)
+
+    report = {"machine": machine_info(), "results": results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        # Preserva as entradas de benchmarks que não rodaram (ex.: TensorFlow ausente)
+        merged = dict(baseline)
+        merged.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump({"machine": machine_info(), "results": merged}, f, indent=2)
+        print(f"Baseline gravado em {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} regressões acima de {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
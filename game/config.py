@@ -11,6 +11,8 @@ WIDTH = 1600
 HEIGHT = 900
 FPS = 60
 PIXELS_PER_METER = 100
+MAX_PHYSICS_STEPS_PER_FRAME = 5   # limite de passos de física por frame renderizado
+MAX_RENDER_FPS = 0                # limite da taxa de renderização (0 = sem limite)
 
 # Parâmetros do HUD e renderização
 ARROW_SCALE = 0.2
@@ -19,6 +21,8 @@ ARROW_HEAD_ANGLE = 30
 MIN_VELOCITY_DISPLAY = 5
 MAX_ARROW_LENGTH = 50
 BLINK_INTERVAL = 0.3
+DIRTY_RECTS = False               # renderização por retângulos sujos nos front-ends pygame
+SPRITE_ANGLE_RESOLUTION = 1.0     # resolução angular do cache de sprites do foguete (graus)
 
 # Outros parâmetros
 LANDING_SPEED_THRESHOLD = 200     # Aumentado de 50 para 200 para ser mais tolerante
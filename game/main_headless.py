@@ -1,118 +1,159 @@
 import os
-# Força o modo headless definindo o driver dummy para o SDL
-os.environ["SDL_VIDEODRIVER"] = "dummy"
-
 import sys
+import time
+import argparse
+import multiprocessing
+import numpy as np
+
+# Garantir que o diretório atual está no path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Somente o ambiente e as políticas: nenhum import do pygame neste script
+from src.environment import RocketEnvironment
+from src.policies import make_policy
 import config
-import pygame
-import math
-import random
-from src.entities.rocket import Rocket
-from src.entities.platform import Platform
-from src.entities.target import Target
-
-# Configurações da tela e simulação a partir do config.py
-WIDTH, HEIGHT = config.WIDTH, config.HEIGHT  # Corrigido para usar config.HEIGHT
-FPS = config.FPS
-PIXELS_PER_METER = config.PIXELS_PER_METER
-
-pygame.init()
-# Em modo headless, criamos uma superfície em vez de uma janela real
-screen = pygame.Surface((WIDTH, HEIGHT))
-clock = pygame.time.Clock()
-
-# Cria uma superfície de fundo (preta, por exemplo)
-background = pygame.Surface((WIDTH, HEIGHT))
-background.fill((0, 0, 0))
-
-# Detecta o caminho base do projeto
-base_path = os.path.dirname(os.path.abspath(__file__))
-
-# Carrega as fontes (opcional, para debug/log)
-font_path = os.path.join(base_path, "src/utils/JetBrainsMono-Regular.ttf")
-splash_font = pygame.font.Font(font_path, 60)
-small_font = pygame.font.Font(font_path, 18)
-crash_font = pygame.font.Font(font_path, 48)
-
-# Informações (opcionais)
-version_text = "0.9.0"
-quit_text = "Press ESC to quit"
-
-# Criação dos objetos do jogo
-# Plataformas
-initial_platform = Platform(posicao_x=100, comprimento=200, altura=0)
-landing_platform = Platform(posicao_x=WIDTH - 200 - 100, comprimento=200, altura=0)
-
-# Foguete (iniciado na plataforma inicial)
-rocket_width, rocket_height = 20, 40
-rocket_initial_x = initial_platform.posicao[0] + initial_platform.comprimento / 2
-rocket_initial_y = rocket_height / 2
-foguete = Rocket(posicao_x=rocket_initial_x, posicao_y=rocket_initial_y, massa=50)
-
-# Target: posição fixa em (5m, 5m) e tamanho pequeno (30 pixels de diâmetro)
-TARGET_DIAMETER = 30
-target = Target(
-    5 * PIXELS_PER_METER,
-    5 * PIXELS_PER_METER,
-    TARGET_DIAMETER,
-    TARGET_DIAMETER
-)
-
-landed_message_timer = None
-
-running = True
-while running:
-    delta_time = clock.tick(FPS) / 1000.0
-
-    # Atualiza a simulação: física e métricas
-    foguete.atualizar(delta_time)
-    foguete.compute_metrics(target, landing_platform)
-
-    # Aqui você pode definir as ações da IA ou simular uma política automática.
-    # Por exemplo, se não houver intervenção, o foguete seguirá apenas a física atual.
-    # Se desejar, insira comandos de controle para teste (ex.: alterar potência ou torque).
-
-    # Verifica se o foguete capturou o target
-    if not foguete.target_reached:
-        dx = foguete.posicao[0] - target.posicao[0]
-        dy = foguete.posicao[1] - target.posicao[1]
-        if math.sqrt(dx**2 + dy**2) <= target.altura / 2:
-            foguete.target_reached = True
-
-    # Verifica as condições de pouso ou crash
-    rocket_half_height = rocket_height / 2
-    if foguete.posicao[1] <= rocket_half_height and foguete.velocidade[1] <= 0:
-        landing_speed = math.sqrt(foguete.velocidade[0]**2 + foguete.velocidade[1]**2)
-        on_initial = (initial_platform.posicao[0] <= foguete.posicao[0] <= initial_platform.posicao[0] + initial_platform.comprimento)
-        on_landing = (landing_platform.posicao[0] <= foguete.posicao[0] <= landing_platform.posicao[0] + landing_platform.comprimento)
-        if landing_speed > config.LANDING_SPEED_THRESHOLD:
-            foguete.crashed = True
+
+OUTCOMES = ('landed', 'crashed', 'timeout')
+
+# Orçamento de latência do controlador: um passo de física (1/60 s)
+FRAME_BUDGET = 1.0 / config.FPS
+
+# Política de cada processo worker, criada uma única vez (carregar um modelo é caro)
+_worker_policy = None
+_worker_policy_spec = None
+
+def run_episodes(policy_spec, seed_sequence, episodes, max_steps):
+    """
+    Executa `episodes` episódios com a política dada e devolve as estatísticas.
+
+    Args:
+        policy_spec: Especificação da política (ver make_policy)
+        seed_sequence: numpy.random.SeedSequence deste lote de episódios; dela derivam
+                       fluxos independentes para a política e para o ambiente
+        episodes: Número de episódios
+        max_steps: Limite de passos por episódio
+
+    Returns:
+        Dicionário com passos, recompensas, resultados, latências de cada
+        chamada de policy.act() e tempo gasto
+    """
+    global _worker_policy, _worker_policy_spec
+    policy_seed, env_seed = seed_sequence.spawn(2)
+    rng = np.random.default_rng(policy_seed)
+    if _worker_policy is None or _worker_policy_spec != policy_spec:
+        _worker_policy = make_policy(policy_spec, rng, RocketEnvironment.ACTION_SPACE_SIZE)
+        _worker_policy_spec = policy_spec
+    elif hasattr(_worker_policy, 'rng'):
+        _worker_policy.rng = rng
+    policy = _worker_policy
+
+    env = RocketEnvironment(seed=int(env_seed.generate_state(1)[0]))
+    env.max_steps = max_steps
+
+    steps = np.zeros(episodes, dtype=np.int64)
+    rewards = np.zeros(episodes)
+    outcomes = []
+    target_reached = np.zeros(episodes, dtype=bool)
+    latencies = []
+
+    start_time = time.perf_counter()
+    for e in range(episodes):
+        state = env.reset()
+        # Políticas com memória entre ticks (ex.: o plano do MPC) recomeçam a cada episódio
+        if hasattr(policy, 'reset'):
+            policy.reset()
+        total_reward = 0.0
+        done = False
+        info = {}
+        while not done:
+            tick_start = time.perf_counter()
+            action = policy.act(state)
+            latencies.append(time.perf_counter() - tick_start)
+            state, reward, done, info = env.step(action)
+            total_reward += reward
+
+        if info.get("status") == "timeout":
+            outcomes.append('timeout')
+        elif env.rocket.crashed:
+            outcomes.append('crashed')
         else:
-            if on_initial or on_landing:
-                foguete.posicao[1] = rocket_half_height
-                if foguete.potencia_motor == 0:
-                    foguete.velocidade = [0, 0]
-                    foguete.angular_velocity = 0
-                else:
-                    foguete.velocidade[1] = 0
-                    foguete.angular_velocity = 0
-                # Modificação: Considera como "landed" se estiver na plataforma de pouso,
-                # independente de ter pegado o target
-                if on_landing:
-                    foguete.landed = True
-                    # Opcionalmente, registro do resultado
-                    print(f"Pouso realizado! Target atingido: {foguete.target_reached}")
-            else:
-                foguete.crashed = True
-
-    # Em modo headless não há renderização. Você pode registrar o estado atual para debug:
-    # Exemplo: print(f"Estado: {foguete.get_state()}")
-    # Ou salvar logs em arquivo para análise.
-
-    # Para finalizar o loop automaticamente, podemos encerrar se ocorrer pouso ou crash.
-    if foguete.landed or foguete.crashed:
-        running = False
-
-pygame.quit()
+            outcomes.append('landed')
+        steps[e] = env.total_steps
+        rewards[e] = total_reward
+        target_reached[e] = env.rocket.target_reached
+
+    return {
+        "steps": steps,
+        "rewards": rewards,
+        "outcomes": outcomes,
+        "target_reached": target_reached,
+        "latencies": np.array(latencies),
+        "elapsed": time.perf_counter() - start_time,
+    }
+
+def _run_chunk(args):
+    return run_episodes(*args)
+
+def split_episodes(episodes, chunk_size):
+    """Divide `episodes` em lotes de no máximo `chunk_size` episódios."""
+    return [min(chunk_size, episodes - start) for start in range(0, episodes, chunk_size)]
+
+def run_batch(policy_spec, episodes, workers=1, max_steps=2000, seed=None, chunk_size=25):
+    """
+    Distribui os episódios entre processos worker e agrega os resultados.
+
+    Cada lote recebe uma SeedSequence independente derivada de `seed`; como o
+    tamanho dos lotes é fixo, o resultado não depende do número de workers.
+    """
+    sizes = split_episodes(episodes, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(policy_spec, s, n, max_steps) for s, n in zip(seeds, sizes)]
+
+    if workers <= 1:
+        results = [_run_chunk(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(_run_chunk, tasks)
+
+    return {
+        "steps": np.concatenate([r["steps"] for r in results]),
+        "rewards": np.concatenate([r["rewards"] for r in results]),
+        "outcomes": [o for r in results for o in r["outcomes"]],
+        "target_reached": np.concatenate([r["target_reached"] for r in results]),
+        "latencies": np.concatenate([r["latencies"] for r in results]),
+        "worker_time": sum(r["elapsed"] for r in results),
+    }
+
+def print_report(stats, elapsed):
+    episodes = len(stats["outcomes"])
+    total_steps = int(stats["steps"].sum())
+    print(f"Episódios: {episodes}, passos: {total_steps}, tempo: {elapsed:.2f} s")
+    print(f"Throughput: {total_steps / elapsed:,.0f} passos/s "
+          f"({total_steps / stats['worker_time']:,.0f} passos/s por worker)")
+    for outcome in OUTCOMES:
+        count = stats["outcomes"].count(outcome)
+        print(f"  {outcome:<8} {count:>7} ({100 * count / episodes:5.1f}%)")
+    reached = int(stats["target_reached"].sum())
+    print(f"  target   {reached:>7} ({100 * reached / episodes:5.1f}%)")
+    print(f"Recompensa média: {stats['rewards'].mean():.2f} (desvio {stats['rewards'].std():.2f}), "
+          f"passos médios: {stats['steps'].mean():.1f}")
+    latencies = stats["latencies"] * 1000
+    over_budget = (stats["latencies"] > FRAME_BUDGET).mean()
+    print(f"Latência do controlador: média {latencies.mean():.3f} ms, p99 {np.percentile(latencies, 99):.3f} ms, "
+          f"máx {latencies.max():.3f} ms; {100 * over_budget:.2f}% dos ticks acima de "
+          f"{FRAME_BUDGET * 1000:.1f} ms (1/{config.FPS} s)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Executa episódios em lote, sem renderização')
+    parser.add_argument('--policy', default='random',
+                        help="Política: random, scripted, mpc[:opção=valor,...] ou model:<arquivo.h5> (padrão: random)")
+    parser.add_argument('--episodes', type=int, default=1000, help='Número de episódios (padrão: 1000)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Número de processos (padrão: número de CPUs)')
+    parser.add_argument('--max-steps', type=int, default=2000, help='Limite de passos por episódio (padrão: 2000)')
+    parser.add_argument('--seed', type=int, default=None, help='Semente para reprodutibilidade')
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    stats = run_batch(args.policy, args.episodes, args.workers, args.max_steps, args.seed)
+    print_report(stats, time.perf_counter() - start_time)
@@ -6,19 +6,42 @@ import tensorflow as tf
 from tensorflow.keras.models import load_model
 from tensorflow.keras.losses import MeanSquaredError
 import math
+import argparse
 
 # Garantir que o diretório atual está no path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.environment import RocketEnvironment
+from src.rendering.rocket_sprite import RocketSpriteCache
+from src.rendering.frame_renderer import make_renderer
+from src.rendering.scene import draw_world
+from src.trajectory import TrajectoryWriter
 import config
 
-def play_with_trained_agent(model_path):
+MAX_STEPS_PER_FRAME = 1024
+# Em modo sem limite de FPS, quantos passos rodar entre verificações de eventos
+# quando só o fim do episódio é renderizado
+EVENT_POLL_STEPS = 500
+
+def play_with_trained_agent(model_path, dirty_rects=config.DIRTY_RECTS, steps_per_frame=1,
+                            uncapped=False, render_every=1, render_episode_end_only=False,
+                            done_pause=2.0, record_path=None):
     """
     Carrega um modelo treinado e o utiliza para jogar o jogo.
     
+    Teclas: +/- (ou seta para cima/baixo) dobram/dividem os passos por frame,
+    U alterna o modo sem limite de FPS, E alterna renderizar só o fim do episódio,
+    P liga/desliga a pausa ao fim do episódio, R reinicia, ESC sai.
+    
     Args:
         model_path: Caminho para o arquivo do modelo (.h5)
+        dirty_rects: Atualiza apenas as regiões da tela que mudaram
+        steps_per_frame: Passos de simulação por frame renderizado
+        uncapped: Roda sem limite de FPS, renderizando a cada `render_every` passos
+        render_every: Passos entre renderizações no modo sem limite de FPS
+        render_episode_end_only: No modo sem limite de FPS, renderiza só o fim de cada episódio
+        done_pause: Pausa (s) ao fim de cada episódio; 0 desativa
+        record_path: Arquivo (.rktj) onde gravar as trajetórias jogadas (opcional)
     """
     # Configurações do jogo
     WIDTH, HEIGHT = config.WIDTH, config.HEIGHT
@@ -64,6 +87,7 @@ def play_with_trained_agent(model_path):
         background = pygame.Surface((WIDTH, HEIGHT))
         background.fill((0, 0, 0))
     background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+    renderer = make_renderer(screen, background, dirty_rects=dirty_rects)
     
     # Carrega fontes
     font_path = os.path.join(base_path, "src/utils/JetBrainsMono-Regular.ttf")
@@ -73,22 +97,28 @@ def play_with_trained_agent(model_path):
     env = RocketEnvironment(render_mode='human')
     state = env.reset()
     
+    recorder = None
+    if record_path:
+        recorder = TrajectoryWriter(record_path)
+        recorder.begin_episode(env, metadata={"source": "play_trained_agent", "model": model_path})
+    
     # Variáveis para desenho do foguete
     rocket_width, rocket_height = env.rocket_width, env.rocket_height
     
-    def draw_rocket(surface, rocket):
-        rocket_surf = pygame.Surface((rocket_width, rocket_height), pygame.SRCALPHA)
-        body_rect = pygame.Rect(0, 10, rocket_width, rocket_height - 10)
-        pygame.draw.rect(rocket_surf, (200, 0, 0), body_rect)
-        pygame.draw.polygon(rocket_surf, (255, 0, 0), [(0, 10), (rocket_width, 10), (rocket_width/2, 0)])
-        pygame.draw.polygon(rocket_surf, (150, 150, 150), [(0, rocket_height), (5, rocket_height - 10), (0, rocket_height - 10)])
-        pygame.draw.polygon(rocket_surf, (150, 150, 150), [(rocket_width, rocket_height), (rocket_width - 5, rocket_height - 10), (rocket_width, rocket_height - 10)])
-        rotated_surf = pygame.transform.rotate(rocket_surf, (rocket.orientacao - 90))
-        rotated_rect = rotated_surf.get_rect(center=(int(rocket.posicao[0]), HEIGHT - int(rocket.posicao[1])))
-        surface.blit(rotated_surf, rotated_rect.topleft)
+    rocket_sprites = RocketSpriteCache(rocket_width, rocket_height)
+    
+    def select_action(state):
+        # Chamada direta do modelo: evita o custo fixo do predict() a cada passo.
+        # Os passos de um único ambiente dependem uns dos outros, então não há
+        # como agrupar as inferências entre frames em um lote.
+        q_values = model(state.reshape(1, -1), training=False)
+        return int(np.argmax(q_values[0]))
     
     running = True
     step_counter = 0
+    action = 0
+    reward = 0.0
+    pause_enabled = done_pause > 0
     
     # Loop principal
     while running:
@@ -99,81 +129,125 @@ def play_with_trained_agent(model_path):
                 if event.key == pygame.K_ESCAPE:
                     running = False
                 if event.key == pygame.K_r:
+                    if recorder is not None:
+                        recorder.end_episode(env, status="reset")
                     state = env.reset()
                     step_counter = 0
+                    if recorder is not None:
+                        recorder.begin_episode(env, metadata={"source": "play_trained_agent", "model": model_path})
+                if event.key in (pygame.K_UP, pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    steps_per_frame = min(MAX_STEPS_PER_FRAME, steps_per_frame * 2)
+                    render_every = min(MAX_STEPS_PER_FRAME, render_every * 2)
+                if event.key in (pygame.K_DOWN, pygame.K_MINUS, pygame.K_KP_MINUS):
+                    steps_per_frame = max(1, steps_per_frame // 2)
+                    render_every = max(1, render_every // 2)
+                if event.key == pygame.K_u:
+                    uncapped = not uncapped
+                if event.key == pygame.K_e:
+                    render_episode_end_only = not render_episode_end_only
+                if event.key == pygame.K_p:
+                    pause_enabled = not pause_enabled
         
-        # Determina a ação usando o modelo treinado
-        action = np.argmax(model.predict(state.reshape(1, -1), verbose=0)[0])
+        # Quantos passos de simulação rodar antes da próxima renderização
+        if not uncapped:
+            steps_this_frame = steps_per_frame
+        elif render_episode_end_only:
+            steps_this_frame = EVENT_POLL_STEPS
+        else:
+            steps_this_frame = render_every
         
-        # Executa a ação no ambiente
-        next_state, reward, done, info = env.step(action)
-        state = next_state
-        step_counter += 1
+        done = False
+        for _ in range(steps_this_frame):
+            # Determina a ação usando o modelo treinado e executa no ambiente
+            action = select_action(state)
+            if recorder is not None:
+                state, reward, done, info = recorder.step(env, action)
+            else:
+                state, reward, done, info = env.step(action)
+            step_counter += 1
+            if done:
+                break
         
-        # Renderização
-        screen.blit(background, (0, 0))
+        if uncapped and render_episode_end_only and not done:
+            continue
         
-        # Desenha plataformas
-        initial_platform = env.initial_platform
-        landing_platform = env.landing_platform
-        pygame.draw.rect(screen, (100, 100, 100), 
-                        (initial_platform.posicao[0], HEIGHT - 10, 
-                        initial_platform.comprimento, 10))
-        pygame.draw.rect(screen, (100, 100, 100), 
-                        (landing_platform.posicao[0], HEIGHT - 10, 
-                        landing_platform.comprimento, 10))
+        # Renderização
+        renderer.begin_frame()
         
-        # Desenha target se ainda não foi alcançado
-        target = env.target
+        # Desenha plataformas, target (se ainda não foi alcançado) e foguete
         foguete = env.rocket
-        if not foguete.target_reached:
-            pygame.draw.circle(
-                screen,
-                (255, 0, 0),
-                (int(target.posicao[0]), HEIGHT - int(target.posicao[1])),
-                int(target.altura / 2),
-                4
-            )
-        
-        # Desenha o foguete
-        if not foguete.crashed:
-            draw_rocket(screen, foguete)
+        for rect in draw_world(screen, env, rocket_sprites):
+            renderer.add(rect)
         
         # Exibe informações
+        if uncapped:
+            speed_text = "Turbo: fim do episódio" if render_episode_end_only else f"Turbo: 1 frame a cada {render_every} passos"
+        else:
+            speed_text = f"Velocidade: x{steps_per_frame}"
         info_text = font.render(
-            f"Action: {action} | Reward: {reward:.2f} | Steps: {step_counter}", 
+            f"Action: {action} | Reward: {reward:.2f} | Steps: {step_counter} | {speed_text}", 
             True, (255, 255, 255)
         )
-        screen.blit(info_text, (10, 10))
+        renderer.add(screen.blit(info_text, (10, 10)))
         
         # Exibe mensagens de estado
         if foguete.landed:
             msg = font.render("Missão cumprida! Pouso perfeito!", True, (0, 255, 0))
-            screen.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2))
+            renderer.add(screen.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2)))
         elif foguete.crashed:
             msg = font.render("Foguete destruído!", True, (255, 0, 0))
-            screen.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2))
+            renderer.add(screen.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2)))
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        renderer.present()
+        if not uncapped:
+            clock.tick(FPS)
         
         # Reinicia se terminou
         if done:
-            pygame.time.wait(2000)  # Pausa por 2 segundos
+            if pause_enabled:
+                pygame.time.wait(int(done_pause * 1000))
+            if recorder is not None:
+                recorder.end_episode(env)
             state = env.reset()
             step_counter = 0
+            if recorder is not None:
+                recorder.begin_episode(env, metadata={"source": "play_trained_agent", "model": model_path})
     
+    if recorder is not None:
+        recorder.close(env)
+        print(f"Trajetórias gravadas em {record_path} ({recorder.episodes_written} episódios)")
+    print(f"Tempo médio de renderização ({renderer.name}): {renderer.average_frame_time() * 1000:.2f} ms/frame")
     pygame.quit()
 
 if __name__ == "__main__":
-    # Verifica se foi fornecido um caminho para o modelo
-    if len(sys.argv) > 1:
-        model_path = sys.argv[1]
-    else:
-        model_path = "dqn_model_final.h5"  # Usa o modelo final por padrão
+    parser = argparse.ArgumentParser(description='Executa um agente DQN treinado')
+    # Usa o modelo final por padrão
+    parser.add_argument('model_path', nargs='?', default="dqn_model_final.h5", help='Caminho do modelo (.h5)')
+    parser.add_argument('--dirty-rects', action='store_true', default=config.DIRTY_RECTS,
+                        help='Atualiza apenas as regiões da tela que mudaram')
+    parser.add_argument('--speed', type=int, default=1, help='Passos de simulação por frame (padrão: 1)')
+    parser.add_argument('--uncapped', action='store_true', help='Roda sem limite de FPS')
+    parser.add_argument('--render-every', type=int, default=10,
+                        help='Passos entre renderizações no modo sem limite de FPS (padrão: 10)')
+    parser.add_argument('--render-episode-end', action='store_true',
+                        help='No modo sem limite de FPS, renderiza só o fim de cada episódio')
+    parser.add_argument('--done-pause', type=float, default=2.0,
+                        help='Pausa (s) ao fim de cada episódio, 0 desativa (padrão: 2)')
+    parser.add_argument('--record', default=None, help='Grava as trajetórias jogadas neste arquivo (.rktj)')
+    args = parser.parse_args()
+    model_path = args.model_path
     
     if not os.path.exists(model_path):
         print(f"Erro: Modelo não encontrado em {model_path}")
         sys.exit(1)
     
-    play_with_trained_agent(model_path)
+    play_with_trained_agent(
+        model_path,
+        dirty_rects=args.dirty_rects,
+        steps_per_frame=args.speed,
+        uncapped=args.uncapped,
+        render_every=args.render_every,
+        render_episode_end_only=args.render_episode_end,
+        done_pause=args.done_pause,
+        record_path=args.record
+    )
@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Garantir que o diretório atual está no path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.environment import RocketEnvironment
+from src.frame_recorder import record_episodes
+
+def parse_episode_list(text):
+    """Converte '0,3,5-7' em {0, 3, 5, 6, 7}."""
+    episodes = set()
+    for part in text.split(','):
+        if '-' in part:
+            start, end = part.split('-')
+            episodes.update(range(int(start), int(end) + 1))
+        elif part:
+            episodes.add(int(part))
+    return episodes
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Grava episódios de avaliação sem display')
+    parser.add_argument('--model', default=None, help='Modelo treinado (.h5); sem modelo usa ações aleatórias')
+    parser.add_argument('--episodes', type=int, default=10, help='Número de episódios a executar (padrão: 10)')
+    parser.add_argument('--record', default=None, help='Episódios a gravar, ex.: 0,3,5-7 (padrão: todos)')
+    parser.add_argument('--frame-skip', type=int, default=1, help='Grava um frame a cada N passos (padrão: 1)')
+    parser.add_argument('--output', default='episodes.rktf', help='Arquivo de saída (padrão: episodes.rktf)')
+    parser.add_argument('--seed', type=int, default=None, help='Semente para reprodutibilidade')
+    args = parser.parse_args()
+
+    policy_seed, env_seed = np.random.SeedSequence(args.seed).spawn(2)
+    if args.model:
+        from tensorflow.keras.models import load_model
+        model = load_model(args.model, compile=False)
+        select_action = lambda state: int(np.argmax(model(state.reshape(1, -1), training=False)[0]))
+    else:
+        rng = np.random.default_rng(policy_seed)
+        select_action = lambda state: int(rng.integers(RocketEnvironment.ACTION_SPACE_SIZE))
+
+    env = RocketEnvironment(render_mode='rgb_array', seed=int(env_seed.generate_state(1)[0]))
+    record = parse_episode_list(args.record) if args.record else None
+
+    start_time = time.time()
+    scores = record_episodes(env, select_action, args.output, args.episodes, record=record, frame_skip=args.frame_skip)
+    elapsed = time.time() - start_time
+
+    for e, score in enumerate(scores):
+        print(f"Episode: {e+1}/{args.episodes}, Score: {score:.2f}")
+    print(f"Gravação salva em {args.output} ({os.path.getsize(args.output) / 1e6:.1f} MB) em {elapsed:.2f} segundos.")
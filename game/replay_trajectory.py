@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Garantir que o diretório atual está no path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.environment import RocketEnvironment
+from src.course import Course
+from src.trajectory import read_trajectories, replay, seek, environment_config
+
+def make_environment(trajectory):
+    """Cria um ambiente com a configuração gravada no episódio."""
+    cfg = trajectory.config
+    # Gravações anteriores ao dt/action_repeat/ccd/adaptive e ao percurso usam os valores padrão
+    course = Course.from_config(cfg["course"]) if "course" in cfg else None
+    env = RocketEnvironment(width=cfg["width"], height=cfg["height"], seed=trajectory.seed, course=course,
+                            dt=cfg.get("dt", 1.0 / cfg["fps"]), action_repeat=cfg.get("action_repeat", 1),
+                            ccd=cfg.get("ccd", False), adaptive=cfg.get("adaptive", False))
+    env.max_steps = cfg["max_steps"]
+    # Avisa se a física atual difere da usada na gravação (o replay deixaria de ser exato)
+    current = environment_config(env)
+    changed = [key for key, value in cfg.items() if current.get(key) != value]
+    if changed:
+        print(f"Aviso: configuração diferente da gravação: {', '.join(changed)}")
+    env.reset()
+    return env
+
+def verify_episode(trajectory):
+    """
+    Re-simula o episódio inteiro e confere o estado final e a recompensa gravados.
+
+    Returns:
+        (ok, passos simulados, tempo em segundos)
+    """
+    env = make_environment(trajectory)
+    start_time = time.perf_counter()
+    total_reward = replay(env, trajectory)
+    elapsed = time.perf_counter() - start_time
+
+    ok = True
+    if trajectory.snapshot_steps[-1] == len(trajectory):
+        ok = np.array_equal(env.snapshot(), trajectory.snapshots[-1])
+    if trajectory.end is not None:
+        ok = ok and total_reward == trajectory.end["reward"]
+    return ok, len(trajectory), elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Re-simula episódios gravados em um arquivo de trajetórias')
+    parser.add_argument('path', help='Arquivo de trajetórias (.rktj)')
+    parser.add_argument('--list', action='store_true', help='Lista os episódios do arquivo')
+    parser.add_argument('--episode', type=int, default=None, help='Episódio a re-simular (padrão: todos)')
+    parser.add_argument('--seek', type=int, default=None, help='Mostra o estado do episódio neste passo')
+    args = parser.parse_args()
+
+    trajectories = read_trajectories(args.path)
+    print(f"{len(trajectories)} episódios em {args.path} ({os.path.getsize(args.path) / 1e3:.1f} kB)")
+
+    if args.list:
+        for i, trajectory in enumerate(trajectories):
+            end = trajectory.end or {}
+            reward = end.get("reward")
+            reward_text = f"{reward:.2f}" if reward is not None else "-"
+            print(f"  {i:>5}: {len(trajectory):>6} passos, status: {end.get('status', 'incompleto')}, "
+                  f"recompensa: {reward_text}, snapshots: {len(trajectory.snapshot_steps)}, "
+                  f"seed: {trajectory.seed}, {trajectory.metadata}")
+        sys.exit(0)
+
+    if args.seek is not None:
+        trajectory = trajectories[args.episode or 0]
+        env = make_environment(trajectory)
+        start_time = time.perf_counter()
+        seek(env, trajectory, args.seek)
+        elapsed = time.perf_counter() - start_time
+        state = env.rocket.get_state()
+        print(f"Passo {env.total_steps} ({elapsed * 1000:.2f} ms):")
+        for key, value in state.items():
+            print(f"  {key}: {value}")
+        sys.exit(0)
+
+    selected = range(len(trajectories)) if args.episode is None else [args.episode]
+    total_steps = 0
+    total_time = 0.0
+    failures = 0
+    for i in selected:
+        ok, steps, elapsed = verify_episode(trajectories[i])
+        total_steps += steps
+        total_time += elapsed
+        if not ok:
+            failures += 1
+            print(f"Episódio {i}: replay diverge da gravação")
+    print(f"Re-simulados {len(selected)} episódios, {total_steps} passos em {total_time:.2f} s "
+          f"({total_steps / max(total_time, 1e-9):,.0f} passos/s), divergências: {failures}")
@@ -0,0 +1,67 @@
+import math
+import sys
+import os
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+# Passo adaptativo do RocketEnvironment.
+#
+# Com potência e orientação constantes, um passo de Euler semi-implícito de
+# Rocket.update_physics é linear na velocidade:
+#     v_j = r v_(j-1) + a dt,   x_j = x_(j-1) + v_j dt,   r = 1 - k dt
+# (k = DRAG_COEFFICIENT / massa, `a` = empuxo + gravidade). A soma de `m` passos
+# é uma série geométrica:
+#     v_m = v∞ + (v0 - v∞) r^m,   x_m = x0 + dt (m v∞ + (v0 - v∞) r (1 - r^m) / (1 - r))
+# com v∞ = a / k. Assim `m` passos base saem numa conta só, idênticos aos passos
+# um a um (a menos de arredondamento). A potência e a orientação mudam de um
+# passo base para o outro com as ações; no passo grande elas entram pela média
+# (potência) e pelo valor no meio do passo (orientação), e a orientação e a
+# velocidade angular finais são exatas. O erro vem só dessas médias, por isso
+# os passos grandes só são dados longe do chão e do target e com pouca rotação.
+
+def coast(x, y, vx, vy, ax, ay, massa, dt, steps):
+    """
+    Estado depois de `steps` passos de física de duração `dt` com aceleração
+    (ax, ay) constante (sem o arrasto). Aceita escalares ou arrays.
+
+    Returns:
+        (x, y, vx, vy)
+    """
+    k = config.DRAG_COEFFICIENT / massa
+    r = 1.0 - k * dt
+    decay = r ** steps
+    terminal_x = ax / k
+    terminal_y = ay / k
+    weight = r * (1.0 - decay) / (1.0 - r)
+    x = x + dt * (steps * terminal_x + (vx - terminal_x) * weight)
+    y = y + dt * (steps * terminal_y + (vy - terminal_y) * weight)
+    vx = terminal_x + (vx - terminal_x) * decay
+    vy = terminal_y + (vy - terminal_y) * decay
+    return x, y, vx, vy
+
+def reach(speed, max_acceleration, duration):
+    """Distância máxima percorrida em `duration` partindo com `speed` (pixels)."""
+    return speed * duration + 0.5 * max_acceleration * duration * duration
+
+def rotation(angular_velocity, angular_acceleration, duration):
+    """Rotação máxima (graus) em `duration` com aceleração angular de módulo `angular_acceleration`."""
+    return abs(angular_velocity) * duration + 0.5 * angular_acceleration * duration * duration
+
+def power_sum(power, increment, steps):
+    """
+    Soma das potências dos `steps` passos em que a potência muda de `increment`
+    antes de cada passo (limitada a 0..100, como em Rocket.alterar_potencia).
+
+    Returns:
+        (soma das potências, potência final)
+    """
+    if increment == 0:
+        return power * steps, power
+    limit = 100 if increment > 0 else 0
+    # Passos que ainda mudam a potência antes de ela parar no limite
+    ramp = min(steps, max(0, math.floor((limit - power) / increment)))
+    total = ramp * power + increment * ramp * (ramp + 1) // 2 + limit * (steps - ramp)
+    final = power + increment * ramp if ramp == steps else limit
+    return total, final
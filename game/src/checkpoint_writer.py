@@ -0,0 +1,152 @@
+import os
+import queue
+import threading
+
+class CheckpointWriter:
+    """
+    Grava checkpoints e gráficos do treinamento numa thread em segundo plano.
+
+    O loop de treinamento só copia os pesos (model.get_weights() já devolve
+    cópias) e as métricas, e enfileira a gravação; a serialização, o gráfico e o
+    disco ficam fora do caminho crítico. Cada arquivo é escrito num temporário e
+    renomeado no fim, então um arquivo com o nome final está sempre completo. Dos
+    checkpoints periódicos ficam os `keep_last` mais recentes e o de melhor
+    pontuação.
+    """
+
+    def __init__(self, output_dir, save_weights, keep_last=3):
+        """
+        Args:
+            output_dir: Diretório dos arquivos
+            save_weights: Função (pesos, caminho) que grava um modelo com os pesos dados;
+                          chamada só pela thread de gravação
+            keep_last: Checkpoints periódicos mantidos, além do melhor (None = todos)
+        """
+        self.output_dir = output_dir
+        self.save_weights = save_weights
+        self.keep_last = keep_last
+        # Checkpoints periódicos gravados: (episódio, pontuação, caminho)
+        self.checkpoints = []
+        self.error = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                if self.error is None:
+                    job()
+            except Exception as error:
+                # Repassado na próxima chamada da thread de treinamento (save_*,
+                # flush ou close); até lá, as gravações enfileiradas são descartadas
+                self.error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        """Repassa (uma vez) o erro de uma gravação que falhou."""
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _write_atomic(self, path, write):
+        """Chama write(caminho temporário) e renomeia o resultado para `path`."""
+        root, ext = os.path.splitext(path)
+        temp_path = f"{root}.tmp{ext}"
+        try:
+            write(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def save_checkpoint(self, episode, weights, score):
+        """
+        Enfileira o checkpoint periódico dqn_model_ep<episódio>.h5.
+
+        A lista de pesos é copiada, os arrays não: passe cópias (model.get_weights()).
+        Se uma gravação anterior falhou, o erro é repassado aqui.
+        """
+        self._raise_error()
+        weights = list(weights)
+        path = os.path.join(self.output_dir, f"dqn_model_ep{episode}.h5")
+
+        def job():
+            self._write_atomic(path, lambda temp_path: self.save_weights(weights, temp_path))
+            self.checkpoints.append((episode, score, path))
+            self._apply_retention()
+        self._queue.put(job)
+
+    def save_final(self, weights):
+        """Enfileira o modelo final dqn_model_final.h5 (fora da política de retenção)."""
+        self._raise_error()
+        path = os.path.join(self.output_dir, "dqn_model_final.h5")
+        weights = list(weights)
+        self._queue.put(lambda: self._write_atomic(path, lambda temp_path: self.save_weights(weights, temp_path)))
+
+    def save_plot(self, episode, scores, avg_scores, epsilons):
+        """Enfileira o gráfico training_progress_ep<episódio>.png (as listas são copiadas)."""
+        self._raise_error()
+        path = os.path.join(self.output_dir, f"training_progress_ep{episode}.png")
+        scores, avg_scores, epsilons = list(scores), list(avg_scores), list(epsilons)
+        self._queue.put(lambda: self._write_atomic(
+            path, lambda temp_path: plot_training_progress(temp_path, scores, avg_scores, epsilons)))
+
+    def _apply_retention(self):
+        """Apaga os checkpoints periódicos que não estão entre os últimos `keep_last` nem são o melhor."""
+        if self.keep_last is None:
+            return
+        best = max(self.checkpoints, key=lambda checkpoint: checkpoint[1])
+        recent = self.checkpoints[-self.keep_last:] if self.keep_last > 0 else []
+        kept = []
+        for checkpoint in self.checkpoints:
+            if checkpoint is best or checkpoint in recent:
+                kept.append(checkpoint)
+            elif os.path.exists(checkpoint[2]):
+                os.remove(checkpoint[2])
+        self.checkpoints = kept
+
+    def flush(self):
+        """Espera as gravações pendentes; repassa o erro de uma gravação que falhou."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Grava o que está pendente e encerra a thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+def plot_training_progress(path, scores, avg_scores, epsilons):
+    """
+    Salva o gráfico de recompensas e epsilon por episódio.
+
+    Usa a API orientada a objetos do matplotlib com o backend Agg, que não
+    depende do estado global do pyplot e pode rodar fora da thread principal.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=(12, 5))
+    FigureCanvasAgg(figure)
+
+    rewards_axes = figure.add_subplot(1, 2, 1)
+    rewards_axes.plot(scores)
+    rewards_axes.plot(avg_scores)
+    rewards_axes.set_title('Recompensas por Episódio')
+    rewards_axes.set_xlabel('Episódio')
+    rewards_axes.set_ylabel('Recompensa')
+    rewards_axes.legend(['Recompensa', 'Média 100 episódios'])
+
+    epsilon_axes = figure.add_subplot(1, 2, 2)
+    epsilon_axes.plot(epsilons)
+    epsilon_axes.set_title('Epsilon por Episódio')
+    epsilon_axes.set_xlabel('Episódio')
+    epsilon_axes.set_ylabel('Epsilon')
+
+    figure.tight_layout()
+    figure.savefig(path, format='png')
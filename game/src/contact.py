@@ -0,0 +1,126 @@
+# Regras de contato e término compartilhadas por todos os pontos de entrada
+# (RocketEnvironment, main.py e simulações em lote).
+#
+# As funções usam só aritmética e comparações, então aceitam tanto escalares
+# Python (caminho rápido de um único foguete) quanto arrays numpy de foguetes
+# (uma única chamada vetorizada), com exatamente o mesmo resultado.
+
+# Códigos de resultado do contato com o chão
+FLYING = 0    # sem contato
+CRASHED = 1   # contato rápido demais ou fora de uma plataforma
+RESTING = 2   # apoiado numa plataforma com o motor ligado: só a velocidade vertical é zerada
+STOPPED = 3   # apoiado numa plataforma com o motor desligado: o foguete para
+LANDED = 4    # parado na plataforma de pouso
+
+OUTCOME_NAMES = ('flying', 'crashed', 'resting', 'stopped', 'landed')
+
+def target_captured(x, y, target_x, target_y, target_radius):
+    """
+    Indica se o centro do foguete está dentro do target.
+
+    Args:
+        x, y: Posição do centro do foguete (escalares ou arrays)
+        target_x, target_y: Centro do target
+        target_radius: Raio do target
+    """
+    dx = x - target_x
+    dy = y - target_y
+    return dx * dx + dy * dy <= target_radius * target_radius
+
+def ground_contact(x, y, vx, vy, power, half_height, platforms, landing_index, speed_threshold):
+    """
+    Classifica o contato de foguetes com o chão.
+
+    Args:
+        x, y: Posição do centro do foguete (escalares ou arrays)
+        vx, vy: Velocidade (pixels/s)
+        power: Potência do motor (%)
+        half_height: Metade da altura do foguete; abaixo disso ele toca o chão
+        platforms: Sequência de intervalos (x inicial, x final) das plataformas
+        landing_index: Índice da plataforma de pouso em `platforms`
+        speed_threshold: Velocidade máxima de um pouso seguro
+
+    Returns:
+        Código de resultado (FLYING, CRASHED, RESTING, STOPPED ou LANDED), escalar ou array.
+    """
+    on_platform = False
+    on_landing = False
+    for index, (start, end) in enumerate(platforms):
+        on = (x >= start) & (x <= end)
+        on_platform = on_platform | on
+        if index == landing_index:
+            on_landing = on
+    return classify_contact(y, vx, vy, power, half_height, on_platform, on_landing, speed_threshold)
+
+def classify_contact(y, vx, vy, power, half_height, on_platform, on_landing, speed_threshold):
+    """
+    Classifica o contato com o chão a partir das plataformas sob o foguete (ver
+    ground_contact); usado diretamente quando as plataformas vêm de um índice
+    (course.Course).
+
+    Args:
+        on_platform: Se o foguete está sobre alguma plataforma (bool ou array)
+        on_landing: Se o foguete está sobre uma plataforma de pouso
+    """
+    contact = (y <= half_height) & (vy <= 0)
+    too_fast = vx * vx + vy * vy > speed_threshold * speed_threshold
+
+    crashed = contact & (too_fast | (on_platform == 0))
+    safe = contact & (too_fast == 0) & on_platform
+    engine_off = power <= 0
+    return (CRASHED * crashed
+            + RESTING * (safe & (engine_off == 0))
+            + STOPPED * (safe & engine_off & (on_landing == 0))
+            + LANDED * (safe & engine_off & on_landing))
+
+# --- Detecção contínua (CCD) ---
+#
+# Num passo da física, o foguete anda em linha reta da posição (x0, y0) até
+# (x1, y1) (Euler semi-implícito: deslocamento = velocidade nova * dt). Os
+# testes abaixo varrem esse segmento em vez de olhar só o ponto final, então
+# não deixam o foguete atravessar o target entre dois passos nem julgam o
+# contato com o chão pela posição e velocidade do fim do passo.
+
+def swept_target_capture(x0, y0, x1, y1, target_x, target_y, target_radius):
+    """
+    Indica se o segmento (x0, y0) -> (x1, y1) passa pelo target.
+
+    Returns:
+        (capturou, fração do passo em que o foguete entra no target; 0 se já começou dentro)
+    """
+    dx = x1 - x0
+    dy = y1 - y0
+    fx = x0 - target_x
+    fy = y0 - target_y
+    # |f + s*d|² = r²  =>  a*s² + 2*b*s + c = 0
+    a = dx * dx + dy * dy
+    b = fx * dx + fy * dy
+    c = fx * fx + fy * fy - target_radius * target_radius
+    discriminant = b * b - a * c
+    root = (discriminant * (discriminant > 0)) ** 0.5
+    entry = (-b - root) / (a + (a == 0))
+    inside = c <= 0
+    entered = (a > 0) & (discriminant >= 0) & (entry >= 0) & (entry <= 1)
+    return inside | entered, entry * (inside == 0)
+
+def swept_ground_contact(x0, y0, vx0, vy0, x1, y1, vx1, vy1, half_height):
+    """
+    Estado do foguete no instante em que ele toca o chão (y = half_height) durante o passo.
+
+    A posição é interpolada ao longo do segmento e a velocidade entre o início
+    e o fim do passo (aceleração constante), com a componente vertical limitada
+    a <= 0 (o foguete está descendo no contato). Sem cruzamento neste passo, o
+    estado é exatamente o do fim do passo.
+
+    Returns:
+        (cruzou o chão, fração do passo no contato, x, y, vx, vy)
+    """
+    crossing = (y0 > half_height) & (y1 <= half_height)
+    fraction = (y0 - half_height) / (y0 - y1 + (crossing == 0)) * crossing + (crossing == 0)
+    remaining = crossing * (1 - fraction)
+    x = x1 - remaining * (x1 - x0)
+    y = y1 - remaining * (y1 - y0)
+    vx = vx1 - remaining * (vx1 - vx0)
+    vy = vy1 - remaining * (vy1 - vy0)
+    vy = vy - crossing * (vy > 0) * vy
+    return crossing, fraction, x, y, vx, vy
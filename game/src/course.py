@@ -0,0 +1,234 @@
+import bisect
+import math
+import numpy as np
+from . import contact
+from .spatial_hash import SpatialHash
+from .entities.platform import Platform
+from .entities.target import Target
+
+class Course:
+    """
+    Percurso com vários targets (waypoints) e várias plataformas.
+
+    As plataformas ficam ordenadas por x: a plataforma sob um foguete é achada
+    por busca binária (bisect para um foguete, np.searchsorted para arrays). Os
+    targets ficam num índice em grade com células do tamanho do maior target:
+    um ponto só pode estar dentro de targets da sua célula ou das 8 vizinhas.
+    Com `ordered`, os targets são coletados na ordem dada e só o próximo é
+    testado; senão, em qualquer ordem, testando os candidatos da grade.
+
+    O progresso de um foguete é um array booleano `collected` (um por target)
+    mais o índice do target atual (`next_target`, -1 quando todos foram
+    coletados): o próximo da ordem ou, fora de ordem, o mais próximo que falta
+    no momento da última coleta.
+    """
+
+    def __init__(self, targets, platforms, landing=(1,), start=0, ordered=True):
+        """
+        Args:
+            targets: Sequência de Target
+            platforms: Sequência de Platform, sem sobreposição
+            landing: Índices (em `platforms`) das plataformas de pouso
+            start: Índice (em `platforms`) da plataforma de partida
+            ordered: Se os targets devem ser coletados na ordem dada
+        """
+        if not targets:
+            raise ValueError("O percurso precisa de ao menos um target")
+        self.targets = list(targets)
+        self.ordered = ordered
+        self.start_platform = platforms[start]
+        self.landing_platforms = [platforms[i] for i in landing]
+
+        order = sorted(range(len(platforms)), key=lambda i: platforms[i].posicao[0])
+        self.platforms = [platforms[i] for i in order]
+        self.platform_spans = tuple(
+            (platform.posicao[0], platform.posicao[0] + platform.comprimento) for platform in self.platforms)
+        for (_, end), (next_start, _) in zip(self.platform_spans, self.platform_spans[1:]):
+            if next_start <= end:
+                raise ValueError("As plataformas do percurso não podem se sobrepor nem se tocar")
+        self.platform_start = np.array([span[0] for span in self.platform_spans], dtype=np.float64)
+        self.platform_end = np.array([span[1] for span in self.platform_spans], dtype=np.float64)
+        self.platform_landing = np.array([i in landing for i in order])
+        # Listas Python para o caminho escalar (bisect sem conversões do numpy)
+        self._starts = self.platform_start.tolist()
+        self._landing = self.platform_landing.tolist()
+
+        self.target_x = np.array([target.posicao[0] for target in self.targets], dtype=np.float64)
+        self.target_y = np.array([target.posicao[1] for target in self.targets], dtype=np.float64)
+        self.target_radius = np.array([target.altura / 2 for target in self.targets], dtype=np.float64)
+        self._target_list = list(zip(self.target_x.tolist(), self.target_y.tolist(), self.target_radius.tolist()))
+
+        # Grade dos targets: dicionário célula -> índices para um foguete, SpatialHash para arrays
+        self.cell_size = 2 * float(self.target_radius.max())
+        self._grid = {}
+        for index, (x, y, _) in enumerate(self._target_list):
+            cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+            self._grid.setdefault(cell, []).append(index)
+        self.target_index = SpatialHash(self.cell_size, len(self.targets))
+        self.target_index.build(self.target_x, self.target_y)
+
+    def __len__(self):
+        return len(self.targets)
+
+    def to_config(self):
+        """Geometria do percurso em tipos JSON, para gravar junto com trajetórias (ver from_config)."""
+        return {
+            "targets": [[float(target.posicao[0]), float(target.posicao[1]), float(target.comprimento),
+                         float(target.altura)] for target in self.targets],
+            "platforms": [[float(platform.posicao[0]), float(platform.comprimento), float(platform.altura)]
+                          for platform in self.platforms],
+            "landing": [self.platforms.index(platform) for platform in self.landing_platforms],
+            "start": self.platforms.index(self.start_platform),
+            "ordered": self.ordered,
+        }
+
+    @classmethod
+    def from_config(cls, course_config):
+        """Recria um percurso gravado com to_config."""
+        return cls([Target(*values) for values in course_config["targets"]],
+                   [Platform(*values) for values in course_config["platforms"]],
+                   landing=course_config["landing"], start=course_config["start"],
+                   ordered=course_config["ordered"])
+
+    # --- Plataformas ---
+
+    def platform_at(self, x):
+        """Índice (na ordem por x) da plataforma sob x, ou -1."""
+        index = bisect.bisect_right(self._starts, x) - 1
+        if index >= 0 and x <= self.platform_spans[index][1]:
+            return index
+        return -1
+
+    def platform_indices(self, x):
+        """Versão de platform_at para arrays."""
+        index = np.searchsorted(self.platform_start, x, side='right') - 1
+        clipped = np.maximum(index, 0)
+        return np.where((index >= 0) & (x <= self.platform_end[clipped]), index, -1)
+
+    def ground_contact(self, x, y, vx, vy, power, half_height, speed_threshold):
+        """Mesmo resultado de contact.ground_contact, com as plataformas do percurso (escalares ou arrays)."""
+        if isinstance(x, np.ndarray):
+            index = self.platform_indices(x)
+            on_platform = index >= 0
+            on_landing = on_platform & self.platform_landing[np.maximum(index, 0)]
+        else:
+            index = self.platform_at(x)
+            on_platform = index >= 0
+            on_landing = on_platform and self._landing[index]
+        return contact.classify_contact(y, vx, vy, power, half_height, on_platform, on_landing, speed_threshold)
+
+    # --- Targets ---
+
+    def new_progress(self, n=None):
+        """Progresso inicial: (collected, next_target) de um foguete ou de `n` foguetes."""
+        if n is None:
+            collected = np.zeros(len(self.targets), dtype=bool)
+            if self.ordered:
+                return collected, 0
+            return collected, self.next_target(collected, *self.start_position())
+        collected = np.zeros((n, len(self.targets)), dtype=bool)
+        x, y = self.start_position()
+        return collected, np.full(n, self.next_target(collected[0], x, y))
+
+    def start_position(self):
+        """Centro da plataforma de partida, no chão."""
+        return self.start_platform.posicao[0] + self.start_platform.comprimento / 2, 0.0
+
+    def capture(self, x, y, collected, next_target):
+        """
+        Target capturado por um foguete em (x, y) neste passo, ou -1.
+
+        Args:
+            collected: Array booleano dos targets já coletados
+            next_target: Target atual (-1 = todos coletados)
+        """
+        if next_target < 0:
+            return -1
+        if self.ordered:
+            target_x, target_y, radius = self._target_list[next_target]
+            return next_target if contact.target_captured(x, y, target_x, target_y, radius) else -1
+        cell_x = math.floor(x / self.cell_size)
+        cell_y = math.floor(y / self.cell_size)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for index in self._grid.get((cell_x + dx, cell_y + dy), ()):
+                    target_x, target_y, radius = self._target_list[index]
+                    if not collected[index] and contact.target_captured(x, y, target_x, target_y, radius):
+                        return index
+        return -1
+
+    def capture_swept(self, x0, y0, x1, y1, collected, next_target):
+        """
+        Versão contínua de capture: o primeiro target que o segmento (x0, y0) -> (x1, y1)
+        atravessa, ou -1.
+
+        Returns:
+            (target capturado, ponto (x, y) de entrada no target)
+        """
+        if next_target < 0:
+            return -1, (x1, y1)
+        if self.ordered:
+            candidates = (next_target,)
+        else:
+            # Células da caixa que envolve o segmento, com uma de margem; se forem
+            # mais células que targets, testa todos
+            cell_x0, cell_x1 = sorted((math.floor(x0 / self.cell_size), math.floor(x1 / self.cell_size)))
+            cell_y0, cell_y1 = sorted((math.floor(y0 / self.cell_size), math.floor(y1 / self.cell_size)))
+            if (cell_x1 - cell_x0 + 3) * (cell_y1 - cell_y0 + 3) > len(self.targets):
+                candidates = range(len(self.targets))
+            else:
+                candidates = [index
+                              for cell_x in range(cell_x0 - 1, cell_x1 + 2)
+                              for cell_y in range(cell_y0 - 1, cell_y1 + 2)
+                              for index in self._grid.get((cell_x, cell_y), ())]
+        best, best_fraction = -1, 2.0
+        for index in candidates:
+            if collected[index]:
+                continue
+            target_x, target_y, radius = self._target_list[index]
+            hit, fraction = contact.swept_target_capture(x0, y0, x1, y1, target_x, target_y, radius)
+            if hit and fraction < best_fraction:
+                best, best_fraction = index, fraction
+        if best < 0:
+            return -1, (x1, y1)
+        return best, (x0 + best_fraction * (x1 - x0), y0 + best_fraction * (y1 - y0))
+
+    def next_target(self, collected, x, y):
+        """Target atual depois de uma coleta: o próximo da ordem ou o mais próximo que falta (-1 = nenhum)."""
+        remaining = np.flatnonzero(~collected)
+        if len(remaining) == 0:
+            return -1
+        if self.ordered:
+            return int(remaining[0])
+        distance = np.hypot(self.target_x[remaining] - x, self.target_y[remaining] - y)
+        return int(remaining[np.argmin(distance)])
+
+    def capture_batch(self, x, y, collected, next_target):
+        """
+        Versão de capture para arrays (n,) de foguetes, com collected (n, targets)
+        e next_target (n,). Retorna o target capturado por foguete (-1 = nenhum).
+        """
+        captured = np.full(len(x), -1)
+        active = next_target >= 0
+        if self.ordered:
+            index = np.maximum(next_target, 0)
+            hit = active & contact.target_captured(
+                x, y, self.target_x[index], self.target_y[index], self.target_radius[index])
+            captured[hit] = index[hit]
+            return captured
+        rocket, target = self.target_index.query(x, y)
+        hit = (active[rocket] & ~collected[rocket, target]
+               & contact.target_captured(x[rocket], y[rocket], self.target_x[target],
+                                         self.target_y[target], self.target_radius[target]))
+        rocket, target = rocket[hit], target[hit]
+        # Um target por foguete e por passo, como no caminho escalar
+        rocket, first = np.unique(rocket, return_index=True)
+        captured[rocket] = target[first]
+        return captured
+
+    def collect_batch(self, x, y, collected, next_target, captured):
+        """Marca as capturas de capture_batch e atualiza next_target (arrays alterados no lugar)."""
+        rockets = np.flatnonzero(captured >= 0)
+        collected[rockets, captured[rockets]] = True
+        for rocket in rockets:
+            next_target[rocket] = self.next_target(collected[rocket], x[rocket], y[rocket])
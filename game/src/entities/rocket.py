@@ -20,9 +20,9 @@ class Rocket:
         :param posicao_y: posição inicial em y do centro de massa (pixels)
         :param massa: massa do foguete
         """
-        self.posicao = [posicao_x, posicao_y]
+        self._posicao = [posicao_x, posicao_y]
         self.initial_position = [posicao_x, posicao_y]  # Para reset
-        self.orientacao = 90.0          # 90° = foguete "de pé"
+        self._orientacao = 90.0         # 90° = foguete "de pé"
         self.initial_orientation = 90.0 # Para reset
         self.velocidade = [0.0, 0.0]    # pixels/s
         self.angular_velocity = 0.0     # graus/s
@@ -36,18 +36,17 @@ class Rocket:
         self.landed = False
         self.crashed = False
 
-        # Novas métricas para a IA
-        self.distance_to_target = None
-        self.angle_difference = None
-        self.distance_to_landing_platform_x = None
-        self.distance_to_landing_platform_y = None
+        # Novas métricas para a IA (calculadas sob demanda, ver compute_metrics)
+        self._metrics_target = None
+        self._metrics_platform = None
+        self._invalidate_metrics()
 
     def reset(self):
         """
         Reseta o foguete para o estado inicial.
         """
-        self.posicao = self.initial_position.copy()
-        self.orientacao = self.initial_orientation
+        self._posicao = self.initial_position.copy()
+        self._orientacao = self.initial_orientation
         self.velocidade = [0.0, 0.0]
         self.angular_velocity = 0.0
         self.potencia_motor = 0
@@ -56,17 +55,38 @@ class Rocket:
         self.target_reached = False
         self.landed = False
         self.crashed = False
-        self.distance_to_target = None
-        self.angle_difference = None
-        self.distance_to_landing_platform_x = None
-        self.distance_to_landing_platform_y = None
+        self._metrics_target = None
+        self._metrics_platform = None
+        self._invalidate_metrics()
+
+    # Posição e orientação: atribuir um novo valor invalida as métricas (ver
+    # compute_metrics). A lista da posição não deve ser alterada no lugar fora
+    # de update_physics; atribua uma nova lista.
+
+    @property
+    def posicao(self):
+        return self._posicao
+
+    @posicao.setter
+    def posicao(self, value):
+        self._posicao = value
+        self._metrics_stale = True
+
+    @property
+    def orientacao(self):
+        return self._orientacao
+
+    @orientacao.setter
+    def orientacao(self, value):
+        self._orientacao = value
+        self._metrics_stale = True
 
     def aplicar_forca(self, delta_time):
         """
         Calcula e retorna as acelerações (ax, ay) resultantes do empuxo, gravidade e drag.
         """
         thrust = (self.potencia_motor / 100.0) * self.MAX_THRUST
-        total_angle_rad = math.radians(self.orientacao)
+        total_angle_rad = math.radians(self._orientacao)
         thrust_force_x = thrust * math.cos(total_angle_rad)
         thrust_force_y = thrust * math.sin(total_angle_rad)
         
@@ -89,9 +109,10 @@ class Rocket:
         ax, ay = self.aplicar_forca(delta_time)
         self.velocidade[0] += ax * delta_time
         self.velocidade[1] += ay * delta_time
-        self.posicao[0] += self.velocidade[0] * delta_time
-        self.posicao[1] += self.velocidade[1] * delta_time
-        self.orientacao += self.angular_velocity * delta_time
+        self._posicao[0] += self.velocidade[0] * delta_time
+        self._posicao[1] += self.velocidade[1] * delta_time
+        self._orientacao += self.angular_velocity * delta_time
+        self._metrics_stale = True
 
     def atualizar(self, delta_time):
         """
@@ -117,22 +138,78 @@ class Rocket:
 
     def compute_metrics(self, target, landing_platform):
         """
-        Atualiza as métricas:
+        Define o target e a plataforma de pouso das métricas:
          - Distância até o target.
          - Diferença entre o ângulo do foguete e o ângulo da reta que une o foguete ao target.
          - Distância em x e y até o centro da plataforma de pouso.
-        """
-        dx = target.posicao[0] - self.posicao[0]
-        dy = target.posicao[1] - self.posicao[1]
-        self.distance_to_target = math.sqrt(dx**2 + dy**2)
-
-        angle_to_target = math.degrees(math.atan2(dy, dx))
-        self.angle_difference = abs((self.orientacao - angle_to_target + 180) % 360 - 180)
 
-        landing_center_x = landing_platform.posicao[0] + landing_platform.comprimento / 2
-        landing_center_y = landing_platform.altura  # assume plataforma na altura 0
-        self.distance_to_landing_platform_x = abs(self.posicao[0] - landing_center_x)
-        self.distance_to_landing_platform_y = abs(self.posicao[1] - landing_center_y)
+        As métricas só são calculadas na primeira leitura, todas juntas, e ficam
+        guardadas até que a posição ou a orientação mudem (update_physics ou
+        atribuição a `posicao`/`orientacao`) ou até a próxima chamada deste
+        método: passos em que nenhuma métrica é lida não pagam por elas.
+        """
+        self._metrics_target = target
+        self._metrics_platform = landing_platform
+        self._metrics_stale = True
+
+    def _invalidate_metrics(self):
+        self._metrics_stale = True
+
+    def _update_metrics(self):
+        """Calcula as quatro métricas de uma vez (sem target/plataforma, as suas ficam None)."""
+        self._metrics_stale = False
+        target = self._metrics_target
+        if target is None:
+            self._distance_to_target = self._angle_difference = None
+        else:
+            # dx e dy servem à distância e ao ângulo
+            dx = target.posicao[0] - self._posicao[0]
+            dy = target.posicao[1] - self._posicao[1]
+            self._distance_to_target = math.sqrt(dx**2 + dy**2)
+            angle_to_target = math.degrees(math.atan2(dy, dx))
+            self._angle_difference = abs((self._orientacao - angle_to_target + 180) % 360 - 180)
+        platform = self._metrics_platform
+        if platform is None:
+            self._distance_to_landing_platform_x = self._distance_to_landing_platform_y = None
+        else:
+            landing_center_x = platform.posicao[0] + platform.comprimento / 2
+            landing_center_y = platform.altura  # assume plataforma na altura 0
+            self._distance_to_landing_platform_x = abs(self._posicao[0] - landing_center_x)
+            self._distance_to_landing_platform_y = abs(self._posicao[1] - landing_center_y)
+
+    def metrics(self):
+        """
+        As quatro métricas numa só chamada: (distance_to_target, angle_difference,
+        distance_to_landing_platform_x, distance_to_landing_platform_y).
+        """
+        if self._metrics_stale:
+            self._update_metrics()
+        return (self._distance_to_target, self._angle_difference,
+                self._distance_to_landing_platform_x, self._distance_to_landing_platform_y)
+
+    @property
+    def distance_to_target(self):
+        if self._metrics_stale:
+            self._update_metrics()
+        return self._distance_to_target
+
+    @property
+    def angle_difference(self):
+        if self._metrics_stale:
+            self._update_metrics()
+        return self._angle_difference
+
+    @property
+    def distance_to_landing_platform_x(self):
+        if self._metrics_stale:
+            self._update_metrics()
+        return self._distance_to_landing_platform_x
+
+    @property
+    def distance_to_landing_platform_y(self):
+        if self._metrics_stale:
+            self._update_metrics()
+        return self._distance_to_landing_platform_y
 
     def get_state(self):
         """
@@ -3,6 +3,11 @@ import numpy as np
 from .entities.rocket import Rocket
 from .entities.platform import Platform
 from .entities.target import Target
+from .course import Course
+from . import contact
+from . import adaptive_step
+from .predictor import predict_impact_single
+from .rewards import DEFAULT_REWARD_SPEC, METRICS
 import sys
 import os
 
@@ -16,18 +21,80 @@ class RocketEnvironment:
     # Número de ações possíveis
     ACTION_SPACE_SIZE = 9
     
-    def __init__(self, width=config.WIDTH, height=config.HEIGHT, render_mode=None):
+    # Índice da plataforma de pouso em platform_spans no cenário padrão
+    # (com um percurso, ver landing_platform_index)
+    LANDING_PLATFORM_INDEX = 1
+    
+    # Horizonte (s) usado para normalizar o tempo previsto até o impacto
+    PREDICTION_HORIZON = 10.0
+    
+    # Faixas das features sem limite físico em state_bounds(): posições e
+    # distâncias (em telas) e orientação (em voltas)
+    STATE_POSITION_RANGE = 32.0
+    STATE_ORIENTATION_RANGE = 8.0
+    
+    # Efeito de cada ação: (sentido da mudança de potência, sentido do torque)
+    ACTION_EFFECTS = ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+    
+    # Passo adaptativo (ver adaptive_step.py): passos base juntados no máximo,
+    # rotação máxima num passo grande (graus) e folga até o chão e o target (pixels)
+    ADAPTIVE_MAX_STEPS = 16
+    ADAPTIVE_MAX_ROTATION = 2.0
+    ADAPTIVE_MARGIN = 10.0
+    
+    def __init__(self, width=config.WIDTH, height=config.HEIGHT, render_mode=None,
+                 observation_mode='vector', pixel_size=(84, 84), frame_stack=4, seed=None,
+                 prediction_features=False, reward_spec=None, course=None,
+                 dt=1.0/config.FPS, action_repeat=1, ccd=False, adaptive=False, reward_terms=False):
         """
         Inicializa o ambiente para o agente DQN.
         
         Args:
             width: Largura da tela (pixels)
             height: Altura da tela (pixels)
-            render_mode: None para headless, 'human' para renderização visual
+            render_mode: None para headless, 'human' para renderização visual,
+                         'rgb_array' para renderizar num buffer fora da tela
+            observation_mode: 'vector' para o vetor de estado normalizado, 'pixels' para
+                              imagens em escala de cinza empilhadas
+            pixel_size: (altura, largura) das imagens no modo 'pixels'
+            frame_stack: Número de imagens empilhadas no modo 'pixels'
+            seed: Semente do gerador aleatório do ambiente (None = não determinística)
+            prediction_features: Acrescenta ao vetor de estado a previsão analítica do
+                                 impacto (tempo, x e velocidade), ver predictor.py
+            reward_spec: Especificação da recompensa (rewards.RewardSpec); padrão:
+                         rewards.DEFAULT_REWARD_SPEC
+            course: Percurso com vários targets e plataformas (course.Course); padrão:
+                    um target a (5 m, 5 m) e as plataformas de partida e de pouso
+            dt: Passo de tempo da física (s)
+            action_repeat: Passos de física por ação (a ação é repetida em todos)
+            ccd: Detecção contínua de colisão: a captura do target e o contato com o
+                 chão são testados ao longo de todo o passo, não só no fim dele
+                 (contact.swept_target_capture e contact.swept_ground_contact)
+            adaptive: Passo adaptativo: longe do chão e do target, e com pouca rotação, os
+                      passos de física de uma ação são juntados em passos maiores (ver
+                      adaptive_step.py); só acelera com action_repeat > 1, e as
+                      observações continuam a cada action_repeat * dt
+            reward_terms: Devolve em info['reward_terms'] o valor de cada termo da
+                          recompensa, na ordem de reward_spec.names
         """
         self.width = width
         self.height = height
         self.render_mode = render_mode
+        self.observation_mode = observation_mode
+        self.pixel_size = pixel_size
+        self.frame_stack = frame_stack
+        self.prediction_features = prediction_features
+        self.reward_spec = reward_spec if reward_spec is not None else DEFAULT_REWARD_SPEC
+        self.reward_terms = reward_terms
+        self.dt = dt
+        self.action_repeat = action_repeat
+        self.ccd = ccd
+        self.adaptive = adaptive
+        
+        # Toda aleatoriedade do ambiente deve vir deste gerador, para que a mesma
+        # semente produza a mesma sequência de episódios
+        self.seed = seed
+        self.np_random = np.random.default_rng(seed)
         self.pixels_per_meter = config.PIXELS_PER_METER
         
         # Criação das plataformas
@@ -47,13 +114,44 @@ class RocketEnvironment:
             altura=0
         )
         
+        # Target
+        self.target_diameter = 30
+        
+        # Percurso: targets e plataformas indexados para a captura e o contato
+        if course is None:
+            course = Course(
+                [Target(5 * self.pixels_per_meter, 5 * self.pixels_per_meter,
+                        self.target_diameter, self.target_diameter)],
+                [self.initial_platform, self.landing_platform],
+                landing=(1,), start=0
+            )
+        else:
+            self.initial_platform = course.start_platform
+            self.landing_platform = course.landing_platforms[0]
+        self.course = course
+        
+        # Intervalos (x inicial, x final) das plataformas, ordenados por x
+        self.platform_spans = course.platform_spans
+        # Índice da plataforma de pouso principal em platform_spans (simulações em lote)
+        self.landing_platform_index = course.platforms.index(self.landing_platform)
+        
+        # Constantes da normalização do estado (ver _get_state)
+        self._diagonal = math.sqrt(width**2 + height**2)
+        self._landing_x_norm = self.landing_platform.posicao[0] / width
+        self._landing_width_norm = self.landing_platform.comprimento / width
+        
         # Parâmetros do foguete
         self.rocket_width, self.rocket_height = 20, 40
         self.rocket_initial_x = self.initial_platform.posicao[0] + self.initial_platform.comprimento / 2
         self.rocket_initial_y = self.rocket_height / 2
         
-        # Target
-        self.target_diameter = 30
+        # Rasterizador de observações em pixels (criado sob demanda no modo 'pixels')
+        self.pixel_rasterizer = None
+        self._pixel_stack = None
+        
+        # Renderizador fora da tela (criado sob demanda no modo 'rgb_array')
+        self.offscreen_renderer = None
+        self._rocket_sprites = None
         
         # Inicialização dos elementos do jogo
         self.rocket = None
@@ -67,17 +165,35 @@ class RocketEnvironment:
         self.total_steps = 0
         self.max_steps = 2000  # Limite de passos por episódio
         
+        # Limites usados pelo passo adaptativo: aceleração máxima (empuxo + gravidade)
+        # e aceleração angular do torque (graus/s²)
+        self._max_acceleration = config.MAX_THRUST / self.rocket.massa + config.GRAVITY
+        self._angular_acceleration = math.degrees(Rocket.ROTATION_TORQUE / self.rocket.moment_of_inercia)
+        
     def get_state_size(self):
         """Retorna o tamanho do espaço de estados para a rede neural."""
         return len(self._get_state())
     
-    def reset(self):
+    def get_observation_shape(self):
+        """Retorna o formato das observações devolvidas por reset() e step()."""
+        if self.observation_mode == 'pixels':
+            return (self.frame_stack,) + tuple(self.pixel_size)
+        return (self.get_state_size(),)
+    
+    def reset(self, seed=None):
         """
         Reinicia o ambiente para um novo episódio.
         
+        Args:
+            seed: Se dada, reinicia o gerador aleatório do ambiente com esta semente
+        
         Returns:
             O estado inicial do ambiente.
         """
+        if seed is not None:
+            self.seed = seed
+            self.np_random = np.random.default_rng(seed)
+        
         # Reinicia o foguete
         self.rocket = Rocket(
             posicao_x=self.rocket_initial_x, 
@@ -85,23 +201,26 @@ class RocketEnvironment:
             massa=50
         )
         
-        # Reinicia o target
-        self.target = Target(
-            5 * self.pixels_per_meter,
-            5 * self.pixels_per_meter,
-            self.target_diameter,
-            self.target_diameter
-        )
+        # Reinicia o percurso; self.target é o target atual
+        self.collected, self.next_target = self.course.new_progress()
+        self.target = self.course.targets[self.next_target]
         
         # Reinicia estados
         self.done = False
         self.reward = 0
         self.total_steps = 0
         
+        # O primeiro frame de um episódio é sempre redesenhado por inteiro
+        if self.offscreen_renderer is not None:
+            self.offscreen_renderer.invalidate()
+        
         # Calcula as métricas iniciais
         self.rocket.compute_metrics(self.target, self.landing_platform)
+        self._reward_values = self._metric_values(False, False, False, False)
         
-        return self._get_state()
+        if self.observation_mode == 'pixels':
+            self._reset_pixel_stack()
+        return self._get_observation()
     
     def step(self, action):
         """
@@ -127,23 +246,58 @@ class RocketEnvironment:
             - info é um dicionário com informações adicionais
         """
         if self.done:
-            return self._get_state(), 0, True, {"status": "already_done"}
+            return self._get_observation(), 0, True, {"status": "already_done"}
         
         # Incrementa contador de passos
         self.total_steps += 1
         if self.total_steps >= self.max_steps:
             self.done = True
-            return self._get_state(), -50, True, {"status": "timeout"}
+            return self._get_observation(), self.reward_spec.timeout, True, {"status": "timeout"}
             
-        # Aplica a ação escolhida
-        delta_time = 1.0/config.FPS  # Simulação de um frame
-        
-        # Armazena métricas antigas para calcular recompensas
-        old_distance = self.rocket.distance_to_target
-        old_angle_diff = self.rocket.angle_difference
-        old_landing_dist_x = self.rocket.distance_to_landing_platform_x
-        old_landing_dist_y = self.rocket.distance_to_landing_platform_y
+        # Aplica a ação por action_repeat passos de física; um evento em qualquer
+        # subpasso conta na recompensa da decisão
+        rocket = self.rocket
+        previous = self._reward_values
+        captured = crashed = landed_with_target = landed_without_target = False
+        steps_left = self.action_repeat
+        while steps_left:
+            steps = self._adaptive_steps(action, steps_left) if self.adaptive else 1
+            steps_left -= steps
+            if steps > 1:
+                # Longe do chão e do target: nenhum contato é possível nestes passos
+                self._coast(action, steps)
+                continue
+            substep_captured, outcome = self._advance(action, self.dt)
+            captured = captured or substep_captured
+            if outcome == contact.CRASHED:
+                crashed = True
+            elif outcome == contact.LANDED:
+                if rocket.target_reached:
+                    landed_with_target = True
+                else:
+                    landed_without_target = True
+            if self.done:
+                break
+        
+        # Recompensa: termos da reward_spec sobre as métricas do passo anterior e do atual
+        # Não há penalização nem fim de jogo por sair da tela: o foguete pode
+        # viajar livremente pelo espaço
+        current = self._reward_values = self._metric_values(
+            captured, crashed, landed_with_target, landed_without_target)
+        if self.reward_terms:
+            step_reward, terms = self.reward_spec.evaluate(dict(zip(METRICS, previous)), dict(zip(METRICS, current)))
+            # Valor de cada termo, na ordem de reward_spec.names
+            return self._get_observation(), step_reward, self.done, {"status": "in_progress", "reward_terms": terms}
+        step_reward = self.reward_spec.evaluate_scalar(previous, current)
+        return self._get_observation(), step_reward, self.done, {"status": "in_progress"}
+    
+    def _advance(self, action, delta_time):
+        """
+        Aplica a ação e avança a física por `delta_time`.
         
+        Returns:
+            (capturou um target, código de contato de contact.py)
+        """
         # Decodifica a ação
         if action == 0:  # Não fazer nada
             pass
@@ -168,104 +322,280 @@ class RocketEnvironment:
             self.rocket.alterar_potencia(-Rocket.POTENCIA_INCREMENTO)
             self.rocket.aplicar_torque(-Rocket.ROTATION_TORQUE, delta_time)
         
-        # Atualiza a física do foguete
-        self.rocket.atualizar(delta_time)
-        
-        # Atualiza métricas
-        self.rocket.compute_metrics(self.target, self.landing_platform)
-        
-        # Inicia com recompensa zerada para este passo
-        step_reward = 0
-        
-        # Verifica captura do target
-        if not self.rocket.target_reached:
-            dx = self.rocket.posicao[0] - self.target.posicao[0]
-            dy = self.rocket.posicao[1] - self.target.posicao[1]
-            if math.sqrt(dx**2 + dy**2) <= self.target.altura / 2:
-                self.rocket.target_reached = True
-                # Recompensa por pegar o target
-                step_reward += 100
-        
-        # Verifica pouso ou colisão
-        rocket_half_height = self.rocket_height / 2
-        if self.rocket.posicao[1] <= rocket_half_height and self.rocket.velocidade[1] <= 0:
-            landing_speed = math.sqrt(self.rocket.velocidade[0]**2 + self.rocket.velocidade[1]**2)
-            on_initial = (self.initial_platform.posicao[0] <= self.rocket.posicao[0] <= 
-                         self.initial_platform.posicao[0] + self.initial_platform.comprimento)
-            on_landing = (self.landing_platform.posicao[0] <= self.rocket.posicao[0] <= 
-                         self.landing_platform.posicao[0] + self.landing_platform.comprimento)
+        rocket = self.rocket
+        if self.ccd:
+            captured, x, y, vx, vy = self._sweep(delta_time)
+        else:
+            # Atualiza a física do foguete; as métricas (Rocket.compute_metrics) são
+            # invalidadas aqui e recalculadas só quando lidas, já com o ajuste do contato
+            rocket.atualizar(delta_time)
             
-            # Inicializar target_reached se não existir
-            if not hasattr(self.rocket, 'target_reached'):
-                self.rocket.target_reached = False
-                
-            if landing_speed > self.landing_speed_threshold:
-                self.rocket.crashed = True
-                self.done = True
-                # Penalidade por crash
-                step_reward -= 100
+            # Captura do target e contato com o chão (regras compartilhadas em contact.py)
+            x, y = rocket.posicao
+            vx, vy = rocket.velocidade
+            captured = False
+            if not rocket.target_reached:
+                index = self.course.capture(x, y, self.collected, self.next_target)
+                if index >= 0:
+                    captured = True
+                    self._collect(index, x, y)
+        
+        outcome = self.course.ground_contact(
+            x, y, vx, vy, rocket.potencia_motor, self.rocket_height / 2, self.landing_speed_threshold
+        )
+        if outcome == contact.CRASHED:
+            # Rápido demais ou fora de uma plataforma
+            rocket.crashed = True
+            self.done = True
+        elif outcome != contact.FLYING:
+            # Ajusta posição para ficar exatamente na plataforma (nova lista: invalida as métricas)
+            rocket.posicao = [x, self.rocket_height / 2]
+            if outcome == contact.RESTING:
+                # Se ainda tem potência, só para o movimento vertical mas permite continuar
+                rocket.velocidade[1] = 0.0
             else:
-                if on_initial or on_landing:
-                    # Ajusta posição para ficar exatamente na plataforma
-                    self.rocket.posicao[1] = rocket_half_height
-                    
-                    # Se a potência for zero, para o foguete completamente
-                    if self.rocket.potencia_motor == 0:
-                        self.rocket.velocidade = [0.0, 0.0]  # Importante: usar 0.0 para garantir tipo float
-                        self.rocket.angular_velocity = 0.0
-                        
-                        # Marca como pousado se estiver na plataforma de pouso
-                        if on_landing:
-                            self.rocket.landed = True
-                            # Só finaliza a simulação se tiver pegado o target
-                            if self.rocket.target_reached:
-                                self.done = True
-                                landing_reward = 200 - self.rocket.fuel_consumed
-                                landing_reward += 300  # Extra por ter completado com o target
-                                step_reward += max(0, landing_reward)
-                            else:
-                                # Pequena recompensa por pousar sem o target
-                                step_reward += 20
-                    else:
-                        # Se ainda tem potência, só para o movimento vertical mas permite continuar
-                        self.rocket.velocidade[1] = 0.0
-                        # Não marca como pousado se tiver potência
-                else:
-                    # Bateu no chão fora da plataforma
-                    self.rocket.crashed = True
+                # Motor desligado: para o foguete completamente
+                rocket.velocidade = [0.0, 0.0]
+                rocket.angular_velocity = 0.0
+            
+            if outcome == contact.LANDED:
+                rocket.landed = True
+                # Só finaliza a simulação se tiver pegado o target
+                if rocket.target_reached:
                     self.done = True
-                    step_reward -= 100
         
-        # Recompensas incrementais
-        # Melhorou a distância até o target?
-        if old_distance > self.rocket.distance_to_target:
-            step_reward += 0.5  # Aumentado de 0.3 para 0.5
+        # Religar o motor desfaz um pouso sem o target (o foguete pode decolar de novo)
+        if rocket.landed and outcome != contact.LANDED and rocket.potencia_motor > 0:
+            rocket.landed = False
+        return captured, outcome
+    
+    def _sweep(self, delta_time):
+        """
+        Física e captura do target com detecção contínua: o segmento percorrido no
+        passo é cortado no instante em que toca o chão, o target é testado ao longo
+        desse segmento e o contato é classificado com a posição e a velocidade do
+        impacto. Num contato, o foguete fica no ponto de impacto (o resto do passo
+        é descartado).
+        
+        Returns:
+            (capturou um target, x, y, vx, vy no fim do segmento)
+        """
+        rocket = self.rocket
+        x0, y0 = rocket.posicao
+        vx0, vy0 = rocket.velocidade
+        rocket.atualizar(delta_time)
+        x, y = rocket.posicao
+        vx, vy = rocket.velocidade
+        crossing, _, x, y, vx, vy = contact.swept_ground_contact(
+            x0, y0, vx0, vy0, x, y, vx, vy, self.rocket_height / 2)
+        if crossing:
+            rocket.posicao = [x, y]
+            rocket.velocidade = [vx, vy]
+        
+        captured = False
+        if not rocket.target_reached:
+            index, (entry_x, entry_y) = self.course.capture_swept(
+                x0, y0, x, y, self.collected, self.next_target)
+            if index >= 0:
+                captured = True
+                self._collect(index, entry_x, entry_y)
+        return captured, x, y, vx, vy
+    
+    def _adaptive_steps(self, action, limit):
+        """
+        Maior número de passos base (potência de 2, até `limit` e ADAPTIVE_MAX_STEPS)
+        que pode ser dado num passo só: o foguete não alcança o chão nem um target
+        nesse tempo, mesmo com aceleração máxima, e gira no máximo
+        ADAPTIVE_MAX_ROTATION graus.
+        """
+        rocket = self.rocket
+        x, y = rocket.posicao
+        vx, vy = rocket.velocidade
+        clearance = y - self.rocket_height / 2
+        if not rocket.target_reached:
+            clearance = min(clearance, self._target_clearance(x, y))
+        clearance -= self.ADAPTIVE_MARGIN
+        speed = math.sqrt(vx * vx + vy * vy)
+        # O arrasto entra como aceleração extra proporcional à velocidade atual
+        acceleration = self._max_acceleration + config.DRAG_COEFFICIENT / rocket.massa * speed
+        angular_acceleration = self._angular_acceleration if self.ACTION_EFFECTS[action][1] else 0.0
+        
+        steps = min(limit, self.ADAPTIVE_MAX_STEPS)
+        while steps > 1:
+            duration = steps * self.dt
+            if (adaptive_step.reach(speed, acceleration, duration) < clearance and
+                    adaptive_step.rotation(rocket.angular_velocity, angular_acceleration, duration)
+                    <= self.ADAPTIVE_MAX_ROTATION):
+                break
+            steps //= 2
+        return steps
+    
+    def _target_clearance(self, x, y):
+        """Distância de (x, y) até a borda do target mais próximo que ainda pode ser capturado."""
+        course = self.course
+        if course.ordered:
+            return self.rocket.distance_to_target - course.target_radius[self.next_target]
+        remaining = ~self.collected
+        distance = np.hypot(course.target_x[remaining] - x, course.target_y[remaining] - y)
+        return float(np.min(distance - course.target_radius[remaining]))
+    
+    def _coast(self, action, steps):
+        """
+        Avança `steps` passos base num passo só (ver adaptive_step.py), repetindo a
+        ação em cada um. Só é chamado quando nenhum contato é possível no intervalo.
+        """
+        rocket = self.rocket
+        dt = self.dt
+        increment, torque = self.ACTION_EFFECTS[action]
+        
+        # A potência muda antes de cada passo base; o empuxo usa a potência média
+        power_total, rocket.potencia_motor = adaptive_step.power_sum(
+            rocket.potencia_motor, increment * Rocket.POTENCIA_INCREMENTO, steps)
+        
+        # Velocidade angular e orientação exatas: ω_j = ω0 + j α dt, θ_j = θ_(j-1) + ω_j dt.
+        # O passo base j usa a orientação θ_(j-1); o empuxo usa a do meio do intervalo
+        angular_velocity = rocket.angular_velocity
+        orientation = rocket.orientacao
+        alpha_dt = torque * self._angular_acceleration * dt
+        middle = (steps - 1) / 2
+        thrust_angle = orientation + dt * (middle * angular_velocity + alpha_dt * middle * (middle + 1) / 2)
+        rocket.orientacao = orientation + dt * (steps * angular_velocity + alpha_dt * steps * (steps + 1) / 2)
+        rocket.angular_velocity = angular_velocity + steps * alpha_dt
+        
+        thrust = power_total / steps / 100.0 * Rocket.MAX_THRUST / rocket.massa
+        rad = math.radians(thrust_angle)
+        x, y, vx, vy = adaptive_step.coast(
+            rocket.posicao[0], rocket.posicao[1], rocket.velocidade[0], rocket.velocidade[1],
+            thrust * math.cos(rad), thrust * math.sin(rad) - Rocket.GRAVIDADE, rocket.massa, dt, steps)
+        rocket.posicao = [x, y]
+        rocket.velocidade = [vx, vy]
+        rocket.fuel_consumed += power_total / 100.0 * dt
+    
+    @property
+    def elapsed_time(self):
+        """Tempo simulado do episódio (s) no relógio do agente: action_repeat * dt por ação."""
+        return self.total_steps * self.action_repeat * self.dt
+    
+    def _collect(self, index, x, y):
+        """Marca o target `index` como coletado e passa ao próximo; o último completa o percurso."""
+        self.collected[index] = True
+        self.next_target = self.course.next_target(self.collected, x, y)
+        if self.next_target < 0:
+            self.rocket.target_reached = True
+        else:
+            self.target = self.course.targets[self.next_target]
+            self.rocket.compute_metrics(self.target, self.landing_platform)
+    
+    @property
+    def reward_metrics(self):
+        """
+        Métricas usadas pelos termos de recompensa (ver rewards.METRICS), guardadas
+        no fim do último passo (ou em reset/restore); são as `previous` do próximo passo.
+        """
+        return dict(zip(METRICS, self._reward_values))
+    
+    def _metric_values(self, captured, crashed, landed_with_target, landed_without_target):
+        """Métricas do passo atual como tupla na ordem de rewards.METRICS."""
+        rocket = self.rocket
+        return rocket.metrics() + (rocket.potencia_motor, rocket.fuel_consumed, rocket.target_reached,
+                                   captured, crashed, landed_with_target, landed_without_target)
+    
+    def snapshot(self):
+        """
+        Retorna o estado dinâmico completo do episódio como um array float64.
+
+        Plataformas e target são fixos, e as métricas do foguete são derivadas do
+        estado, então restaurar este array reproduz a simulação bit a bit. Em
+        percursos com vários targets, o target atual e os targets coletados vêm
+        depois dos 13 valores do estado do foguete.
+        """
+        rocket = self.rocket
+        course_state = []
+        if len(self.course) > 1:
+            course_state = [self.next_target] + self.collected.tolist()
+        return np.array([
+            rocket.posicao[0], rocket.posicao[1],
+            rocket.velocidade[0], rocket.velocidade[1],
+            rocket.orientacao, rocket.angular_velocity,
+            rocket.potencia_motor, rocket.fuel_consumed,
+            rocket.target_reached, rocket.landed, rocket.crashed,
+            self.total_steps, self.done
+        ] + course_state, dtype=np.float64)
+
+    def restore(self, snapshot):
+        """
+        Restaura um estado obtido com snapshot() e retorna a observação correspondente.
+        """
+        rocket = self.rocket
+        rocket.posicao = [float(snapshot[0]), float(snapshot[1])]
+        rocket.velocidade = [float(snapshot[2]), float(snapshot[3])]
+        rocket.orientacao = float(snapshot[4])
+        rocket.angular_velocity = float(snapshot[5])
+        rocket.potencia_motor = int(snapshot[6])
+        rocket.fuel_consumed = float(snapshot[7])
+        rocket.target_reached = bool(snapshot[8])
+        rocket.landed = bool(snapshot[9])
+        rocket.crashed = bool(snapshot[10])
+        self.total_steps = int(snapshot[11])
+        self.done = bool(snapshot[12])
+        if len(self.course) > 1:
+            self.next_target = int(snapshot[13])
+            self.collected = np.asarray(snapshot[14:14 + len(self.course)]) > 0.5
         else:
-            step_reward -= 0.05
-        
-        # Melhorou o ângulo em relação ao target?
-        if old_angle_diff > self.rocket.angle_difference:
-            step_reward += 0.4  # Aumentado de 0.2 para 0.4
-        
-        # Se já pegou o target, recompensa por melhorar a posição em relação à plataforma de pouso
-        if self.rocket.target_reached:
-            if old_landing_dist_x > self.rocket.distance_to_landing_platform_x:
-                step_reward += 0.2
-            if old_landing_dist_y > self.rocket.distance_to_landing_platform_y:
-                step_reward += 0.2
-        
-        # Penalidade por consumo de combustível (pequena)
-        step_reward -= 0.005 * self.rocket.potencia_motor / 100.0  # Reduzido de 0.01 para 0.005
-        
-        # Verifica se saiu da tela
-        # Removido: Não deve haver penalização ou fim de jogo por sair da tela
-        # O foguete deve poder viajar livremente pelo espaço
-        # if (self.rocket.posicao[0] < 0 or self.rocket.posicao[0] > self.width or 
-        #    self.rocket.posicao[1] < 0 or self.rocket.posicao[1] > self.height):
-        #    self.done = True
-        #    step_reward -= 100
-        
-        return self._get_state(), step_reward, self.done, {"status": "in_progress"}
+            self.collected[0] = rocket.target_reached
+            self.next_target = -1 if rocket.target_reached else 0
+        if self.next_target >= 0:
+            self.target = self.course.targets[self.next_target]
+        rocket.compute_metrics(self.target, self.landing_platform)
+        self._reward_values = self._metric_values(False, False, False, False)
+
+        if self.offscreen_renderer is not None:
+            self.offscreen_renderer.invalidate()
+        if self.observation_mode == 'pixels':
+            # O histórico de imagens não faz parte do snapshot: a pilha recomeça do frame atual
+            self._reset_pixel_stack()
+        return self._get_observation()
+
+    def _get_observation(self):
+        """Retorna a observação no formato escolhido por `observation_mode`."""
+        if self.observation_mode == 'pixels':
+            return self._get_pixel_observation()
+        return self._get_state()
+    
+    def _rasterize_frame(self):
+        """Rasteriza a cena atual e retorna a imagem (1, altura, largura)."""
+        frame = self._pixel_frame
+        self.pixel_rasterizer.render(
+            frame[0],
+            self.rocket.posicao[0],
+            self.rocket.posicao[1],
+            self.rocket.orientacao,
+            self.rocket.target_reached,
+            self.collected
+        )
+        return frame
+    
+    def _reset_pixel_stack(self):
+        """Preenche a pilha de imagens com o frame inicial do episódio."""
+        if self.pixel_rasterizer is None:
+            from .pixel_observation import PixelRasterizer, FrameStack
+            self.pixel_rasterizer = PixelRasterizer(self, self.pixel_size)
+            self._pixel_stack = FrameStack(1, self.frame_stack, *self.pixel_size)
+            self._pixel_frame = np.zeros((1,) + tuple(self.pixel_size), dtype=np.uint8)
+        self._pixel_stack.reset(self._rasterize_frame())
+        self._pixel_stack_step = self.total_steps
+    
+    def _get_pixel_observation(self):
+        """
+        Empilha o frame atual e retorna as `frame_stack` imagens mais recentes
+        (frame_stack, altura, largura) uint8. O retorno é uma cópia, segura para
+        guardar em memórias de replay.
+        """
+        # Empilha no máximo um frame por passo (reset() já empilhou o frame inicial)
+        if self.total_steps != self._pixel_stack_step:
+            self._pixel_stack.push(self._rasterize_frame())
+            self._pixel_stack_step = self.total_steps
+        return self._pixel_stack.frames()[0].copy()
     
     def _get_state(self):
         """
@@ -273,8 +603,9 @@ class RocketEnvironment:
         como entrada para uma rede neural.
         """
         # Normalização dos valores para range adequado para rede neural
-        pos_x_norm = self.rocket.posicao[0] / self.width
-        pos_y_norm = self.rocket.posicao[1] / self.height
+        x, y = self.rocket.posicao
+        pos_x_norm = x / self.width
+        pos_y_norm = y / self.height
         vel_x_norm = self.rocket.velocidade[0] / 1000.0  # Normaliza para valor máximo esperado
         vel_y_norm = self.rocket.velocidade[1] / 1000.0
         orientation_norm = self.rocket.orientacao / 360.0
@@ -285,15 +616,16 @@ class RocketEnvironment:
         target_y_norm = self.target.posicao[1] / self.height
         target_reached = 1.0 if self.rocket.target_reached else 0.0
         
-        dist_to_target_norm = self.rocket.distance_to_target / math.sqrt(self.width**2 + self.height**2)
-        angle_diff_norm = self.rocket.angle_difference / 180.0
+        distance, angle_diff, landing_dist_x, landing_dist_y = self.rocket.metrics()
+        dist_to_target_norm = distance / self._diagonal
+        angle_diff_norm = angle_diff / 180.0
         
-        landing_x_norm = self.landing_platform.posicao[0] / self.width
-        landing_width_norm = self.landing_platform.comprimento / self.width
-        dist_landing_x_norm = self.rocket.distance_to_landing_platform_x / self.width
-        dist_landing_y_norm = self.rocket.distance_to_landing_platform_y / self.height
+        landing_x_norm = self._landing_x_norm
+        landing_width_norm = self._landing_width_norm
+        dist_landing_x_norm = landing_dist_x / self.width
+        dist_landing_y_norm = landing_dist_y / self.height
         
-        return np.array([
+        state = [
             pos_x_norm, pos_y_norm,
             vel_x_norm, vel_y_norm,
             orientation_norm, angular_vel_norm,
@@ -302,16 +634,78 @@ class RocketEnvironment:
             dist_to_target_norm, angle_diff_norm,
             landing_x_norm, landing_width_norm,
             dist_landing_x_norm, dist_landing_y_norm
-        ])
+        ]
+        
+        if self.prediction_features:
+            # Impacto previsto mantendo potência e orientação atuais; sem impacto dentro
+            # do horizonte, tempo = 1 e o x do impacto é o x atual
+            time_to_impact, impact_x, impact_speed = predict_impact_single(self.rocket, self.rocket_height / 2)
+            if time_to_impact > self.PREDICTION_HORIZON:
+                state += [1.0, pos_x_norm, 0.0]
+            else:
+                state += [time_to_impact / self.PREDICTION_HORIZON, impact_x / self.width, impact_speed / 1000.0]
+        
+        return np.array(state)
+    
+    def state_bounds(self):
+        """
+        Limites (low, high) de cada feature da observação, usados para quantizá-la
+        (ver replay_memory.py).
+        
+        Velocidades e velocidade angular usam seus limites físicos (velocidade
+        terminal com empuxo máximo, torque aplicado durante todo o episódio). As
+        posições, distâncias e a orientação não têm limite: usam
+        STATE_POSITION_RANGE telas e STATE_ORIENTATION_RANGE voltas em torno da
+        origem, e valores além disso são saturados na quantização.
+        """
+        if self.observation_mode == 'pixels':
+            shape = self.get_observation_shape()
+            return np.zeros(shape), np.full(shape, 255.0)
+        
+        position = self.STATE_POSITION_RANGE
+        distance = position + 1  # a distância até um ponto da tela
+        orientation = self.STATE_ORIENTATION_RANGE
+        drag = config.DRAG_COEFFICIENT / self.rocket.massa
+        velocity = (config.MAX_THRUST / self.rocket.massa + config.GRAVITY) / drag / 1000.0
+        angular_acceleration = math.degrees(config.ROTATION_TORQUE / self.rocket.moment_of_inercia)
+        angular_velocity = angular_acceleration * self.max_steps * self.action_repeat * self.dt / 360.0
+        # O target atual muda ao longo de um percurso: a faixa cobre todos os targets
+        course = self.course
+        target_x_low, target_x_high = course.target_x.min() / self.width, course.target_x.max() / self.width
+        target_y_low, target_y_high = course.target_y.min() / self.height, course.target_y.max() / self.height
+        landing_x_norm = self.landing_platform.posicao[0] / self.width
+        landing_width_norm = self.landing_platform.comprimento / self.width
+        
+        bounds = [
+            (-position, position), (-position, position),
+            (-velocity, velocity), (-velocity, velocity),
+            (-orientation, orientation), (-angular_velocity, angular_velocity),
+            (0.0, 1.0),
+            (target_x_low, target_x_high), (target_y_low, target_y_high), (0.0, 1.0),
+            (0.0, distance), (0.0, 1.0),
+            (landing_x_norm, landing_x_norm), (landing_width_norm, landing_width_norm),
+            (0.0, distance), (0.0, distance)
+        ]
+        if self.prediction_features:
+            bounds += [(0.0, 1.0), (-position, position), (0.0, velocity)]
+        low, high = np.array(bounds).T
+        return low, high
     
     def render(self, screen=None):
         """
-        Renderiza o estado atual do ambiente, se render_mode='human'.
-        Pode ser conectado com a função de renderização do Pygame.
+        Renderiza o estado atual do ambiente.
+        
+        Com render_mode='human', retorna os objetos para o front-end desenhar.
+        Com render_mode='rgb_array', desenha a cena fora da tela e retorna um array
+        (altura, largura, 3) uint8. O array é sempre o mesmo buffer, sobrescrito a
+        cada chamada; copie-o se precisar guardar o frame.
         
         Args:
             screen: A superfície do Pygame onde renderizar (opcional)
         """
+        if self.render_mode == 'rgb_array':
+            return self._render_rgb_array()
+        
         if self.render_mode != 'human' or screen is None:
             return
         
@@ -323,3 +717,27 @@ class RocketEnvironment:
             'initial_platform': self.initial_platform,
             'landing_platform': self.landing_platform
         }
+    
+    def _render_rgb_array(self):
+        """Desenha a cena no buffer fora da tela e retorna o array de pixels."""
+        if self.offscreen_renderer is None:
+            # Import tardio: o pygame só é necessário quando há renderização
+            import pygame
+            from .rendering.frame_renderer import OffscreenRenderer
+            from .rendering.rocket_sprite import RocketSpriteCache
+            
+            image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images/Fundo.png")
+            try:
+                background = pygame.image.load(image_path)
+            except (FileNotFoundError, pygame.error):
+                background = pygame.Surface((self.width, self.height))
+                background.fill((0, 0, 0))
+            self.offscreen_renderer = OffscreenRenderer(background, (self.width, self.height))
+            self._rocket_sprites = RocketSpriteCache(self.rocket_width, self.rocket_height)
+        
+        from .rendering.scene import draw_world
+        renderer = self.offscreen_renderer
+        renderer.begin_frame()
+        for rect in draw_world(renderer.screen, self, self._rocket_sprites):
+            renderer.add(rect)
+        return renderer.present()
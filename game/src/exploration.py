@@ -0,0 +1,43 @@
+import numpy as np
+
+# Exploração epsilon-greedy em lote, para coletar experiência de vários
+# ambientes de uma vez (ver DQNAgent.act_batch).
+
+def apex_epsilons(n, base=0.4, alpha=7.0):
+    """
+    Epsilons fixos por ambiente no estilo Ape-X: epsilon_i = base^(1 + alpha * i / (n - 1)),
+    de `base` (mais exploração) a base^(1 + alpha) (quase guloso).
+
+    Returns:
+        Array (n,) de epsilons
+    """
+    if n == 1:
+        return np.array([base])
+    return base ** (1 + alpha * np.arange(n) / (n - 1))
+
+def epsilon_greedy(rng, states, epsilons, action_size, q_values):
+    """
+    Escolhe uma ação por estado: aleatória com probabilidade epsilon, senão a de
+    maior valor Q.
+
+    A máscara de exploração e as ações aleatórias são sorteadas para o lote
+    inteiro de uma vez, e `q_values` é chamada uma única vez, só com as linhas
+    gulosas (nenhuma vez se todas explorarem).
+
+    Args:
+        rng: Gerador numpy
+        states: Array (n, ...) de estados
+        epsilons: Epsilon de cada estado (escalar ou array (n,))
+        action_size: Número de ações
+        q_values: Função (m, ...) -> (m, action_size) com os valores Q de um lote
+
+    Returns:
+        (ações (n,), número de linhas passadas a q_values)
+    """
+    n = len(states)
+    explore = rng.random(n) <= epsilons
+    actions = rng.integers(action_size, size=n)
+    greedy = np.flatnonzero(~explore)
+    if len(greedy):
+        actions[greedy] = np.argmax(q_values(states[greedy]), axis=1)
+    return actions, len(greedy)
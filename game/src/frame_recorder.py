@@ -0,0 +1,159 @@
+import struct
+import zlib
+import numpy as np
+import sys
+import os
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+# Formato do arquivo:
+#   cabeçalho: MAGIC, versão, largura, altura, canais, fps
+#   frames:    tipo, episódio, passo, número de retângulos, tamanho do payload,
+#              tabela de retângulos (x, y, w, h) e payload comprimido com zlib.
+# Um frame-chave guarda a imagem inteira; um frame delta guarda só os pixels
+# das regiões que mudaram em relação ao frame anterior.
+MAGIC = b'RKTF'
+VERSION = 1
+HEADER_FORMAT = '<4sHHHBf'
+FRAME_FORMAT = '<BIIHI'
+RECT_FORMAT = '<HHHH'
+
+KEY_FRAME = 0
+DELTA_FRAME = 1
+
+class FrameRecorder:
+    """
+    Grava frames RGB em um arquivo comprimido, em fluxo (sem guardar frames em memória).
+    """
+
+    def __init__(self, path, width, height, fps=config.FPS, compression_level=1):
+        """
+        Args:
+            path: Caminho do arquivo de saída
+            width: Largura dos frames (pixels)
+            height: Altura dos frames (pixels)
+            fps: Taxa de quadros nominal do vídeo
+            compression_level: Nível de compressão zlib (1 = mais rápido)
+        """
+        self.width = width
+        self.height = height
+        self.compression_level = compression_level
+        self.frames_written = 0
+        self._file = open(path, 'wb')
+        self._file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, width, height, 3, fps))
+
+    def add_frame(self, frame, changed_rects=None, episode=0, step=0):
+        """
+        Grava um frame.
+
+        Args:
+            frame: Array (altura, largura, 3) uint8
+            changed_rects: Regiões (pygame.Rect ou tuplas x, y, w, h) que mudaram desde o
+                           frame anterior; None grava um frame-chave completo
+            episode: Índice do episódio
+            step: Passo dentro do episódio
+        """
+        if changed_rects is None:
+            kind = KEY_FRAME
+            rects = []
+            payload = zlib.compress(np.ascontiguousarray(frame), self.compression_level)
+        else:
+            kind = DELTA_FRAME
+            rects = [tuple(rect) for rect in changed_rects if rect[2] > 0 and rect[3] > 0]
+            patches = b''.join(
+                frame[y:y + h, x:x + w].tobytes() for x, y, w, h in rects
+            )
+            payload = zlib.compress(patches, self.compression_level)
+
+        self._file.write(struct.pack(FRAME_FORMAT, kind, episode, step, len(rects), len(payload)))
+        for rect in rects:
+            self._file.write(struct.pack(RECT_FORMAT, *rect))
+        self._file.write(payload)
+        self.frames_written += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def read_frames(path):
+    """
+    Lê um arquivo gravado pelo FrameRecorder.
+
+    Gera tuplas (episódio, passo, frame). O frame é um buffer reaproveitado entre
+    iterações; copie-o se precisar guardá-lo.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(struct.calcsize(HEADER_FORMAT))
+        magic, version, width, height, channels, fps = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC:
+            raise ValueError(f"Arquivo de frames inválido: {path}")
+
+        frame = np.zeros((height, width, channels), dtype=np.uint8)
+        frame_header_size = struct.calcsize(FRAME_FORMAT)
+        rect_size = struct.calcsize(RECT_FORMAT)
+        while True:
+            frame_header = f.read(frame_header_size)
+            if len(frame_header) < frame_header_size:
+                break
+            kind, episode, step, num_rects, payload_size = struct.unpack(FRAME_FORMAT, frame_header)
+            rects = [struct.unpack(RECT_FORMAT, f.read(rect_size)) for _ in range(num_rects)]
+            data = zlib.decompress(f.read(payload_size))
+
+            if kind == KEY_FRAME:
+                frame[...] = np.frombuffer(data, dtype=np.uint8).reshape(frame.shape)
+            else:
+                offset = 0
+                for x, y, w, h in rects:
+                    size = w * h * channels
+                    frame[y:y + h, x:x + w] = np.frombuffer(data, dtype=np.uint8, count=size, offset=offset).reshape(h, w, channels)
+                    offset += size
+            yield episode, step, frame
+
+def record_episodes(env, select_action, path, episodes, record=None, frame_skip=1):
+    """
+    Executa episódios no ambiente e grava os frames dos episódios selecionados.
+
+    Args:
+        env: RocketEnvironment com render_mode='rgb_array'
+        select_action: Função estado -> ação
+        path: Caminho do arquivo de saída
+        episodes: Número de episódios a executar
+        record: Conjunto de índices de episódios a gravar (None grava todos)
+        frame_skip: Grava um a cada `frame_skip` passos
+
+    Returns:
+        Lista com a recompensa total de cada episódio.
+    """
+    scores = []
+    with FrameRecorder(path, env.width, env.height, fps=config.FPS / frame_skip) as recorder:
+        for episode in range(episodes):
+            recording = record is None or episode in record
+            state = env.reset()
+            total_reward = 0
+            done = False
+            step = 0
+            pending_rects = None  # None força um frame-chave no início do episódio
+            while True:
+                if recording:
+                    frame = env.render()
+                    if pending_rects is not None:
+                        pending_rects.extend(env.offscreen_renderer.changed_rects)
+                    # O último frame do episódio é sempre gravado
+                    if step % frame_skip == 0 or done:
+                        recorder.add_frame(frame, pending_rects, episode, step)
+                        pending_rects = []
+                if done:
+                    break
+                state, reward, done, info = env.step(select_action(state))
+                total_reward += reward
+                step += 1
+            scores.append(total_reward)
+    return scores
@@ -0,0 +1,202 @@
+import math
+import numpy as np
+import sys
+import os
+from .environment import RocketEnvironment
+from .physics import RocketBatch, world_from_environment
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+# Instantes (s) após o fim do plano em que o estado final é extrapolado
+LOOKAHEAD = (0.0, 0.5, 1.0, 2.0, 3.0)
+# Custo (pixels) por segundo de extrapolação: chegar antes é melhor
+TIME_COST = 50.0
+# Custo por pixel/s de velocidade na fase de pouso
+LANDING_SPEED_COST = 1.0
+# Custos da inclinação (por grau) e da rotação (por grau/s) no fim do plano
+TILT_COST = 0.5
+SPIN_COST = 0.2
+# Custo de uma queda prevista na extrapolação
+PREDICTED_CRASH_COST = 1000.0
+# Custo por pixel/s de descida acima da velocidade que ainda dá para frear
+DESCENT_COST = 10.0
+
+class CEMController:
+    """
+    Controlador preditivo (MPC) pelo método da entropia cruzada, sem aprendizado.
+
+    A cada tick, sorteia `population` planos de `horizon` ações (cada uma mantida
+    por `action_repeat` passos), simula todos de uma vez com RocketBatch a partir
+    do estado atual, reajusta a distribuição das ações aos `elites` melhores planos
+    por `iterations` rodadas e executa a primeira ação do melhor plano. A
+    distribuição é deslocada no tempo e reaproveitada no tick seguinte, então
+    mesmo com uma rodada por tick ela continua sendo refinada entre ticks.
+
+    O custo de um rollout é dominado pelo número de passos simulados, não pelo
+    número de planos: o padrão (1 rodada de 400 planos, 72 passos) cabe num
+    frame de 1/60 s, o que não acontece com várias rodadas menores.
+    """
+
+    def __init__(self, rng, env=None, horizon=12, population=400, elites=40, iterations=1,
+                 action_repeat=6, smoothing=0.3, min_probability=0.02):
+        """
+        Args:
+            rng: numpy.random.Generator usado na amostragem dos planos
+            env: RocketEnvironment com a geometria do cenário (padrão: um ambiente novo)
+            horizon: Número de ações por plano
+            population: Planos avaliados por iteração
+            elites: Melhores planos usados para reajustar a distribuição
+            iterations: Rodadas de reajuste por tick
+            action_repeat: Passos de física em que cada ação do plano é mantida
+            smoothing: Peso da distribuição anterior no reajuste
+            min_probability: Probabilidade mínima de cada ação (mantém a exploração)
+        """
+        self.rng = rng
+        env = env if env is not None else RocketEnvironment()
+        self.width = env.width
+        self.height = env.height
+        self.action_size = env.ACTION_SPACE_SIZE
+        self.horizon = horizon
+        self.population = population
+        self.elites = elites
+        self.iterations = iterations
+        self.action_repeat = action_repeat
+        self.smoothing = smoothing
+        self.min_probability = min_probability
+
+        self.world = world_from_environment(env)
+        landing_start, landing_end = env.platform_spans[env.landing_platform_index]
+        self.landing_x = (landing_start + landing_end) / 2
+        self.landing_half_width = (landing_end - landing_start) / 2
+        # Desaceleração vertical máxima (empuxo total de pé, menos a gravidade), com margem
+        self.brake_acceleration = 0.7 * (config.MAX_THRUST / env.rocket.massa - config.GRAVITY)
+        self.target_to_landing = math.hypot(self.landing_x - self.world["target_x"],
+                                            self.world["half_height"] - self.world["target_y"])
+        self.batch = RocketBatch(population, self.world)
+        self.reset()
+
+    def reset(self):
+        """Esquece o plano do episódio anterior."""
+        self.probabilities = np.full((self.horizon, self.action_size), 1.0 / self.action_size)
+        self.best_plan = None
+        self.tick = 0
+
+    def decode_state(self, state):
+        """Converte o vetor de estado normalizado do ambiente no estado físico do foguete."""
+        return {
+            "x": state[0] * self.width,
+            "y": state[1] * self.height,
+            "vx": state[2] * 1000.0,
+            "vy": state[3] * 1000.0,
+            "orientacao": state[4] * 360.0,
+            "angular_velocity": state[5] * 360.0,
+            "potencia": round(state[6] * 100.0),
+            "target_reached": state[9] > 0.5,
+        }
+
+    def _sample(self):
+        """Sorteia `population` planos (population, horizon) da distribuição atual."""
+        cdf = np.cumsum(self.probabilities, axis=1)
+        u = self.rng.random((self.population, self.horizon, 1)) * cdf[:, -1:]
+        plans = (u > cdf[None, :, :-1]).sum(axis=2)
+        if self.best_plan is not None:
+            plans[0] = self.best_plan
+        return plans
+
+    def _evaluate(self, plans, start):
+        """
+        Simula os planos a partir do estado `start` e retorna a pontuação de cada um.
+
+        A pontuação soma bônus de eventos (capturar o target, pousar) e penalidades
+        (queda), descontados pelo tempo em que ocorrem, e termina com o custo do
+        estado final: distância ao objetivo atual, velocidade e inclinação.
+        """
+        batch = self.batch
+        batch.fill(start["x"], start["y"], start["vx"], start["vy"], start["orientacao"],
+                   start["angular_velocity"], start["potencia"], target_reached=start["target_reached"])
+        score = np.zeros(self.population)
+        total_steps = self.horizon * self.action_repeat
+        step = 0
+        for h in range(self.horizon):
+            actions = plans[:, h]
+            for _ in range(self.action_repeat):
+                was_done = batch.done.copy()
+                captured, outcome = batch.step(actions)
+                urgency = 1.0 - 0.5 * step / total_steps
+                score += captured * (1000.0 * urgency)
+                score -= (batch.crashed & ~was_done) * 5000.0
+                score += (batch.done & ~was_done & ~batch.crashed) * (5000.0 * urgency)
+                step += 1
+            if batch.done.all():
+                break
+
+        world = self.world
+        goal_x = np.where(batch.target_reached, self.landing_x, world["target_x"])
+        goal_y = np.where(batch.target_reached, world["half_height"], world["target_y"])
+        # Antes da captura, a distância do target até a plataforma ainda falta percorrer
+        remaining_leg = np.where(batch.target_reached, 0.0, self.target_to_landing)
+
+        # Custo final: o horizonte é curto demais para subir até o target (só a
+        # rampa de potência leva mais de um segundo), então o estado final é
+        # extrapolado com o comando mantido (mesma solução fechada de predictor.py)
+        # e vale a menor distância ao objetivo nos instantes de LOOKAHEAD.
+        k = config.DRAG_COEFFICIENT / batch.massa
+        thrust = batch.potencia / 100.0 * config.MAX_THRUST / batch.massa
+        rad = np.radians(batch.orientacao)
+        terminal_x = thrust * np.cos(rad) / k
+        terminal_y = (thrust * np.sin(rad) - config.GRAVITY) / k
+        best = np.full(self.population, np.inf)
+        for tau in LOOKAHEAD:
+            decay = (1 - math.exp(-k * tau)) / k
+            x = batch.x + terminal_x * tau + (batch.vx - terminal_x) * decay
+            y = batch.y + terminal_y * tau + (batch.vy - terminal_y) * decay
+            remaining = math.exp(-k * tau)
+            speed = np.hypot(terminal_x + (batch.vx - terminal_x) * remaining,
+                             terminal_y + (batch.vy - terminal_y) * remaining)
+            # Chegar ao chão rápido demais ou fora da plataforma de pouso é uma queda prevista
+            grounded = y <= world["half_height"]
+            unsafe = (speed > world["speed_threshold"]) | (np.abs(x - self.landing_x) > self.landing_half_width)
+            cost = (np.hypot(x - goal_x, np.maximum(y, world["half_height"]) - goal_y)
+                    + remaining_leg + TIME_COST * tau + (grounded & unsafe) * PREDICTED_CRASH_COST)
+            # Na fase de pouso a velocidade na chegada também conta
+            cost += batch.target_reached * (LANDING_SPEED_COST * speed)
+            best = np.minimum(best, cost)
+        # Velocidade de descida que o motor ainda consegue anular antes do chão
+        safe_descent = np.sqrt(2 * self.brake_acceleration * np.maximum(batch.y - world["half_height"], 0.0))
+        best += DESCENT_COST * np.maximum(-batch.vy - safe_descent, 0.0)
+        tilt = np.abs(batch.orientacao - 90.0)
+        score -= np.where(batch.done, 0.0, best + TILT_COST * tilt + SPIN_COST * np.abs(batch.angular_velocity))
+        return score
+
+    def plan(self, start):
+        """Otimiza a distribuição dos planos a partir de `start` e retorna o melhor plano."""
+        # Reaproveita o plano anterior deslocado de uma ação a cada `action_repeat` ticks
+        if self.tick > 0 and self.tick % self.action_repeat == 0:
+            self.probabilities = np.vstack([self.probabilities[1:],
+                                            np.full((1, self.action_size), 1.0 / self.action_size)])
+            if self.best_plan is not None:
+                self.best_plan = np.append(self.best_plan[1:], self.best_plan[-1])
+        self.tick += 1
+
+        best_score = -np.inf
+        for _ in range(self.iterations):
+            plans = self._sample()
+            scores = self._evaluate(plans, start)
+            elite = plans[np.argpartition(scores, -self.elites)[-self.elites:]]
+            top = int(np.argmax(scores))
+            if scores[top] >= best_score:
+                best_score = scores[top]
+                self.best_plan = plans[top].copy()
+
+            counts = np.zeros((self.horizon, self.action_size))
+            np.add.at(counts, (np.arange(self.horizon)[None, :].repeat(self.elites, 0), elite), 1.0)
+            fitted = counts / self.elites
+            self.probabilities = self.smoothing * self.probabilities + (1 - self.smoothing) * fitted
+            self.probabilities = np.maximum(self.probabilities, self.min_probability)
+            self.probabilities /= self.probabilities.sum(axis=1, keepdims=True)
+        return self.best_plan
+
+    def act(self, state):
+        return int(self.plan(self.decode_state(state))[0])
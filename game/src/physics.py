@@ -0,0 +1,199 @@
+import math
+import numpy as np
+import sys
+import os
+from . import contact
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+# Decomposição das ações do RocketEnvironment em (variação de potência, sentido do torque)
+ACTION_THROTTLE = np.array([0, 1, -1, 0, 0, 1, 1, -1, -1])
+ACTION_ROTATION = np.array([0, 0, 0, 1, -1, 1, -1, 1, -1])
+
+# Métricas calculadas por RocketBatch.metrics (as mesmas de Rocket.compute_metrics)
+METRIC_NAMES = ('distance_to_target', 'angle_difference',
+                'distance_to_landing_platform_x', 'distance_to_landing_platform_y')
+
+class RocketBatch:
+    """
+    Estado de N foguetes em arrays, com a mesma física e as mesmas regras de
+    contato do RocketEnvironment (Rocket.atualizar + contact.py).
+
+    Usado para simular muitas trajetórias candidatas de uma vez (ex.: rollouts
+    do controlador MPC): um passo custa algumas dezenas de operações numpy,
+    independentemente do número de foguetes.
+    """
+
+    def __init__(self, n, world, massa=50.0):
+        """
+        Args:
+            n: Número de foguetes
+            world: Dicionário com a geometria do cenário (ver world_from_environment)
+            massa: Massa de cada foguete
+        """
+        self.world = world
+        self.massa = massa
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.vx = np.zeros(n)
+        self.vy = np.zeros(n)
+        self.orientacao = np.full(n, 90.0)
+        self.angular_velocity = np.zeros(n)
+        self.potencia = np.zeros(n)
+        self.fuel = np.zeros(n)
+        self.target_reached = np.zeros(n, dtype=bool)
+        self.landed = np.zeros(n, dtype=bool)
+        self.crashed = np.zeros(n, dtype=bool)
+        self.done = np.zeros(n, dtype=bool)
+
+    def __len__(self):
+        return len(self.x)
+
+    def fill(self, x, y, vx, vy, orientacao, angular_velocity, potencia, fuel=0.0,
+             target_reached=False, landed=False):
+        """Coloca todos os foguetes no mesmo estado (escalares) e limpa as flags de término."""
+        self.x[:] = x
+        self.y[:] = y
+        self.vx[:] = vx
+        self.vy[:] = vy
+        self.orientacao[:] = orientacao
+        self.angular_velocity[:] = angular_velocity
+        self.potencia[:] = potencia
+        self.fuel[:] = fuel
+        self.target_reached[:] = target_reached
+        self.landed[:] = landed
+        self.crashed[:] = False
+        self.done[:] = False
+
+    def fill_from_rocket(self, rocket):
+        """Coloca todos os foguetes no estado de um Rocket."""
+        self.fill(rocket.posicao[0], rocket.posicao[1], rocket.velocidade[0], rocket.velocidade[1],
+                  rocket.orientacao, rocket.angular_velocity, rocket.potencia_motor,
+                  rocket.fuel_consumed, rocket.target_reached, rocket.landed)
+
+    def step(self, actions, dt=1.0 / config.FPS):
+        """
+        Avança um passo com uma ação por foguete. Foguetes já terminados ficam parados.
+
+        Args:
+            actions: Array (n,) de ações inteiras do RocketEnvironment
+            dt: Passo de tempo (s)
+
+        Returns:
+            (capturou o target neste passo, código de contato de contact.py), arrays (n,)
+        """
+        world = self.world
+        # Máscara de foguetes ativos só é aplicada quando algum já terminou
+        active = ~self.done if self.done.any() else None
+
+        # Ações: potência em passos inteiros limitada a [0, 100] e torque
+        throttle = ACTION_THROTTLE[actions]
+        rotation = ACTION_ROTATION[actions]
+        if active is not None:
+            throttle = throttle * active
+            rotation = rotation * active
+        self.potencia = np.clip(self.potencia + throttle * config.POTENCIA_INCREMENTO, 0, 100)
+        self.angular_velocity += rotation * (world["angular_step"] * dt)
+
+        # Física com as operações na mesma ordem de Rocket.update_physics, para
+        # reproduzir o ambiente bit a bit; foguetes terminados não se movem
+        massa = self.massa
+        power_fraction = self.potencia / 100.0
+        thrust = power_fraction * config.MAX_THRUST
+        rad = np.radians(self.orientacao)
+        ax = (thrust * np.cos(rad) + -config.DRAG_COEFFICIENT * self.vx) / massa
+        ay = (thrust * np.sin(rad) + -config.DRAG_COEFFICIENT * self.vy - massa * config.GRAVITY) / massa
+        moving = dt if active is None else dt * active
+        self.vx += ax * moving
+        self.vy += ay * moving
+        self.x += self.vx * moving
+        self.y += self.vy * moving
+        self.orientacao += self.angular_velocity * moving
+        self.fuel += power_fraction * moving
+
+        captured = contact.target_captured(
+            self.x, self.y, world["target_x"], world["target_y"], world["target_radius"])
+        captured &= ~self.target_reached
+        if active is not None:
+            captured &= active
+        self.target_reached |= captured
+
+        # Regras de contato só quando algum foguete está na altura do chão
+        half_height = world["half_height"]
+        if not (self.y <= half_height).any():
+            self.landed &= self.potencia <= 0
+            return captured, np.zeros(len(self.x), dtype=np.int64)
+
+        outcome = contact.ground_contact(
+            self.x, self.y, self.vx, self.vy, self.potencia, half_height,
+            world["platforms"], world["landing_index"], world["speed_threshold"])
+        if active is not None:
+            outcome = outcome * active
+
+        crashed = outcome == contact.CRASHED
+        on_ground = outcome >= contact.RESTING
+        stopped = outcome >= contact.STOPPED
+        self.y = np.where(on_ground, half_height, self.y)
+        self.vy = np.where(on_ground, 0.0, self.vy)
+        self.vx = np.where(stopped, 0.0, self.vx)
+        self.angular_velocity = np.where(stopped, 0.0, self.angular_velocity)
+
+        landed_now = outcome == contact.LANDED
+        self.landed = landed_now | (self.landed & (self.potencia <= 0))
+        self.crashed |= crashed
+        self.done |= crashed | (landed_now & self.target_reached)
+        return captured, outcome
+
+    def metrics(self, which=None):
+        """
+        Métricas de Rocket.compute_metrics para todos os foguetes, em relação ao
+        target e à plataforma de pouso do cenário.
+
+        Args:
+            which: Nomes das métricas desejadas (padrão: todas); só essas são calculadas
+                   ('distance_to_target', 'angle_difference',
+                   'distance_to_landing_platform_x', 'distance_to_landing_platform_y')
+
+        Returns:
+            Dicionário nome -> array (n,)
+        """
+        world = self.world
+        which = METRIC_NAMES if which is None else which
+        result = {}
+        if 'distance_to_target' in which or 'angle_difference' in which:
+            dx = world["target_x"] - self.x
+            dy = world["target_y"] - self.y
+            if 'distance_to_target' in which:
+                result['distance_to_target'] = np.sqrt(dx**2 + dy**2)
+            if 'angle_difference' in which:
+                angle_to_target = np.degrees(np.arctan2(dy, dx))
+                result['angle_difference'] = np.abs((self.orientacao - angle_to_target + 180) % 360 - 180)
+        if 'distance_to_landing_platform_x' in which:
+            result['distance_to_landing_platform_x'] = np.abs(self.x - world["landing_center_x"])
+        if 'distance_to_landing_platform_y' in which:
+            result['distance_to_landing_platform_y'] = np.abs(self.y - world["landing_center_y"])
+        return result
+
+def world_from_environment(env):
+    """
+    Extrai de um RocketEnvironment a geometria usada por RocketBatch.
+
+    RocketBatch simula um target e uma plataforma de pouso: num percurso com
+    vários, valem o target atual e a plataforma de pouso principal.
+    """
+    return {
+        "target_x": float(env.target.posicao[0]),
+        "target_y": float(env.target.posicao[1]),
+        "target_radius": env.target.altura / 2,
+        "platforms": env.platform_spans,
+        "landing_index": env.landing_platform_index,
+        "half_height": env.rocket_height / 2,
+        "speed_threshold": env.landing_speed_threshold,
+        # Centro da plataforma de pouso principal, como em Rocket.compute_metrics
+        "landing_center_x": env.landing_platform.posicao[0] + env.landing_platform.comprimento / 2,
+        "landing_center_y": env.landing_platform.altura,
+        # Variação da velocidade angular (graus/s) por segundo de torque aplicado
+        "angular_step": math.degrees(config.ROTATION_TORQUE / env.rocket.moment_of_inercia),
+    }
@@ -0,0 +1,191 @@
+import math
+import numpy as np
+
+# Intensidades (escala de cinza) de cada elemento da cena
+PLATFORM_VALUE = 100
+TARGET_VALUE = 160
+ROCKET_VALUE = 255
+
+# Máximo de camadas estáticas guardadas (uma por conjunto de targets visíveis)
+MAX_CACHED_LAYERS = 256
+
+class PixelRasterizer:
+    """
+    Rasteriza a cena (plataformas, targets que faltam e foguete) direto em arrays
+    uint8 pequenos, sem superfícies do pygame.
+
+    As plataformas são desenhadas uma única vez; a camada estática de cada
+    conjunto de targets visíveis (os ainda não coletados) é montada na primeira
+    vez que aparece e guardada. A cada frame a camada é copiada e o foguete é
+    rasterizado apenas numa janela fixa ao redor do seu centro. Todas as
+    operações são vetorizadas e aceitam lotes de foguetes.
+    """
+
+    def __init__(self, env, size=(84, 84)):
+        """
+        Args:
+            env: RocketEnvironment cuja cena será rasterizada
+            size: (altura, largura) da imagem de saída em pixels
+        """
+        self.height, self.width = size
+        self.world_width = env.width
+        self.world_height = env.height
+        # Tamanho de um pixel da imagem em pixels do mundo
+        self.scale_x = env.width / self.width
+        self.scale_y = env.height / self.height
+
+        self.rocket_half_width = env.rocket_width / 2
+        self.rocket_half_height = env.rocket_height / 2
+
+        # Coordenadas do mundo dos centros dos pixels (y para cima)
+        self._pixel_x = (np.arange(self.width) + 0.5) * self.scale_x
+        self._pixel_y = self.world_height - (np.arange(self.height) + 0.5) * self.scale_y
+
+        xx, yy = np.meshgrid(self._pixel_x, self._pixel_y)
+        platforms = np.zeros((self.height, self.width), dtype=bool)
+        for platform in env.course.platforms:
+            platforms |= ((xx >= platform.posicao[0]) & (xx <= platform.posicao[0] + platform.comprimento)
+                          & (yy <= platform.altura + 10))
+
+        self.static_platforms = np.where(platforms, PLATFORM_VALUE, 0).astype(np.uint8)
+        # Pixels (linhas, colunas) de cada target do percurso
+        self._target_pixels = [
+            np.nonzero((xx - target.posicao[0])**2 + (yy - target.posicao[1])**2 <= (target.altura / 2)**2)
+            for target in env.course.targets]
+        self._all_visible = np.ones(len(self._target_pixels), dtype=bool)
+        self._none_visible = np.zeros(len(self._target_pixels), dtype=bool)
+        self._layers = {}
+
+        # Janela fixa (em pixels da imagem) que sempre contém o foguete, em qualquer orientação
+        radius = math.hypot(self.rocket_half_width, self.rocket_half_height)
+        self._window_rows = np.arange(-math.ceil(radius / self.scale_y) - 1, math.ceil(radius / self.scale_y) + 2)
+        self._window_cols = np.arange(-math.ceil(radius / self.scale_x) - 1, math.ceil(radius / self.scale_x) + 2)
+        # Mesma janela como grade 2D, para o caminho de um único foguete
+        self._window_row_grid, self._window_col_grid = np.meshgrid(self._window_rows, self._window_cols, indexing='ij')
+
+    def static_layer(self, visible):
+        """Plataformas mais os targets marcados em `visible` (array bool, um por target)."""
+        key = visible.tobytes()
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = self.static_platforms.copy()
+            for index in np.flatnonzero(visible):
+                layer[self._target_pixels[index]] = TARGET_VALUE
+            if len(self._layers) < MAX_CACHED_LAYERS:
+                self._layers[key] = layer
+        return layer
+
+    def render(self, out, x, y, orientacao, target_reached, collected=None):
+        """
+        Rasteriza um único foguete em `out` (altura, largura) uint8.
+
+        Com `collected` (array bool, um por target) são desenhados os targets
+        não coletados; sem ele, todos os targets até `target_reached`.
+        """
+        if target_reached:
+            visible = self._none_visible
+        elif collected is None:
+            visible = self._all_visible
+        else:
+            visible = ~collected
+        np.copyto(out, self.static_layer(visible))
+
+        center_row = math.floor((self.world_height - y) / self.scale_y)
+        center_col = math.floor(x / self.scale_x)
+        rows = self._window_row_grid + center_row
+        cols = self._window_col_grid + center_col
+        dx = (cols + 0.5) * self.scale_x - x
+        dy = (self.world_height - y) - (rows + 0.5) * self.scale_y
+
+        rad = math.radians(orientacao)
+        cos_a = math.cos(rad)
+        sin_a = math.sin(rad)
+        inside = ((np.abs(dx * cos_a + dy * sin_a) <= self.rocket_half_height)
+                  & (np.abs(dy * cos_a - dx * sin_a) <= self.rocket_half_width))
+        # Só confere os limites da imagem quando a janela sai dela
+        if (center_row + self._window_rows[0] < 0 or center_row + self._window_rows[-1] >= self.height
+                or center_col + self._window_cols[0] < 0 or center_col + self._window_cols[-1] >= self.width):
+            inside &= (rows >= 0) & (rows < self.height) & (cols >= 0) & (cols < self.width)
+        out[rows[inside], cols[inside]] = ROCKET_VALUE
+        return out
+
+    def render_batch(self, out, x, y, orientacao, target_reached, collected=None):
+        """
+        Rasteriza um lote de foguetes.
+
+        Args:
+            out: Array (N, altura, largura) uint8 que recebe as imagens
+            x, y: Posições dos centros dos foguetes (pixels do mundo), arrays (N,)
+            orientacao: Orientações (graus), array (N,)
+            target_reached: Se cada foguete já pegou o target, array (N,) bool
+            collected: Targets coletados por foguete, array (N, targets) bool
+                       (None = nenhum antes de target_reached)
+
+        Returns:
+            O próprio `out`.
+        """
+        if collected is None:
+            visible = np.broadcast_to(self._all_visible, (len(x), len(self._all_visible)))
+        else:
+            visible = ~np.asarray(collected, dtype=bool)
+        visible = visible & ~np.asarray(target_reached, dtype=bool)[:, np.newaxis]
+        # Uma camada por conjunto distinto de targets visíveis
+        sets, inverse = np.unique(visible, axis=0, return_inverse=True)
+        layers = np.stack([self.static_layer(row) for row in sets])
+        out[:] = layers[inverse.reshape(-1)]
+
+        # Pixel que contém o centro de cada foguete e janela ao redor
+        center_col = np.floor(x / self.scale_x).astype(np.int64)
+        center_row = np.floor((self.world_height - y) / self.scale_y).astype(np.int64)
+        rows = center_row[:, np.newaxis, np.newaxis] + self._window_rows[np.newaxis, :, np.newaxis]
+        cols = center_col[:, np.newaxis, np.newaxis] + self._window_cols[np.newaxis, np.newaxis, :]
+
+        # Coordenadas do mundo dos pixels da janela relativas ao centro do foguete
+        dx = (cols + 0.5) * self.scale_x - x[:, np.newaxis, np.newaxis]
+        dy = (self.world_height - (rows + 0.5) * self.scale_y) - y[:, np.newaxis, np.newaxis]
+
+        # Projeta nos eixos do foguete (ao longo do corpo e perpendicular)
+        rad = np.radians(orientacao)[:, np.newaxis, np.newaxis]
+        cos_a = np.cos(rad)
+        sin_a = np.sin(rad)
+        along = dx * cos_a + dy * sin_a
+        across = -dx * sin_a + dy * cos_a
+
+        inside = ((np.abs(along) <= self.rocket_half_height) & (np.abs(across) <= self.rocket_half_width)
+                  & (rows >= 0) & (rows < self.height) & (cols >= 0) & (cols < self.width))
+        rocket_index = np.broadcast_to(np.arange(len(x))[:, np.newaxis, np.newaxis], inside.shape)
+        out[rocket_index[inside], np.broadcast_to(rows, inside.shape)[inside],
+            np.broadcast_to(cols, inside.shape)[inside]] = ROCKET_VALUE
+        return out
+
+class FrameStack:
+    """
+    Empilhamento dos últimos `stack` frames num buffer circular, para um lote de ambientes.
+
+    Cada frame é escrito duas vezes (posições p e p + stack), de modo que os
+    `stack` frames mais recentes, em ordem cronológica, sempre formam uma fatia
+    contígua do buffer e podem ser lidos sem reordenar.
+    """
+
+    def __init__(self, num_envs, stack, height, width):
+        self.stack = stack
+        self.buffer = np.zeros((num_envs, 2 * stack, height, width), dtype=np.uint8)
+        self._position = 0
+
+    def push(self, frames):
+        """Adiciona um frame (N, altura, largura) por ambiente."""
+        self._position = (self._position + 1) % self.stack
+        self.buffer[:, self._position] = frames
+        self.buffer[:, self._position + self.stack] = frames
+
+    def reset(self, frames, env_index=None):
+        """Preenche a pilha com o frame inicial (todos os ambientes ou só `env_index`)."""
+        if env_index is None:
+            self.buffer[:] = frames[:, np.newaxis]
+        else:
+            self.buffer[env_index] = frames
+
+    def frames(self):
+        """View (N, stack, altura, largura) com os frames mais antigos primeiro."""
+        start = self._position + 1
+        return self.buffer[:, start:start + self.stack]
@@ -0,0 +1,139 @@
+import math
+import numpy as np
+import sys
+import os
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+from .mpc import CEMController
+
+# Ações do RocketEnvironment indexadas por (variação de potência, sentido de giro)
+# potência: +1 aumenta, -1 diminui; giro: +1 anti-horário, -1 horário
+ACTIONS = {
+    (0, 0): 0,
+    (1, 0): 1,
+    (-1, 0): 2,
+    (0, 1): 3,
+    (0, -1): 4,
+    (1, 1): 5,
+    (1, -1): 6,
+    (-1, 1): 7,
+    (-1, -1): 8,
+}
+
+class RandomPolicy:
+    """Escolhe ações uniformemente ao acaso."""
+
+    def __init__(self, action_size, rng):
+        self.action_size = action_size
+        self.rng = rng
+
+    def act(self, state):
+        return int(self.rng.integers(self.action_size))
+
+class ScriptedPolicy:
+    """
+    Controlador manual (sem aprendizado): voa até o target e depois pousa na
+    plataforma de pouso, usando apenas o vetor de estado do ambiente.
+    """
+
+    HOVER_POWER = 100.0 * 50 * config.GRAVITY / config.MAX_THRUST  # potência que equilibra a gravidade
+
+    def __init__(self, width=config.WIDTH, height=config.HEIGHT):
+        self.width = width
+        self.height = height
+
+    def act(self, state):
+        x = state[0] * self.width
+        y = state[1] * self.height
+        vx = state[2] * 1000.0
+        vy = state[3] * 1000.0
+        orientation = state[4] * 360.0
+        angular_velocity = state[5] * 360.0
+        power = state[6] * 100.0
+        target_reached = state[9] > 0.5
+
+        if not target_reached:
+            goal_x = state[7] * self.width
+            goal_y = state[8] * self.height
+        else:
+            goal_x = (state[12] + state[13] / 2) * self.width
+            goal_y = 0.0
+
+        # Velocidades desejadas proporcionais à distância até o objetivo
+        dx = goal_x - x
+        dy = goal_y - y
+        desired_vx = max(-150.0, min(150.0, 0.8 * dx))
+        if target_reached and abs(dx) > 40:
+            # Mantém altitude até ficar sobre a plataforma
+            desired_vy = max(-100.0, min(100.0, 1.5 * (150.0 - y)))
+        else:
+            desired_vy = max(-120.0, min(150.0, 1.5 * dy))
+
+        # Inclinação desejada para corrigir a velocidade horizontal (90° = de pé)
+        tilt = max(-25.0, min(25.0, 0.15 * (desired_vx - vx)))
+        desired_orientation = 90.0 - tilt
+        desired_angular_velocity = 3.0 * (desired_orientation - orientation)
+        rotate = 0
+        if angular_velocity < desired_angular_velocity - 2.0:
+            rotate = 1
+        elif angular_velocity > desired_angular_velocity + 2.0:
+            rotate = -1
+
+        # Potência para seguir a velocidade vertical desejada
+        sin_orientation = max(0.3, math.sin(math.radians(orientation)))
+        desired_power = (self.HOVER_POWER + 0.3 * (desired_vy - vy)) / sin_orientation
+        if target_reached and abs(dx) <= 40 and y < 30:
+            # Corta o motor perto do chão para completar o pouso
+            desired_power = 0.0
+        throttle = 0
+        if power < desired_power - 0.5:
+            throttle = 1
+        elif power > desired_power + 0.5:
+            throttle = -1
+
+        return ACTIONS[(throttle, rotate)]
+
+class ModelPolicy:
+    """Ação gulosa de um modelo Keras treinado (arquivo .h5)."""
+
+    def __init__(self, model_path):
+        # Import tardio: só carrega o TensorFlow quando um modelo é usado
+        from tensorflow.keras.models import load_model
+        self.model = load_model(model_path, compile=False)
+
+    def act(self, state):
+        q_values = self.model(state.reshape(1, -1), training=False)
+        return int(np.argmax(q_values[0]))
+
+def parse_options(text):
+    """Converte 'horizon=10,population=256' em {'horizon': 10, 'population': 256}."""
+    options = {}
+    for item in filter(None, text.split(',')):
+        key, value = item.split('=')
+        options[key.strip()] = float(value) if '.' in value else int(value)
+    return options
+
+def make_policy(spec, rng, action_size=9):
+    """
+    Cria uma política a partir de uma especificação textual.
+
+    Args:
+        spec: 'random', 'scripted', 'mpc', 'mpc:<opção>=<valor>,...' (argumentos de
+              CEMController, ex.: 'mpc:horizon=10,population=256') ou 'model:<caminho>'
+              (um caminho terminado em .h5 também é aceito)
+        rng: numpy.random.Generator usado pelas políticas estocásticas
+        action_size: Número de ações do ambiente
+    """
+    if spec == 'random':
+        return RandomPolicy(action_size, rng)
+    if spec == 'scripted':
+        return ScriptedPolicy()
+    if spec == 'mpc' or spec.startswith('mpc:'):
+        return CEMController(rng, **parse_options(spec[len('mpc:'):]))
+    if spec.startswith('model:'):
+        return ModelPolicy(spec[len('model:'):])
+    if spec.endswith('.h5'):
+        return ModelPolicy(spec)
+    raise ValueError(f"Política desconhecida: {spec}")
@@ -0,0 +1,192 @@
+import math
+import numpy as np
+import sys
+import os
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+# Previsão analítica do impacto com o chão.
+#
+# Com potência e orientação constantes, o movimento do Rocket é linear com arrasto:
+#     dv/dt = a - k v,   k = DRAG_COEFFICIENT / massa
+# cuja solução é v(t) = v∞ + (v0 - v∞) e^(-kt), com v∞ = a / k. A altura fica
+#     y(t) = y0 + u t + (w / k)(1 - e^(-kt)),   u = v∞y, w = v0y - u
+# e o instante em que y(t) = h sai em forma fechada pela função W de Lambert:
+#     t = W(z) / k - D / u,   D = y0 - h + w / k,   z = (w / u) e^(kD/u)
+# Para z < 0 há dois ramos reais (W0 e W-1) e o menor tempo positivo é o impacto.
+
+HALLEY_ITERATIONS = 12
+NEWTON_ITERATIONS = 8
+
+def _lambert_w_log(log_z):
+    """W0(z) para z > 0 a partir de ln z, via Newton em w + ln w = ln z (sem overflow)."""
+    w = np.where(log_z > 1, log_z - np.log(np.maximum(log_z, 1)), np.log1p(np.exp(np.minimum(log_z, 1))))
+    for _ in range(NEWTON_ITERATIONS):
+        w = w * (1 + log_z - np.log(w)) / (1 + w)
+    return w
+
+def _lambert_w_negative(z, branch):
+    """W0 (branch=0) ou W-1 (branch=-1) para -1/e <= z < 0, via iterações de Halley."""
+    p = np.sqrt(np.maximum(2 * (math.e * z + 1), 0))
+    if branch == 0:
+        w = -1 + p - p * p / 3 + 11 / 72 * p ** 3
+    else:
+        # Série no ponto de ramificação; perto de 0 usa a expansão assintótica
+        near_zero = z > -0.25
+        safe_log = np.log(np.where(near_zero, -z, 0.5))
+        w = np.where(near_zero, safe_log - np.log(-safe_log), -1 - p - p * p / 3 - 11 / 72 * p ** 3)
+    for _ in range(HALLEY_ITERATIONS):
+        ew = np.exp(w)
+        f = w * ew - z
+        denominator = ew * (w + 1) - (w + 2) * f / (2 * w + 2)
+        step = np.where(np.abs(denominator) > 1e-300, f / np.where(denominator == 0, 1, denominator), 0)
+        w = w - step
+    return w
+
+def predict_impact(x, y, vx, vy, orientacao, potencia, massa=50.0, ground=20.0):
+    """
+    Prevê o impacto com o chão de um lote de foguetes, mantendo potência e
+    orientação atuais (velocidade angular ignorada).
+
+    Args:
+        x, y: Posição do centro (pixels), escalares ou arrays
+        vx, vy: Velocidade (pixels/s)
+        orientacao: Orientação (graus)
+        potencia: Potência do motor (%)
+        massa: Massa do foguete
+        ground: Altura do centro no instante do contato (metade da altura do foguete)
+
+    Returns:
+        (tempo até o impacto em s, x do impacto, velocidade do impacto) como arrays;
+        tempo = inf (e x, velocidade = nan) quando o foguete não toca o chão.
+    """
+    x, y, vx, vy, orientacao, potencia = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (x, y, vx, vy, orientacao, potencia)))
+    k = config.DRAG_COEFFICIENT / massa
+    thrust = potencia / 100.0 * config.MAX_THRUST / massa
+    rad = np.radians(orientacao)
+    terminal_x = thrust * np.cos(rad) / k
+    u = (thrust * np.sin(rad) - config.GRAVITY) / k
+    w = vy - u
+    D = y - ground + w / k
+
+    with np.errstate(all='ignore'):
+        candidates = []
+        safe_u = np.where(u == 0, 1.0, u)
+        ratio = w / safe_u
+        exponent = k * D / safe_u
+
+        # z > 0: ramo principal em espaço log
+        positive = (ratio > 0) & (u != 0)
+        log_z = np.where(positive, np.log(np.where(positive, ratio, 1.0)) + exponent, 0.0)
+        candidates.append(np.where(positive, _lambert_w_log(log_z) / k - D / safe_u, np.inf))
+
+        # z = 0 (já na velocidade terminal vertical): movimento uniforme
+        uniform = (w == 0) & (u != 0)
+        candidates.append(np.where(uniform, -D / safe_u, np.inf))
+
+        # -1/e <= z < 0: dois ramos reais
+        z = np.where((ratio < 0) & (u != 0) & (exponent < 700), ratio * np.exp(np.minimum(exponent, 700)), np.nan)
+        negative = z >= -1 / math.e
+        z_safe = np.where(negative, z, -0.1)
+        for branch in (0, -1):
+            candidates.append(np.where(negative, _lambert_w_negative(z_safe, branch) / k - D / safe_u, np.inf))
+
+        # u = 0 (empuxo vertical equilibra a gravidade): y(t) = y0 + (w/k)(1 - e^(-kt))
+        balanced = u == 0
+        argument = np.where(balanced & (w != 0), D * k / np.where(w == 0, 1, w), np.nan)
+        candidates.append(np.where(balanced & (argument > 0) & (argument <= 1), -np.log(argument) / k, np.inf))
+
+        times = np.stack(candidates)
+        times = np.where(times >= -1e-9, np.maximum(times, 0), np.inf)
+        t = times.min(axis=0)
+        # Já no chão e descendo: impacto imediato
+        t = np.where((y <= ground) & (vy <= 0), 0.0, t)
+
+        decay = np.exp(-k * t)
+        impact_x = x + terminal_x * t + (vx - terminal_x) * (1 - decay) / k
+        impact_vx = terminal_x + (vx - terminal_x) * decay
+        impact_vy = u + w * decay
+        impact_speed = np.hypot(impact_vx, impact_vy)
+    hit = np.isfinite(t)
+    return t, np.where(hit, impact_x, np.nan), np.where(hit, impact_speed, np.nan)
+
+def predict_impact_single(rocket, ground=20.0):
+    """
+    Mesma previsão de predict_impact para um único Rocket.
+
+    Caminho escalar (math em vez de numpy) para uso a cada passo no ambiente e
+    no HUD, onde o custo fixo das operações numpy dominaria.
+
+    Returns:
+        (tempo, x do impacto, velocidade do impacto) ou (inf, nan, nan) sem impacto.
+    """
+    x, y = rocket.posicao
+    vx, vy = rocket.velocidade
+    if y <= ground and vy <= 0:
+        return 0.0, x, math.hypot(vx, vy)
+
+    k = config.DRAG_COEFFICIENT / rocket.massa
+    thrust = rocket.potencia_motor / 100.0 * config.MAX_THRUST / rocket.massa
+    rad = math.radians(rocket.orientacao)
+    terminal_x = thrust * math.cos(rad) / k
+    u = (thrust * math.sin(rad) - config.GRAVITY) / k
+    w = vy - u
+    D = y - ground + w / k
+
+    times = []
+    if u == 0:
+        if w != 0 and 0 < D * k / w <= 1:
+            times.append(-math.log(D * k / w) / k)
+    elif w == 0:
+        times.append(-D / u)
+    elif w / u > 0:
+        log_z = math.log(w / u) + k * D / u
+        times.append(_scalar_w_log(log_z) / k - D / u)
+    elif k * D / u < 700:
+        z = w / u * math.exp(k * D / u)
+        if z >= -1 / math.e:
+            for branch in (0, -1):
+                times.append(_scalar_w_negative(z, branch) / k - D / u)
+
+    times = [max(t, 0.0) for t in times if t >= -1e-9]
+    if not times:
+        return math.inf, math.nan, math.nan
+    t = min(times)
+    decay = math.exp(-k * t)
+    impact_x = x + terminal_x * t + (vx - terminal_x) * (1 - decay) / k
+    impact_speed = math.hypot(terminal_x + (vx - terminal_x) * decay, u + w * decay)
+    return t, impact_x, impact_speed
+
+def _scalar_w_log(log_z):
+    w = log_z - math.log(log_z) if log_z > 1 else math.log1p(math.exp(log_z))
+    for _ in range(NEWTON_ITERATIONS):
+        previous = w
+        w = w * (1 + log_z - math.log(w)) / (1 + w)
+        if abs(w - previous) <= 1e-12 * abs(w):
+            break
+    return w
+
+def _scalar_w_negative(z, branch):
+    p = math.sqrt(max(2 * (math.e * z + 1), 0))
+    if branch == 0:
+        w = -1 + p - p * p / 3 + 11 / 72 * p ** 3
+    elif z > -0.25:
+        w = math.log(-z) - math.log(-math.log(-z))
+    else:
+        w = -1 - p - p * p / 3 - 11 / 72 * p ** 3
+    for _ in range(HALLEY_ITERATIONS):
+        if w == -1:
+            break  # exatamente no ponto de ramificação
+        ew = math.exp(w)
+        f = w * ew - z
+        denominator = ew * (w + 1) - (w + 2) * f / (2 * w + 2)
+        if denominator == 0:
+            break
+        step = f / denominator
+        w -= step
+        if abs(step) <= 1e-12 * abs(w):
+            break
+    return w
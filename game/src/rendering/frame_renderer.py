@@ -0,0 +1,131 @@
+import time
+import numpy as np
+import pygame
+
+class FullFrameRenderer:
+    """
+    Renderização tradicional: redesenha o fundo inteiro e envia a tela toda a cada frame.
+    """
+
+    name = "full"
+
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.background = background
+        # Soma e contagem dos tempos de frame (memória constante em sessões longas)
+        self.frame_count = 0
+        self._frame_time_total = 0.0
+        self._frame_start = None
+
+    def begin_frame(self):
+        """Prepara a tela para um novo frame."""
+        self._frame_start = time.perf_counter()
+        self.screen.blit(self.background, (0, 0))
+
+    def add(self, rect):
+        """Registra uma região desenhada no frame atual. Retorna o próprio retângulo."""
+        return rect
+
+    def invalidate(self):
+        """Força o envio da tela inteira no próximo frame."""
+
+    def present(self):
+        """Envia o frame para o display."""
+        pygame.display.flip()
+        self._end_frame()
+
+    def _end_frame(self):
+        """Contabiliza o tempo do frame desde begin_frame."""
+        self._frame_time_total += time.perf_counter() - self._frame_start
+        self.frame_count += 1
+
+    def average_frame_time(self):
+        """Tempo médio (s) gasto entre begin_frame e present."""
+        if not self.frame_count:
+            return 0.0
+        return self._frame_time_total / self.frame_count
+
+class DirtyRectRenderer(FullFrameRenderer):
+    """
+    Renderização por retângulos sujos.
+
+    Só restaura o fundo sob as regiões desenhadas no frame anterior e só envia
+    ao display as regiões que mudaram (as do frame anterior e as do atual).
+    Todo desenho do frame deve ser registrado com add().
+    """
+
+    name = "dirty"
+
+    def __init__(self, screen, background):
+        super().__init__(screen, background)
+        self._previous_rects = []
+        self._current_rects = []
+        self._full_redraw = True
+
+    def begin_frame(self):
+        self._frame_start = time.perf_counter()
+        if self._full_redraw:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self._previous_rects:
+                self.screen.blit(self.background, rect, rect)
+        self._current_rects = []
+
+    def add(self, rect):
+        if rect is not None and rect.width > 0 and rect.height > 0:
+            self._current_rects.append(rect)
+        return rect
+
+    def invalidate(self):
+        self._full_redraw = True
+
+    def present(self):
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._previous_rects + self._current_rects)
+        self._previous_rects = self._current_rects
+        self._end_frame()
+
+class OffscreenRenderer(DirtyRectRenderer):
+    """
+    Renderização sem display para um buffer NumPy (altura, largura, 3) em RGB.
+
+    A superfície de desenho é criada sobre o próprio buffer (pygame.image.frombuffer),
+    então o mesmo array é reaproveitado a cada frame e pode ser devolvido sem cópia.
+    Após present(), `changed_rects` contém as regiões que mudaram em relação ao
+    frame anterior, ou None quando o frame inteiro foi redesenhado.
+    """
+
+    name = "offscreen"
+
+    def __init__(self, background, size):
+        width, height = size
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+        screen = pygame.image.frombuffer(self.pixels, size, 'RGB')
+
+        # Fundo no mesmo formato do buffer para restaurações rápidas
+        self._background_pixels = np.zeros_like(self.pixels)
+        background_surf = pygame.image.frombuffer(self._background_pixels, size, 'RGB')
+        background_surf.blit(pygame.transform.scale(background, size), (0, 0))
+
+        super().__init__(screen, background_surf)
+        self.changed_rects = None
+
+    def present(self):
+        if self._full_redraw:
+            self.changed_rects = None
+            self._full_redraw = False
+        else:
+            bounds = self.screen.get_rect()
+            self.changed_rects = [rect.clip(bounds) for rect in self._previous_rects + self._current_rects]
+        self._previous_rects = self._current_rects
+        self._end_frame()
+        return self.pixels
+
+def make_renderer(screen, background, dirty_rects=False):
+    """Cria o renderizador escolhido pela flag `dirty_rects`."""
+    if dirty_rects:
+        return DirtyRectRenderer(screen, background)
+    return FullFrameRenderer(screen, background)
@@ -0,0 +1,206 @@
+import math
+import sys
+import os
+from collections import OrderedDict
+import pygame
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import config
+
+HUD_BG_COLOR = (0, 0, 0, 150)
+HUD_BORDER_COLOR = (200, 200, 200)
+HUD_BORDER_RADIUS = 15
+HUD_TEXT_COLOR = (255, 255, 255)
+
+THRUST_BAR_WIDTH = 20
+THRUST_BAR_HEIGHT = 100
+ORIENTATION_ARROW_LENGTH = 80
+
+def draw_arrow(surface, color, start, end, head_length=config.ARROW_HEAD_LENGTH, head_angle=config.ARROW_HEAD_ANGLE):
+    pygame.draw.line(surface, color, start, end, 3)
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    angle = math.atan2(dy, dx)
+    angle1 = angle + math.radians(head_angle)
+    angle2 = angle - math.radians(head_angle)
+    x1 = end[0] - head_length * math.cos(angle1)
+    y1 = end[1] - head_length * math.sin(angle1)
+    x2 = end[0] - head_length * math.cos(angle2)
+    y2 = end[1] - head_length * math.sin(angle2)
+    pygame.draw.polygon(surface, color, [end, (x1, y1), (x2, y2)])
+
+class TextCache:
+    """Cache LRU de textos renderizados, indexado pela string formatada e pela cor."""
+
+    def __init__(self, font, max_size=128):
+        self.font = font
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+
+    def render(self, text, color=HUD_TEXT_COLOR):
+        key = (text, color)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            return surf
+
+        surf = self.font.render(text, True, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surf
+
+class Hud:
+    """
+    Painel de HUD com partes estáticas pré-renderizadas.
+
+    O fundo, a borda e os rótulos fixos são desenhados uma única vez. A barra de
+    potência e as setas de velocidade/orientação são compostas sobre uma cópia
+    desse painel apenas quando os valores exibidos mudam, e os textos dinâmicos
+    passam por um TextCache.
+    """
+
+    def __init__(self, font, width=config.WIDTH, height=config.HEIGHT):
+        self.panel_rect = pygame.Rect(width//2 - 300, height - 220, 600, 200)
+        self.text_cache = TextCache(font)
+
+        # Centros dos grupos em coordenadas locais do painel
+        local_rect = pygame.Rect(0, 0, self.panel_rect.width, self.panel_rect.height)
+        self.thrust_group_center = (local_rect.centerx - 150, local_rect.centery + 20)
+        self.speed_group_center = (local_rect.centerx, local_rect.centery + 20)
+        self.orientation_group_center = (local_rect.centerx + 150, local_rect.centery + 20)
+        self.thrust_bar_rect = pygame.Rect(
+            self.thrust_group_center[0] - THRUST_BAR_WIDTH // 2,
+            self.thrust_group_center[1] - THRUST_BAR_HEIGHT // 2,
+            THRUST_BAR_WIDTH,
+            THRUST_BAR_HEIGHT
+        )
+
+        self.panel_surface = self._render_panel(font)
+        self.composed_surface = self.panel_surface
+        self._gauge_key = None
+
+    def _render_panel(self, font):
+        """Desenha fundo, borda e rótulos fixos do painel."""
+        panel = pygame.Surface(self.panel_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(panel, HUD_BG_COLOR, panel.get_rect(), border_radius=HUD_BORDER_RADIUS)
+        pygame.draw.rect(panel, HUD_BORDER_COLOR, panel.get_rect(), 2, border_radius=HUD_BORDER_RADIUS)
+
+        labels = [
+            ("Thrust", (self.thrust_group_center[0], self.thrust_bar_rect.top - 15)),
+            ("Speed", (self.speed_group_center[0], self.speed_group_center[1] - 65)),
+            ("Orientation", (self.orientation_group_center[0], self.orientation_group_center[1] - 65)),
+        ]
+        for text, center in labels:
+            label = font.render(text, True, HUD_TEXT_COLOR)
+            panel.blit(label, label.get_rect(center=center))
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        return panel
+
+    @staticmethod
+    def _arrow_length(velocity, blink_on):
+        """Comprimento (com sinal) da seta de velocidade, ou 0 se ela não deve aparecer."""
+        if abs(velocity) < config.MIN_VELOCITY_DISPLAY:
+            return 0
+        length = abs(velocity) * config.ARROW_SCALE
+        if length > config.MAX_ARROW_LENGTH:
+            # Seta saturada pisca
+            if not blink_on:
+                return 0
+            length = config.MAX_ARROW_LENGTH
+        return int(round(math.copysign(length, velocity)))
+
+    def _render_gauges(self, potencia, arrow_x, arrow_y, orientacao):
+        """Compõe barra e setas sobre uma cópia do painel estático."""
+        gauges = self.panel_surface.copy()
+
+        bar = self.thrust_bar_rect
+        pygame.draw.rect(gauges, (50, 50, 50), bar)
+        filled_height = (potencia / 100.0) * bar.height
+        pygame.draw.rect(gauges, (0, 255, 0), (bar.x, bar.y + (bar.height - filled_height), bar.width, filled_height))
+        pygame.draw.rect(gauges, (255, 255, 255), bar, 2)
+
+        cx, cy = self.speed_group_center
+        if arrow_x:
+            draw_arrow(gauges, (255, 0, 0), (cx, cy), (cx + arrow_x, cy))
+        if arrow_y:
+            draw_arrow(gauges, (0, 0, 255), (cx, cy), (cx, cy - arrow_y))
+
+        rad = math.radians(orientacao)
+        dir_x = math.cos(rad)
+        dir_y = -math.sin(rad)
+        half_length = ORIENTATION_ARROW_LENGTH / 2
+        ox, oy = self.orientation_group_center
+        draw_arrow(gauges, (255, 255, 0),
+                   (ox - half_length * dir_x, oy - half_length * dir_y),
+                   (ox + half_length * dir_x, oy + half_length * dir_y))
+        self.composed_surface = gauges
+
+    def _blit_text(self, surface, text, center):
+        text_surf = self.text_cache.render(text)
+        surface.blit(text_surf, text_surf.get_rect(center=center))
+
+    def draw(self, surface, foguete, origin, blink_timer):
+        """
+        Desenha o HUD.
+
+        Args:
+            surface: Superfície de destino
+            foguete: Foguete cujo estado é exibido
+            origin: Posição (x, y) inicial do foguete, usada como origem da posição exibida (pixels)
+            blink_timer: Temporizador de piscar das setas saturadas
+
+        Returns:
+            O retângulo da tela ocupado pelo HUD.
+        """
+        rect = self.panel_rect
+        blink_on = blink_timer <= config.BLINK_INTERVAL / 2
+        gauge_key = (
+            foguete.potencia_motor,
+            self._arrow_length(foguete.velocidade[0], blink_on),
+            self._arrow_length(foguete.velocidade[1], blink_on),
+            round(foguete.orientacao % 360, 1),
+        )
+        if gauge_key != self._gauge_key:
+            self._render_gauges(*gauge_key)
+            self._gauge_key = gauge_key
+        surface.blit(self.composed_surface, rect.topleft)
+
+        pos_x_m = (foguete.posicao[0] - origin[0]) / config.PIXELS_PER_METER
+        pos_y_m = (foguete.posicao[1] - origin[1]) / config.PIXELS_PER_METER
+        speed_result = math.sqrt(foguete.velocidade[0]**2 + foguete.velocidade[1]**2) / config.PIXELS_PER_METER
+
+        self._blit_text(surface, f"Pos: {pos_x_m:.2f}:{pos_y_m:.2f} m", (rect.centerx, rect.top + 15))
+        self._blit_text(surface, f"Fuel: {foguete.fuel_consumed:.2f}", (rect.centerx - 100, rect.bottom - 20))
+        self._blit_text(surface, f"Speed: {speed_result:.2f} m/s", (rect.centerx + 100, rect.bottom - 20))
+        self._blit_text(surface, f"Thrust: {foguete.potencia_motor}%", (rect.centerx - 200, rect.top + 40))
+        self._blit_text(surface, f"Angle: {foguete.orientacao:.2f}", (rect.centerx + 200, rect.top + 40))
+        return rect
+
+def draw_impact_prediction(surface, text_cache, prediction, height, speed_threshold=config.LANDING_SPEED_THRESHOLD):
+    """
+    Desenha a previsão do impacto: marcador no chão e tempo/velocidade previstos.
+
+    Args:
+        surface: Superfície de destino
+        text_cache: TextCache usado para o texto
+        prediction: (tempo, x do impacto, velocidade do impacto) de predict_impact_single
+        height: Altura da tela (pixels)
+        speed_threshold: Velocidade máxima de um pouso seguro (verde abaixo, vermelho acima)
+
+    Returns:
+        O retângulo da tela ocupado, ou None se não há impacto previsto.
+    """
+    time_to_impact, impact_x, impact_speed = prediction
+    if not math.isfinite(time_to_impact):
+        return None
+    color = (0, 255, 0) if impact_speed <= speed_threshold else (255, 0, 0)
+    x = int(round(impact_x))
+    ground_y = height - 10
+    marker = pygame.draw.polygon(surface, color, [(x, ground_y), (x - 8, ground_y - 14), (x + 8, ground_y - 14)])
+    text = text_cache.render(f"{time_to_impact:.1f} s  {impact_speed / config.PIXELS_PER_METER:.1f} m/s", color)
+    text_rect = text.get_rect(midbottom=(x, ground_y - 18))
+    text_rect.clamp_ip(surface.get_rect())
+    return marker.union(surface.blit(text, text_rect))
@@ -0,0 +1,69 @@
+import sys
+import os
+import pygame
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import config
+
+class RocketSpriteCache:
+    """
+    Cache de sprites do foguete pré-rotacionados.
+
+    O foguete é desenhado uma única vez e rotacionado para todos os ângulos
+    múltiplos de `angle_resolution`. Desenhar um frame vira uma busca no
+    dicionário e um único blit.
+    """
+
+    def __init__(self, rocket_width, rocket_height, angle_resolution=config.SPRITE_ANGLE_RESOLUTION):
+        """
+        Args:
+            rocket_width: Largura do foguete (pixels)
+            rocket_height: Altura do foguete (pixels)
+            angle_resolution: Passo angular entre sprites pré-rotacionados (graus)
+        """
+        self.rocket_width = rocket_width
+        self.rocket_height = rocket_height
+        self.num_angles = max(1, int(round(360.0 / angle_resolution)))
+        self.angle_resolution = 360.0 / self.num_angles
+
+        base_surf = self._render_base()
+        # convert_alpha só é possível depois que o modo de vídeo foi definido
+        can_convert = pygame.display.get_surface() is not None
+
+        # índice do ângulo -> (superfície rotacionada, deslocamento do canto superior esquerdo ao centro)
+        self.sprites = {}
+        for index in range(self.num_angles):
+            rotated_surf = pygame.transform.rotate(base_surf, index * self.angle_resolution)
+            if can_convert:
+                rotated_surf = rotated_surf.convert_alpha()
+            offset = (-(rotated_surf.get_width() // 2), -(rotated_surf.get_height() // 2))
+            self.sprites[index] = (rotated_surf, offset)
+
+    def _render_base(self):
+        """Desenha o foguete de pé (orientação de 90°) numa superfície transparente."""
+        rocket_width, rocket_height = self.rocket_width, self.rocket_height
+        rocket_surf = pygame.Surface((rocket_width, rocket_height), pygame.SRCALPHA)
+        rocket_surf.fill((0, 0, 0, 0))
+
+        body_rect = pygame.Rect(0, 10, rocket_width, rocket_height - 10)
+        pygame.draw.rect(rocket_surf, (200, 0, 0), body_rect)
+        pygame.draw.polygon(rocket_surf, (255, 0, 0), [(0, 10), (rocket_width, 10), (rocket_width/2, 0)])
+        pygame.draw.polygon(rocket_surf, (150, 150, 150), [(0, rocket_height), (5, rocket_height - 10), (0, rocket_height - 10)])
+        pygame.draw.polygon(rocket_surf, (150, 150, 150), [(rocket_width, rocket_height), (rocket_width - 5, rocket_height - 10), (rocket_width, rocket_height - 10)])
+        return rocket_surf
+
+    def get(self, orientacao):
+        """Retorna (superfície, deslocamento) do sprite mais próximo da orientação (graus)."""
+        index = int(round((orientacao - 90) / self.angle_resolution)) % self.num_angles
+        return self.sprites[index]
+
+    def draw(self, surface, x, y, orientacao, screen_height):
+        """
+        Desenha o foguete centrado em (x, y), em coordenadas da simulação (y para cima).
+
+        Returns:
+            O retângulo da tela afetado pelo blit.
+        """
+        rocket_surf, offset = self.get(orientacao)
+        return surface.blit(rocket_surf, (int(x) + offset[0], screen_height - int(y) + offset[1]))
@@ -0,0 +1,45 @@
+import pygame
+
+PLATFORM_COLOR = (100, 100, 100)
+TARGET_COLOR = (255, 0, 0)
+
+def draw_world(surface, env, rocket_sprites, rocket_pose=None):
+    """
+    Desenha plataformas, target e foguete do ambiente.
+
+    Args:
+        surface: Superfície de destino (mesma altura do ambiente)
+        env: RocketEnvironment com os objetos a desenhar
+        rocket_sprites: RocketSpriteCache do foguete
+        rocket_pose: Pose (x, y, orientação) a desenhar; por padrão a pose atual do foguete
+
+    Returns:
+        Lista com os retângulos da tela afetados.
+    """
+    height = env.height
+    rects = []
+    for platform in env.course.platforms:
+        rects.append(pygame.draw.rect(
+            surface,
+            PLATFORM_COLOR,
+            (platform.posicao[0], height - 10, platform.comprimento, 10)
+        ))
+
+    foguete = env.rocket
+    # Desenha os targets que faltam com aro de espessura maior (4)
+    for target, collected in zip(env.course.targets, env.collected):
+        if collected:
+            continue
+        rects.append(pygame.draw.circle(
+            surface,
+            TARGET_COLOR,
+            (int(target.posicao[0]), height - int(target.posicao[1])),
+            int(target.altura / 2),
+            4
+        ))
+
+    if not foguete.crashed:
+        if rocket_pose is None:
+            rocket_pose = (foguete.posicao[0], foguete.posicao[1], foguete.orientacao)
+        rects.append(rocket_sprites.draw(surface, rocket_pose[0], rocket_pose[1], rocket_pose[2], height))
+    return rects
@@ -0,0 +1,132 @@
+import numpy as np
+
+# Memória de replay compacta para o DQNAgent.
+#
+# Em vez de tuplas (state, action, reward, next_state, done) com dois arrays
+# float64 cada, as observações ficam num buffer circular único, uma por slot,
+# e o next_state de uma transição é a observação do slot seguinte. A
+# observação final de cada episódio ocupa um slot extra (sem transição). As
+# observações podem ser guardadas em float16 ou quantizadas em uint16/uint8
+# com escala e offset por feature (ver RocketEnvironment.state_bounds); a
+# conversão de volta para float32 é feita no lote inteiro, na amostragem.
+
+# Tipos de armazenamento das observações
+STORAGE_DTYPES = ('float32', 'float16', 'uint16', 'uint8')
+
+class ReplayMemory:
+    """Buffer circular de transições com observações armazenadas uma única vez."""
+
+    def __init__(self, capacity, state_shape, dtype='uint16', low=None, high=None):
+        """
+        Args:
+            capacity: Número de slots (transições mais a observação final de cada episódio)
+            state_shape: Formato de uma observação (int ou tupla)
+            dtype: Armazenamento das observações (ver STORAGE_DTYPES)
+            low, high: Limites de cada feature, obrigatórios para uint16/uint8;
+                       valores fora deles são saturados
+        """
+        if dtype not in STORAGE_DTYPES:
+            raise ValueError(f"Armazenamento desconhecido: {dtype} (opções: {', '.join(STORAGE_DTYPES)})")
+        self.capacity = capacity
+        self.state_shape = (state_shape,) if np.isscalar(state_shape) else tuple(state_shape)
+        self.dtype = np.dtype(dtype)
+        self.quantized = self.dtype.kind == 'u'
+        if self.quantized:
+            if low is None or high is None:
+                raise ValueError(f"Armazenamento {dtype} exige os limites low e high de cada feature")
+            self.low = np.broadcast_to(np.asarray(low, dtype=np.float32), self.state_shape).copy()
+            self.high = np.broadcast_to(np.asarray(high, dtype=np.float32), self.state_shape).copy()
+            levels = np.iinfo(self.dtype).max
+            self.scale = (self.high - self.low) / levels
+            # Features constantes: qualquer escala serve, o código é sempre 0
+            self.scale[self.scale == 0] = 1.0
+
+        self.observations = np.zeros((capacity,) + self.state_shape, dtype=self.dtype)
+        self.actions = np.zeros(capacity, dtype=np.uint8)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=bool)
+        # Slots cujo next_state (slot seguinte) já foi gravado
+        self.valid = np.zeros(capacity, dtype=bool)
+
+        self.head = 0           # próximo slot a gravar (o mais antigo)
+        self.size = 0           # transições válidas
+        self._pending = None    # next_state da última transição, ainda não gravado
+        self._pending_slot = None
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """Bytes ocupados pelos arrays do buffer."""
+        return (self.observations.nbytes + self.actions.nbytes + self.rewards.nbytes
+                + self.dones.nbytes + self.valid.nbytes)
+
+    def quantize(self, states):
+        """Converte observações (uma ou um lote) para o tipo de armazenamento."""
+        states = np.asarray(states, dtype=np.float32)
+        if not self.quantized:
+            return states.astype(self.dtype)
+        states = np.clip(states, self.low, self.high)
+        return np.rint((states - self.low) / self.scale).astype(self.dtype)
+
+    def dequantize(self, codes):
+        """Converte um lote armazenado de volta para float32."""
+        if not self.quantized:
+            return codes.astype(np.float32)
+        return self.low + codes.astype(np.float32) * self.scale
+
+    def _write(self, state, action=0, reward=0.0, done=False):
+        """Grava uma observação no slot `head` e retorna o slot."""
+        slot = self.head
+        if self.valid[slot]:
+            self.size -= 1
+            self.valid[slot] = False
+        self.observations[slot] = self.quantize(state)
+        self.actions[slot] = action
+        self.rewards[slot] = reward
+        self.dones[slot] = done
+        self.head = (slot + 1) % self.capacity
+        return slot
+
+    def _close_pending(self):
+        """Grava o next_state pendente num slot próprio (fim de episódio)."""
+        self._write(self._pending)
+        self._link_pending()
+
+    def _link_pending(self):
+        self.valid[self._pending_slot] = True
+        self.size += 1
+        self._pending = None
+        self._pending_slot = None
+
+    def append(self, state, action, reward, next_state, done):
+        """Guarda uma transição; a interface é a mesma de DQNAgent.remember."""
+        if self._pending is not None:
+            if state is self._pending or np.array_equal(state, self._pending):
+                # Continuação do episódio: o next_state pendente é este state
+                slot = self._write(state, action, reward, done)
+                self._link_pending()
+            else:
+                # Episódio anterior interrompido sem done (ex.: limite de passos do treino)
+                self._close_pending()
+                slot = self._write(state, action, reward, done)
+        else:
+            slot = self._write(state, action, reward, done)
+        self._pending = next_state
+        self._pending_slot = slot
+        if done:
+            self._close_pending()
+
+    def sample(self, batch_size, rng):
+        """
+        Sorteia `batch_size` transições distintas.
+
+        Returns:
+            (states, actions, rewards, next_states, dones), com os estados em float32
+        """
+        indices = rng.choice(np.flatnonzero(self.valid), batch_size, replace=False)
+        next_indices = (indices + 1) % self.capacity
+        states = self.dequantize(self.observations[indices])
+        next_states = self.dequantize(self.observations[next_indices])
+        return states, self.actions[indices], self.rewards[indices], next_states, self.dones[indices]
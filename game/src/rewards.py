@@ -0,0 +1,210 @@
+# Especificações de recompensa do RocketEnvironment.
+#
+# Uma RewardSpec é uma lista de termos. O método evaluate() de cada termo recebe
+# as métricas do passo anterior e do atual (dicionários nome -> valor, ver
+# METRICS) e devolve sua parcela da recompensa. Os termos usam só aritmética e
+# comparações, como contact.py: com escalares Python avaliam um passo do
+# ambiente; com arrays numpy avaliam de uma vez lotes inteiros de passos (ex.:
+# todas as transições de um episódio gravado, ou os rollouts de RocketBatch).
+#
+# Para o passo escalar do ambiente, a RewardSpec compila os termos numa única
+# função Python (evaluate_scalar) sobre tuplas de métricas na ordem de METRICS.
+# O método source() de cada termo devolve as linhas de código que somam a sua
+# parcela a `total`, com as mesmas contas de evaluate() e pulando as parcelas
+# nulas: sem dicionários nem uma chamada por termo.
+
+import numpy as np
+
+# Métricas disponíveis para os termos
+METRICS = (
+    'distance_to_target',       # distância até o target (pixels)
+    'angle_difference',         # diferença entre a orientação e a direção do target (graus)
+    'landing_distance_x',       # distância horizontal até o centro da plataforma de pouso
+    'landing_distance_y',       # distância vertical até a plataforma de pouso
+    'power',                    # potência do motor (%)
+    'fuel_consumed',            # combustível consumido no episódio
+    'target_reached',           # já pegou o target
+    'target_captured',          # pegou o target neste passo
+    'crashed',                  # caiu neste passo
+    'landed_with_target',       # pousou neste passo depois de pegar o target (fim da missão)
+    'landed_without_target',    # pousou neste passo sem o target
+)
+
+def stack_metrics(metrics):
+    """
+    Empilha uma sequência de dicionários de métricas (um por passo) num único
+    dicionário nome -> array, pronto para avaliar todos os passos de uma vez.
+    """
+    return {name: np.array([m[name] for m in metrics]) for name in METRICS}
+
+def _positive_part(value):
+    """max(value, 0) para escalares e arrays."""
+    return value * (value > 0)
+
+class Improvement:
+    """`reward` quando a métrica diminui em relação ao passo anterior, `-penalty` caso contrário."""
+
+    def __init__(self, name, metric, reward, penalty=0.0, gate=None):
+        """
+        Args:
+            name: Nome do termo no detalhamento da recompensa
+            metric: Métrica comparada (ver METRICS)
+            reward: Valor quando a métrica diminui
+            penalty: Valor descontado quando não diminui
+            gate: Métrica booleana que habilita o termo (None = sempre)
+        """
+        self.name = name
+        self.metric = metric
+        self.reward = reward
+        self.penalty = penalty
+        self.gate = gate
+
+    def evaluate(self, previous, current):
+        improved = previous[self.metric] > current[self.metric]
+        value = improved * self.reward - (1 - improved) * self.penalty
+        if self.gate is not None:
+            value = value * current[self.gate]
+        return value
+
+    def source(self, previous, current):
+        # Os dois resultados possíveis de evaluate, calculados com a mesma conta
+        improved_value = True * self.reward - (1 - True) * self.penalty
+        other_value = False * self.reward - (1 - False) * self.penalty
+        lines = [f"if {previous(self.metric)} > {current(self.metric)}:",
+                 f"    total += {improved_value!r}" if improved_value else "    pass"]
+        if other_value:
+            lines += ["else:", f"    total += {other_value!r}"]
+        if self.gate is not None:
+            lines = [f"if {current(self.gate)}:"] + ["    " + line for line in lines]
+        return lines
+
+class Linear:
+    """Valor proporcional à métrica atual: weight * métrica / scale."""
+
+    def __init__(self, name, metric, weight, scale=1.0):
+        self.name = name
+        self.metric = metric
+        self.weight = weight
+        self.scale = scale
+
+    def evaluate(self, previous, current):
+        return self.weight * current[self.metric] / self.scale
+
+    def source(self, previous, current):
+        return [f"total += {self.weight!r} * {current(self.metric)} / {self.scale!r}"]
+
+class Event:
+    """Valor fixo quando uma métrica booleana de evento está ligada."""
+
+    def __init__(self, name, metric, reward):
+        self.name = name
+        self.metric = metric
+        self.reward = reward
+
+    def evaluate(self, previous, current):
+        return current[self.metric] * self.reward
+
+    def source(self, previous, current):
+        return [f"if {current(self.metric)}:", f"    total += {True * self.reward!r}"]
+
+class FuelBonus:
+    """Bônus de fim de missão: max(0, base - combustível + extra) quando o evento ocorre."""
+
+    def __init__(self, name, metric, base, extra=0.0):
+        self.name = name
+        self.metric = metric
+        self.base = base
+        self.extra = extra
+
+    def evaluate(self, previous, current):
+        bonus = self.base - current['fuel_consumed']
+        bonus = bonus + self.extra
+        return current[self.metric] * _positive_part(bonus)
+
+    def source(self, previous, current):
+        return [f"if {current(self.metric)}:",
+                f"    bonus = {self.base!r} - {current('fuel_consumed')}",
+                f"    bonus = bonus + {self.extra!r}",
+                "    if bonus > 0:",
+                "        total += bonus"]
+
+class RewardSpec:
+    """Recompensa como soma de termos, com detalhamento por termo."""
+
+    def __init__(self, terms, timeout=-50):
+        """
+        Args:
+            terms: Sequência de termos (Improvement, Linear, Event, FuelBonus ou
+                   qualquer objeto com `name` e `evaluate(previous, current)`; com
+                   `source(previous, current)` ele também entra em evaluate_scalar)
+            timeout: Recompensa do passo em que o episódio atinge o limite de passos
+        """
+        self.terms = tuple(terms)
+        self.names = tuple(term.name for term in self.terms)
+        # Métodos já vinculados: evita a busca do método a cada passo
+        self._evaluators = tuple(term.evaluate for term in self.terms)
+        self.timeout = timeout
+        self.evaluate_scalar = self._compile_scalar()
+
+    def _compile_scalar(self):
+        """
+        Monta evaluate_scalar(previous, current): a recompensa total de um passo,
+        com previous e current como tuplas de escalares na ordem de METRICS.
+
+        Com termos que têm `source`, é uma função gerada que soma as parcelas na
+        ordem dos termos, com os mesmos valores de evaluate (a menos do sinal de
+        um total nulo); senão, passa por evaluate com dicionários. A função é
+        gerada na construção: termos alterados depois não são vistos.
+        """
+        if not all(hasattr(term, 'source') for term in self.terms):
+            def evaluate_scalar(previous, current):
+                return self.evaluate(dict(zip(METRICS, previous)), dict(zip(METRICS, current)))[0]
+            return evaluate_scalar
+
+        def variable(prefix):
+            def name(metric):
+                if metric not in METRICS:
+                    raise KeyError(metric)
+                return prefix + metric
+            return name
+        lines = [
+            "def evaluate_scalar(previous, current):",
+            "    " + ", ".join("previous_" + name for name in METRICS) + ", = previous",
+            "    " + ", ".join("current_" + name for name in METRICS) + ", = current",
+            "    total = 0",
+        ]
+        for term in self.terms:
+            lines += ["    " + line for line in term.source(variable("previous_"), variable("current_"))]
+        lines.append("    return total")
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        return namespace['evaluate_scalar']
+
+    def evaluate(self, previous, current):
+        """
+        Avalia todos os termos.
+
+        Returns:
+            (recompensa total, lista com o valor de cada termo na ordem de `names`)
+        """
+        values = [evaluate(previous, current) for evaluate in self._evaluators]
+        # sum() acumula na ordem dos termos, a partir de 0
+        return sum(values), values
+
+    def breakdown(self, values):
+        """Dicionário nome -> valor a partir dos valores retornados por evaluate() (ou de suas somas)."""
+        return dict(zip(self.names, values))
+
+# Recompensa original do ambiente, termo a termo na mesma ordem (e portanto com
+# exatamente os mesmos valores em ponto flutuante)
+DEFAULT_REWARD_SPEC = RewardSpec([
+    Event('target', 'target_captured', 100),
+    Event('crash', 'crashed', -100),
+    FuelBonus('mission', 'landed_with_target', 200, 300),
+    Event('partial_landing', 'landed_without_target', 20),
+    Improvement('approach_target', 'distance_to_target', 0.5, penalty=0.05),
+    Improvement('aim_target', 'angle_difference', 0.4),
+    Improvement('approach_landing_x', 'landing_distance_x', 0.2, gate='target_reached'),
+    Improvement('approach_landing_y', 'landing_distance_y', 0.2, gate='target_reached'),
+    Linear('fuel', 'power', -0.005, scale=100.0),
+])
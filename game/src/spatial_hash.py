@@ -0,0 +1,87 @@
+import math
+import numpy as np
+
+# Lado máximo da tabela do hash: com até 65536 baldes as chaves cabem em uint16,
+# e o numpy ordena uint16 com radix sort (tempo linear)
+MAX_TABLE_SIDE = 256
+
+class SpatialHash:
+    """
+    Hash espacial em grade uniforme para consultas de vizinhança entre N pontos.
+
+    Cada ponto cai numa célula de lado `cell_size`; as células são mapeadas numa
+    tabela `side` x `side` pelo resto da divisão das coordenadas (o mundo é
+    ilimitado, então células distantes podem dividir um balde). Como side >= 3,
+    as 9 células vizinhas de uma célula caem sempre em baldes distintos, e cada
+    par próximo é encontrado exatamente uma vez. A reconstrução é uma ordenação
+    por contagem (bincount + radix sort das chaves uint16), O(n), e a consulta
+    só compara pontos em células vizinhas, em vez de todos os N² pares.
+    """
+
+    def __init__(self, cell_size, capacity):
+        """
+        Args:
+            cell_size: Lado da célula; limita a distância das consultas
+            capacity: Número de pontos esperado (dimensiona a tabela, ~2 baldes por ponto)
+        """
+        self.cell_size = cell_size
+        self.side = min(max(3, math.ceil(math.sqrt(2 * capacity))), MAX_TABLE_SIDE)
+        self.x = self.y = None
+
+    def _keys(self, cell_x, cell_y):
+        return ((cell_x % self.side) + self.side * (cell_y % self.side)).astype(np.uint16)
+
+    def build(self, x, y):
+        """Reindexa os pontos (x, y) (arrays); chamado a cada passo."""
+        self.x, self.y = x, y
+        cell_x = np.floor(x / self.cell_size).astype(np.int64)
+        cell_y = np.floor(y / self.cell_size).astype(np.int64)
+        keys = self._keys(cell_x, cell_y)
+        # Pontos ordenados por balde; os do balde k estão em order[start[k]:end[k]]
+        self.order = np.argsort(keys, kind='stable')
+        counts = np.bincount(keys, minlength=self.side * self.side)
+        self.end = np.cumsum(counts)
+        self.start = self.end - counts
+
+    def query(self, x, y):
+        """
+        Candidatos a vizinhos dos pontos (x, y) (arrays) entre os pontos indexados:
+        todos os pontos indexados nas 9 células em torno de cada ponto consultado.
+
+        Returns:
+            (índices dos pontos consultados, índices dos pontos indexados), arrays do mesmo tamanho
+        """
+        cell_x = np.floor(np.asarray(x) / self.cell_size).astype(np.int64)
+        cell_y = np.floor(np.asarray(y) / self.cell_size).astype(np.int64)
+        # Baldes das 9 células vizinhas de cada ponto (n, 9)
+        offsets = np.array([-1, 0, 1])
+        neighbor_x = cell_x[:, None] + np.repeat(offsets, 3)[None, :]
+        neighbor_y = cell_y[:, None] + np.tile(offsets, 3)[None, :]
+        keys = self._keys(neighbor_x, neighbor_y).ravel()
+        start = self.start[keys]
+        count = self.end[keys] - start
+
+        # Expande os intervalos [start, end) de cada (ponto, vizinho) nos candidatos
+        total = int(count.sum())
+        i = np.repeat(np.repeat(np.arange(len(cell_x)), 9), count)
+        within = np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+        j = self.order[np.repeat(start, count) + within]
+        return i, j
+
+    def pairs(self, distance):
+        """
+        Pares de pontos indexados a menos de `distance` um do outro.
+
+        Returns:
+            Array (m, 2) de índices (i, j) com i < j
+        """
+        if distance > self.cell_size:
+            raise ValueError(f"Distância {distance} maior que a célula do hash ({self.cell_size})")
+        i, j = self.query(self.x, self.y)
+        # Cada par aparece a partir de seus dois pontos: fica o de i < j
+        keep = i < j
+        i, j = i[keep], j[keep]
+        dx = self.x[i] - self.x[j]
+        dy = self.y[i] - self.y[j]
+        close = dx * dx + dy * dy < distance * distance
+        return np.stack([i[close], j[close]], axis=1)
@@ -0,0 +1,76 @@
+import numpy as np
+import sys
+import os
+from .environment import RocketEnvironment
+from .physics import RocketBatch, world_from_environment
+from .spatial_hash import SpatialHash
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+class SwarmWorld:
+    """
+    Muitos foguetes no mesmo cenário do RocketEnvironment, com colisões entre eles.
+
+    O estado dos foguetes fica em arrays (RocketBatch, com a física e as regras
+    de contato do ambiente). A cada passo, um SpatialHash é reconstruído com as
+    posições e dá os pares de foguetes em colisão; com `collisions_crash`, os dois
+    foguetes de cada colisão caem. Foguetes terminados ficam parados no lugar e
+    ainda podem ser atingidos pelos outros.
+    """
+
+    def __init__(self, n, env=None, collision_radius=None, neighbor_radius=None, collisions_crash=True):
+        """
+        Args:
+            n: Número de foguetes
+            env: RocketEnvironment com a geometria do cenário (padrão: um ambiente novo)
+            collision_radius: Raio de colisão de cada foguete (padrão: metade da largura)
+            neighbor_radius: Distância máxima das consultas de vizinhança (padrão: 4 raios de colisão)
+            collisions_crash: Se uma colisão derruba os dois foguetes
+        """
+        env = env if env is not None else RocketEnvironment()
+        self.batch = RocketBatch(n, world_from_environment(env), massa=env.rocket.massa)
+        self.collision_radius = collision_radius if collision_radius is not None else env.rocket_width / 2
+        self.neighbor_radius = neighbor_radius if neighbor_radius is not None else 4 * self.collision_radius
+        self.collisions_crash = collisions_crash
+        self.hash = SpatialHash(max(2 * self.collision_radius, self.neighbor_radius), n)
+        self.collided = np.zeros(n, dtype=bool)
+
+    def __len__(self):
+        return len(self.batch)
+
+    def reset(self, x, y, vx=0.0, vy=0.0, orientacao=90.0, potencia=0):
+        """Posiciona os foguetes (escalares ou arrays (n,)) e limpa as flags de término."""
+        self.batch.fill(x, y, vx, vy, orientacao, 0.0, potencia)
+        self.collided[:] = False
+        self.hash.build(self.batch.x, self.batch.y)
+
+    def step(self, actions, dt=1.0 / config.FPS):
+        """
+        Avança um passo com uma ação por foguete.
+
+        Returns:
+            (capturou o target, código de contato de contact.py, pares (m, 2) de
+            foguetes que colidiram neste passo)
+        """
+        batch = self.batch
+        captured, outcome = batch.step(actions, dt)
+        self.hash.build(batch.x, batch.y)
+        collisions = self.hash.pairs(2 * self.collision_radius)
+        # Dois destroços parados não colidem de novo
+        both_done = batch.done[collisions[:, 0]] & batch.done[collisions[:, 1]]
+        collisions = collisions[~both_done]
+        if len(collisions):
+            hit = np.zeros(len(batch), dtype=bool)
+            hit[collisions.ravel()] = True
+            hit &= ~batch.done
+            self.collided |= hit
+            if self.collisions_crash:
+                batch.crashed |= hit
+                batch.done |= hit
+        return captured, outcome, collisions
+
+    def neighbors(self, radius=None):
+        """Pares (m, 2) de foguetes a menos de `radius` (padrão: neighbor_radius) na posição atual."""
+        return self.hash.pairs(radius if radius is not None else self.neighbor_radius)
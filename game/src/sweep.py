@@ -0,0 +1,129 @@
+import itertools
+import math
+import statistics
+
+# Espaço de busca de hiperparâmetros: dicionário nome -> definição, onde a
+# definição é uma lista de valores (grade ou escolha aleatória) ou uma
+# distribuição para busca aleatória:
+#     {"uniform": [min, max]}, {"log_uniform": [min, max]}, {"int_uniform": [min, max]}
+
+def _is_distribution(definition):
+    return isinstance(definition, dict)
+
+def expand_grid(space):
+    """
+    Todas as combinações de um espaço formado só por listas de valores.
+
+    Returns:
+        Lista de dicionários nome -> valor, na ordem do produto cartesiano.
+    """
+    for name, definition in space.items():
+        if _is_distribution(definition):
+            raise ValueError(f"Busca em grade exige listas de valores; '{name}' é uma distribuição")
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+def sample_space(space, trials, rng):
+    """
+    Sorteia `trials` combinações do espaço (busca aleatória).
+
+    Args:
+        space: Espaço de busca (listas e/ou distribuições)
+        trials: Número de combinações
+        rng: numpy.random.Generator
+    """
+    samples = []
+    for _ in range(trials):
+        params = {}
+        for name, definition in space.items():
+            if not _is_distribution(definition):
+                params[name] = definition[int(rng.integers(len(definition)))]
+            elif "uniform" in definition:
+                low, high = definition["uniform"]
+                params[name] = float(rng.uniform(low, high))
+            elif "log_uniform" in definition:
+                low, high = definition["log_uniform"]
+                params[name] = float(math.exp(rng.uniform(math.log(low), math.log(high))))
+            elif "int_uniform" in definition:
+                low, high = definition["int_uniform"]
+                params[name] = int(rng.integers(low, high + 1))
+            else:
+                raise ValueError(f"Distribuição desconhecida para '{name}': {definition}")
+        samples.append(params)
+    return samples
+
+def partition_cores(cores, cores_per_trial):
+    """
+    Divide os núcleos disponíveis em grupos disjuntos, um por trial simultâneo.
+
+    Args:
+        cores: Núcleos disponíveis (ex.: os.sched_getaffinity(0))
+        cores_per_trial: Núcleos de cada grupo
+
+    Returns:
+        Lista de grupos (listas de núcleos); ao menos um grupo, mesmo com poucos núcleos.
+    """
+    cores = sorted(cores)
+    groups = [cores[i:i + cores_per_trial] for i in range(0, len(cores) - cores_per_trial + 1, cores_per_trial)]
+    return groups or [cores]
+
+def window_averages(scores, window=100):
+    """
+    Médias móveis só das janelas completas de `window` episódios: a primeira é a
+    dos episódios 1..window. Sem uma janela completa, a lista é vazia (médias de
+    poucos episódios do início, ainda explorando ao acaso, não entram na comparação).
+    """
+    averages = []
+    total = sum(scores[:window - 1])
+    for i in range(window - 1, len(scores)):
+        total += scores[i]
+        averages.append(total / window)
+        total -= scores[i - window + 1]
+    return averages
+
+def ranking_key(value):
+    """Chave de ordenação decrescente por `value` com NaN (trial sem janela completa) por último."""
+    return (not math.isnan(value), value if not math.isnan(value) else 0.0)
+
+class MedianStoppingRule:
+    """
+    Regra da mediana para parar trials fracos.
+
+    A cada `interval` episódios, o trial informa sua recompensa média; depois de
+    `grace_episodes`, ele é interrompido se a média estiver abaixo da mediana das
+    médias que os outros trials tinham no mesmo episódio. O histórico pode ser um
+    dicionário compartilhado entre processos (multiprocessing.Manager), protegido
+    por `lock`.
+    """
+
+    def __init__(self, history, lock=None, grace_episodes=100, interval=25, min_trials=3):
+        """
+        Args:
+            history: Dicionário episódio -> lista de médias já informadas
+            lock: Lock para a atualização do histórico entre processos (opcional)
+            grace_episodes: Episódios antes de qualquer interrupção
+            interval: Episódios entre avaliações
+            min_trials: Outros trials necessários no mesmo episódio para comparar
+        """
+        self.history = history
+        self.lock = lock
+        self.grace_episodes = grace_episodes
+        self.interval = interval
+        self.min_trials = min_trials
+
+    def should_stop(self, episode, value):
+        """
+        Registra a média `value` do trial após `episode` episódios e indica se ele deve parar.
+        """
+        if episode % self.interval:
+            return False
+        if self.lock is not None:
+            with self.lock:
+                others = list(self.history.get(episode, []))
+                self.history[episode] = others + [value]
+        else:
+            others = list(self.history.get(episode, []))
+            self.history[episode] = others + [value]
+        if episode < self.grace_episodes or len(others) < self.min_trials:
+            return False
+        return value < statistics.median(others)
@@ -0,0 +1,295 @@
+import json
+import os
+import struct
+import sys
+import numpy as np
+
+# Ajusta o caminho para importar o config corretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+# Formato do arquivo:
+#   cabeçalho: MAGIC, versão
+#   registros: tag, tamanho do payload, payload
+# Os registros de um episódio são: início (JSON com configuração, seed e metadados),
+# sequências de ações uint8 (passo inicial + ações), snapshots float64 do estado
+# (passo, flag "forçado" + array de RocketEnvironment.snapshot()) e fim (JSON com
+# passos, recompensa e status). Como cada registro é independente, o arquivo pode
+# ser estendido em fluxo e episódios de várias sessões podem ser anexados.
+MAGIC = b'RKTJ'
+VERSION = 1
+HEADER_FORMAT = '<4sH'
+RECORD_FORMAT = '<BI'
+ACTIONS_FORMAT = '<I'
+SNAPSHOT_FORMAT = '<IB'
+
+EPISODE_START = 1
+ACTIONS = 2
+SNAPSHOT = 3
+EPISODE_END = 4
+
+# Ações acumuladas em memória antes de gravar um registro
+ACTION_FLUSH_SIZE = 4096
+
+def environment_config(env):
+    """Parâmetros que determinam a simulação, gravados no início de cada episódio."""
+    return {
+        "width": env.width,
+        "height": env.height,
+        "max_steps": env.max_steps,
+        "dt": env.dt,
+        "action_repeat": env.action_repeat,
+        "ccd": env.ccd,
+        "adaptive": env.adaptive,
+        "course": env.course.to_config(),
+        "fps": config.FPS,
+        "gravity": config.GRAVITY,
+        "max_thrust": config.MAX_THRUST,
+        "rotation_torque": config.ROTATION_TORQUE,
+        "drag_coefficient": config.DRAG_COEFFICIENT,
+        "landing_speed_threshold": config.LANDING_SPEED_THRESHOLD,
+    }
+
+def episode_status(env):
+    """Resultado do episódio atual: 'crashed', 'landed', 'timeout' ou 'in_progress'."""
+    if env.rocket.crashed:
+        return "crashed"
+    if env.rocket.landed:
+        return "landed"
+    if env.total_steps >= env.max_steps:
+        return "timeout"
+    return "in_progress"
+
+class TrajectoryWriter:
+    """
+    Grava episódios como ações por passo mais snapshots periódicos do estado.
+
+    Use step() no lugar de env.step(). Alterações feitas no ambiente fora de
+    env.step() (teclas que mexem direto no foguete, por exemplo) são detectadas
+    e gravadas como snapshots "forçados", aplicados obrigatoriamente no replay.
+    """
+
+    def __init__(self, path, snapshot_interval=100):
+        """
+        Args:
+            path: Caminho do arquivo; se já existir, os episódios são anexados
+            snapshot_interval: Passos entre snapshots periódicos (usados para seek)
+        """
+        self.snapshot_interval = snapshot_interval
+        self.episodes_written = 0
+        append = os.path.exists(path) and os.path.getsize(path) > 0
+        if append:
+            with open(path, 'rb') as f:
+                _check_header(f.read(struct.calcsize(HEADER_FORMAT)), path)
+        self._file = open(path, 'ab')
+        if not append:
+            self._file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION))
+
+        self._in_episode = False
+        self._pending_actions = bytearray()
+        self._pending_start = 0
+
+    def begin_episode(self, env, seed=None, metadata=None):
+        """
+        Inicia um episódio a partir do estado atual de `env` (normalmente logo após reset()).
+        Sem `seed`, grava a semente atual do ambiente.
+        """
+        if self._in_episode:
+            self.end_episode(env, status="aborted")
+        start = {
+            "seed": seed if seed is not None else env.seed,
+            "config": environment_config(env),
+            "snapshot_interval": self.snapshot_interval,
+            "metadata": metadata or {},
+        }
+        self._write_record(EPISODE_START, json.dumps(start).encode('utf-8'))
+        self._in_episode = True
+        self.step_count = 0
+        self.total_reward = 0.0
+        self._pending_actions = bytearray()
+        self._pending_start = 0
+        self._expected = env.snapshot()
+        self._write_snapshot(0, self._expected, forced=True)
+
+    def step(self, env, action):
+        """Executa `action` em `env`, grava a ação e retorna o resultado de env.step()."""
+        current = env.snapshot()
+        forced = not np.array_equal(current, self._expected)
+        if forced or (self.step_count % self.snapshot_interval == 0 and self.step_count > 0):
+            self._write_snapshot(self.step_count, current, forced)
+
+        result = env.step(action)
+        self._pending_actions.append(int(action))
+        self.step_count += 1
+        self.total_reward += result[1]
+        self._expected = env.snapshot()
+        if len(self._pending_actions) >= ACTION_FLUSH_SIZE:
+            self._flush_actions()
+        return result
+
+    def end_episode(self, env, status=None):
+        """
+        Finaliza o episódio gravando o estado final (usado para conferir o replay).
+        Sem `status`, o resultado é obtido de episode_status(env).
+        """
+        if not self._in_episode:
+            return
+        if status is None:
+            status = episode_status(env)
+        current = env.snapshot()
+        self._write_snapshot(self.step_count, current, not np.array_equal(current, self._expected))
+        end = {"steps": self.step_count, "reward": self.total_reward, "status": status}
+        self._write_record(EPISODE_END, json.dumps(end).encode('utf-8'))
+        self._file.flush()
+        self._in_episode = False
+        self.episodes_written += 1
+
+    def _flush_actions(self):
+        if self._pending_actions:
+            payload = struct.pack(ACTIONS_FORMAT, self._pending_start) + bytes(self._pending_actions)
+            self._write_record(ACTIONS, payload)
+        self._pending_start = self.step_count
+        self._pending_actions = bytearray()
+
+    def _write_snapshot(self, step, snapshot, forced):
+        # Mantém os registros em ordem de passo: ações pendentes saem antes do snapshot
+        self._flush_actions()
+        payload = struct.pack(SNAPSHOT_FORMAT, step, forced) + snapshot.astype(np.float64).tobytes()
+        self._write_record(SNAPSHOT, payload)
+
+    def _write_record(self, tag, payload):
+        self._file.write(struct.pack(RECORD_FORMAT, tag, len(payload)))
+        self._file.write(payload)
+
+    def close(self, env=None):
+        """Fecha o arquivo; um episódio em andamento é finalizado se `env` for dado."""
+        if self._file.closed:
+            return
+        if self._in_episode and env is not None:
+            self.end_episode(env, status="aborted")
+        self._flush_actions()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class EpisodeTrajectory:
+    """Um episódio lido do arquivo."""
+
+    def __init__(self, start):
+        self.seed = start["seed"]
+        self.config = start["config"]
+        self.snapshot_interval = start["snapshot_interval"]
+        self.metadata = start["metadata"]
+        self.end = None
+        self._action_chunks = []
+        self._snapshots = []
+
+    def _finish(self):
+        self.actions = (np.concatenate(self._action_chunks) if self._action_chunks
+                        else np.zeros(0, dtype=np.uint8))
+        self.snapshot_steps = np.array([s[0] for s in self._snapshots], dtype=np.int64)
+        self.forced = np.array([s[1] for s in self._snapshots], dtype=bool)
+        self.snapshots = np.array([s[2] for s in self._snapshots], dtype=np.float64)
+        del self._action_chunks, self._snapshots
+
+    def __len__(self):
+        return len(self.actions)
+
+def _check_header(header, path):
+    if len(header) < struct.calcsize(HEADER_FORMAT):
+        raise ValueError(f"Arquivo de trajetórias inválido: {path}")
+    magic, version = struct.unpack(HEADER_FORMAT, header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Arquivo de trajetórias inválido: {path}")
+
+def read_trajectories(path):
+    """
+    Lê todos os episódios de um arquivo de trajetórias.
+
+    Um registro incompleto no fim do arquivo (gravação interrompida) é ignorado;
+    episódios sem registro de fim ficam com `end` igual a None.
+    """
+    episodes = []
+    with open(path, 'rb') as f:
+        _check_header(f.read(struct.calcsize(HEADER_FORMAT)), path)
+        data = f.read()
+
+    record_size = struct.calcsize(RECORD_FORMAT)
+    actions_size = struct.calcsize(ACTIONS_FORMAT)
+    snapshot_size = struct.calcsize(SNAPSHOT_FORMAT)
+    offset = 0
+    current = None
+    while offset + record_size <= len(data):
+        tag, length = struct.unpack_from(RECORD_FORMAT, data, offset)
+        offset += record_size
+        if offset + length > len(data):
+            break
+        payload = memoryview(data)[offset:offset + length]
+        offset += length
+
+        if tag == EPISODE_START:
+            current = EpisodeTrajectory(json.loads(bytes(payload)))
+            episodes.append(current)
+        elif current is None:
+            raise ValueError(f"Registro fora de um episódio em {path}")
+        elif tag == ACTIONS:
+            current._action_chunks.append(np.frombuffer(payload, dtype=np.uint8, offset=actions_size))
+        elif tag == SNAPSHOT:
+            step, forced = struct.unpack_from(SNAPSHOT_FORMAT, payload)
+            current._snapshots.append((step, forced, np.frombuffer(payload, dtype=np.float64, offset=snapshot_size)))
+        elif tag == EPISODE_END:
+            current.end = json.loads(bytes(payload))
+
+    for episode in episodes:
+        episode._finish()
+    return episodes
+
+def replay(env, trajectory, start_step=0, stop_step=None, on_step=None):
+    """
+    Re-simula um episódio gravado, a partir do snapshot mais próximo de `start_step`.
+
+    Args:
+        env: RocketEnvironment com a mesma configuração da gravação
+        trajectory: EpisodeTrajectory
+        start_step: Passo a partir do qual a simulação é necessária
+        stop_step: Passo em que parar (padrão: fim do episódio)
+        on_step: Função opcional (passo, estado, recompensa, done) chamada a cada passo
+
+    Returns:
+        Soma das recompensas dos passos simulados.
+    """
+    if stop_step is None:
+        stop_step = len(trajectory.actions)
+    stop_step = min(stop_step, len(trajectory.actions))
+
+    steps = trajectory.snapshot_steps
+    index = max(0, np.searchsorted(steps, min(start_step, stop_step), side='right') - 1)
+    env.restore(trajectory.snapshots[index])
+    current = int(steps[index])
+
+    # Snapshots forçados posteriores ao ponto de partida
+    forced_indices = np.nonzero(trajectory.forced & (steps > current))[0]
+    next_forced = 0
+    actions = trajectory.actions
+    total_reward = 0.0
+    while True:
+        if next_forced < len(forced_indices) and steps[forced_indices[next_forced]] == current:
+            env.restore(trajectory.snapshots[forced_indices[next_forced]])
+            next_forced += 1
+        if current >= stop_step:
+            break
+        state, reward, done, info = env.step(actions[current])
+        total_reward += reward
+        current += 1
+        if on_step is not None:
+            on_step(current, state, reward, done)
+    return total_reward
+
+def seek(env, trajectory, step):
+    """Coloca `env` no estado do passo `step` de um episódio gravado (antes da ação desse passo)."""
+    replay(env, trajectory, start_step=step, stop_step=step)
+    return env
@@ -0,0 +1,189 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import multiprocessing
+import numpy as np
+
+# Garantir que o diretório atual está no path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# O TensorFlow só é importado dentro dos workers, depois de fixar núcleos e threads
+from src.sweep import (expand_grid, sample_space, partition_cores, window_averages, ranking_key,
+                       MedianStoppingRule)
+
+# Hiperparâmetros repassados a train_dqn(); os demais vão para o DQNAgent
+TRAIN_PARAMS = ('batch_size',)
+
+# Estado de cada processo worker (definido em init_worker)
+_worker_cores = None
+_worker_core_queue = None
+_worker_stopper = None
+
+def init_worker(core_queue, history, lock, stopping):
+    """
+    Prepara um processo worker: reserva um grupo de núcleos, fixa o processo
+    nele e limita as threads do TensorFlow/OpenMP ao tamanho do grupo, para que
+    trials simultâneos não disputem os mesmos núcleos.
+    """
+    global _worker_cores, _worker_core_queue, _worker_stopper
+    _worker_core_queue = core_queue
+    _worker_cores = core_queue.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, _worker_cores)
+    threads = str(len(_worker_cores))
+    os.environ["OMP_NUM_THREADS"] = threads
+    os.environ["TF_NUM_INTRAOP_THREADS"] = threads
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+    _worker_stopper = MedianStoppingRule(history, lock, **stopping) if stopping is not None else None
+
+def run_trial(task):
+    """
+    Treina um trial e retorna suas estatísticas.
+
+    Cada trial roda num processo novo (maxtasksperchild=1) e devolve o grupo de
+    núcleos ao terminar, para o processo que o substituir.
+    """
+    trial_id, params, episodes, seed, output_dir = task
+    trial_dir = os.path.join(output_dir, f"trial_{trial_id:03d}")
+    os.makedirs(trial_dir, exist_ok=True)
+    scores = []
+    stopped = False
+
+    def on_episode(episode, score, avg_score):
+        nonlocal stopped
+        scores.append(score)
+        if _worker_stopper is not None and _worker_stopper.should_stop(episode, avg_score):
+            stopped = True
+        return stopped
+
+    start_time = time.perf_counter()
+    # A saída do treinamento de cada trial vai para o log do trial
+    log = open(os.path.join(trial_dir, "train.log"), "w")
+    sys.stdout = log
+    try:
+        import tensorflow as tf
+        try:
+            tf.config.threading.set_intra_op_parallelism_threads(len(_worker_cores))
+            tf.config.threading.set_inter_op_parallelism_threads(1)
+        except RuntimeError:
+            pass  # runtime já inicializado: valem as variáveis de ambiente
+        from train_dqn import train_dqn
+
+        train_params = {name: params[name] for name in TRAIN_PARAMS if name in params}
+        agent_params = {name: value for name, value in params.items() if name not in TRAIN_PARAMS}
+        train_dqn(episodes=episodes, use_gpu=False, seed=seed, agent_params=agent_params,
+                  output_dir=trial_dir, episode_callback=on_episode, **train_params)
+    finally:
+        sys.stdout = sys.__stdout__
+        log.close()
+        _worker_core_queue.put(_worker_cores)
+
+    # Só janelas completas de 100 episódios; NaN se o trial parou antes da primeira
+    averages = window_averages(scores, 100)
+    return {
+        "trial": trial_id,
+        "params": params,
+        "episodes": len(scores),
+        "stopped_early": stopped,
+        "final_avg_score": averages[-1] if averages else float("nan"),
+        "best_avg_score": max(averages) if averages else float("nan"),
+        "elapsed_s": time.perf_counter() - start_time,
+        "cores": " ".join(str(core) for core in _worker_cores),
+    }
+
+def load_space(text):
+    """Lê o espaço de busca de um arquivo JSON ou de um texto JSON."""
+    if os.path.exists(text):
+        with open(text) as f:
+            return json.load(f)
+    return json.loads(text)
+
+def write_results(path, results, param_names):
+    """Grava a tabela de resultados em CSV, do melhor para o pior trial."""
+    columns = ["trial"] + list(param_names) + ["episodes", "stopped_early", "final_avg_score",
+                                                "best_avg_score", "elapsed_s", "cores"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for result in sorted(results, key=lambda r: ranking_key(r["best_avg_score"]), reverse=True):
+            row = {name: value for name, value in result.items() if name != "params"}
+            for name in param_names:
+                value = result["params"].get(name)
+                row[name] = json.dumps(value) if isinstance(value, list) else value
+            writer.writerow(row)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Busca de hiperparâmetros do DQN em paralelo')
+    parser.add_argument('--space', required=True,
+                        help='Espaço de busca em JSON (arquivo ou texto), ex.: '
+                             '\'{"learning_rate": {"log_uniform": [1e-4, 1e-2]}, "hidden_units": [[64, 64], [128, 128]]}\'')
+    parser.add_argument('--search', choices=['grid', 'random'], default='grid', help='Tipo de busca (padrão: grid)')
+    parser.add_argument('--trials', type=int, default=20, help='Número de trials da busca aleatória (padrão: 20)')
+    parser.add_argument('--episodes', type=int, default=300, help='Episódios por trial (padrão: 300)')
+    parser.add_argument('--cores-per-trial', type=int, default=1, help='Núcleos reservados por trial (padrão: 1)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Trials simultâneos (padrão: núcleos disponíveis / núcleos por trial)')
+    parser.add_argument('--seed', type=int, default=None, help='Semente da busca e dos trials')
+    parser.add_argument('--output-dir', default='sweep', help='Diretório dos trials e dos resultados (padrão: sweep)')
+    parser.add_argument('--no-early-stopping', action='store_true', help='Desliga a regra da mediana')
+    parser.add_argument('--grace-episodes', type=int, default=100,
+                        help='Episódios antes de permitir a parada antecipada (padrão: 100)')
+    parser.add_argument('--stop-interval', type=int, default=25,
+                        help='Episódios entre avaliações da parada antecipada (padrão: 25)')
+    parser.add_argument('--min-trials', type=int, default=3,
+                        help='Trials de referência necessários para parar um trial (padrão: 3)')
+    args = parser.parse_args()
+
+    space = load_space(args.space)
+    seed_sequence = np.random.SeedSequence(args.seed)
+    search_seed, trials_seed = seed_sequence.spawn(2)
+    if args.search == 'grid':
+        trials = expand_grid(space)
+    else:
+        trials = sample_space(space, args.trials, np.random.default_rng(search_seed))
+    trial_seeds = [int(s.generate_state(1)[0]) for s in trials_seed.spawn(len(trials))]
+    if args.seed is None:
+        trial_seeds = [None] * len(trials)
+
+    available = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else range(os.cpu_count())
+    core_groups = partition_cores(available, args.cores_per_trial)
+    workers = min(args.workers or len(core_groups), len(core_groups), len(trials))
+    print(f"{len(trials)} trials, {workers} simultâneos com {len(core_groups[0])} núcleo(s) cada")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    results_path = os.path.join(args.output_dir, "results.csv")
+    tasks = [(i, params, args.episodes, trial_seeds[i], args.output_dir) for i, params in enumerate(trials)]
+    stopping = None if args.no_early_stopping else {
+        "grace_episodes": args.grace_episodes,
+        "interval": args.stop_interval,
+        "min_trials": args.min_trials,
+    }
+
+    # 'spawn': cada worker começa sem o TensorFlow carregado, então os limites
+    # de threads definidos em init_worker valem antes da inicialização
+    context = multiprocessing.get_context('spawn')
+    start_time = time.perf_counter()
+    results = []
+    with context.Manager() as manager:
+        core_queue = manager.Queue()
+        for group in core_groups[:workers]:
+            core_queue.put(group)
+        history = manager.dict()
+        lock = manager.Lock()
+        with context.Pool(workers, initializer=init_worker, initargs=(core_queue, history, lock, stopping),
+                          maxtasksperchild=1) as pool:
+            for result in pool.imap_unordered(run_trial, tasks):
+                results.append(result)
+                status = "parado" if result["stopped_early"] else "completo"
+                print(f"Trial {result['trial']:>3} ({status}, {result['episodes']} episódios, "
+                      f"{result['elapsed_s']:.0f} s): média final {result['final_avg_score']:.2f}, "
+                      f"melhor média {result['best_avg_score']:.2f} {result['params']}")
+                # Regrava a tabela a cada trial: resultados parciais sobrevivem a interrupções
+                write_results(results_path, results, list(space))
+
+    best = max(results, key=lambda r: ranking_key(r["best_avg_score"]))
+    print(f"Sweep concluído em {time.perf_counter() - start_time:.0f} s; resultados em {results_path}")
+    print(f"Melhor trial: {best['trial']} (melhor média {best['best_avg_score']:.2f}) {best['params']}")
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from game.src import adaptive_step
+from game.src.entities.rocket import Rocket
+from game.src.environment import RocketEnvironment
+
+def run_episode(actions, **kwargs):
+    env = RocketEnvironment(seed=0, action_repeat=8, **kwargs)
+    positions = []
+    for action in actions:
+        _, _, done, _ = env.step(action)
+        positions.append(list(env.rocket.posicao))
+        if done:
+            break
+    return env, np.array(positions)
+
+class TestAdaptiveStep(unittest.TestCase):
+    def test_coast_matches_euler_steps(self):
+        # Com potência e orientação constantes, o passo grande é a soma exata dos passos base
+        rocket = Rocket(300.0, 400.0, 50)
+        rocket.velocidade = [120.0, -40.0]
+        rocket.orientacao = 70.0
+        rocket.potencia_motor = 85
+        thrust = 0.85 * Rocket.MAX_THRUST / rocket.massa
+        rad = np.radians(70.0)
+        expected = adaptive_step.coast(300.0, 400.0, 120.0, -40.0, thrust * np.cos(rad),
+                                       thrust * np.sin(rad) - Rocket.GRAVIDADE, rocket.massa, 1 / 60, 16)
+        for _ in range(16):
+            rocket.update_physics(1 / 60)
+        np.testing.assert_allclose(expected, rocket.posicao + rocket.velocidade, rtol=1e-12)
+
+    def test_power_sum(self):
+        for power in range(0, 101, 7):
+            for increment in (-1, 0, 1):
+                rocket = Rocket(0.0, 0.0, 50)
+                rocket.potencia_motor = power
+                total = 0
+                for _ in range(16):
+                    rocket.alterar_potencia(increment)
+                    total += rocket.potencia_motor
+                self.assertEqual(adaptive_step.power_sum(power, increment, 16), (total, rocket.potencia_motor))
+
+    def test_trajectory_error_is_bounded(self):
+        # Mesmas ações com e sem passo adaptativo: mesmo desfecho, com a trajetória
+        # a menos de 2 pixels da do passo fixo em toda decisão
+        rng = np.random.default_rng(0)
+        actions = [1] * 40 + rng.choice([0, 0, 0, 1, 2, 3, 4], 160).tolist()
+        fixed, fixed_positions = run_episode(actions)
+        adaptive, adaptive_positions = run_episode(actions, adaptive=True)
+        self.assertEqual(adaptive.total_steps, fixed.total_steps)
+        self.assertEqual(adaptive.elapsed_time, fixed.elapsed_time)
+        self.assertEqual((adaptive.rocket.crashed, adaptive.rocket.landed),
+                         (fixed.rocket.crashed, fixed.rocket.landed))
+        error = np.hypot(*(adaptive_positions - fixed_positions).T)
+        self.assertLess(error.max(), 2.0)
+        self.assertGreater(error.max(), 0.0)  # os passos grandes foram usados
+
+    def test_stays_fine_near_ground(self):
+        # Parado na plataforma o passo é sempre o base: o resultado é idêntico ao passo fixo
+        fixed, _ = run_episode([0, 3, 0, 4] * 5)
+        adaptive, _ = run_episode([0, 3, 0, 4] * 5, adaptive=True)
+        np.testing.assert_array_equal(adaptive.snapshot(), fixed.snapshot())
+
+if __name__ == '__main__':
+    unittest.main()
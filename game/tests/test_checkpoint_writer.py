@@ -0,0 +1,69 @@
+import os
+import tempfile
+import threading
+import unittest
+import numpy as np
+from game.src.checkpoint_writer import CheckpointWriter
+
+def save_npy(weights, path):
+    # np.save acrescentaria .npy ao nome: grava pelo arquivo aberto
+    with open(path, "wb") as f:
+        np.save(f, weights[0])
+
+class TestCheckpointWriter(unittest.TestCase):
+    def test_retention_and_atomic_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            writer = CheckpointWriter(directory, save_npy, keep_last=2)
+            scores = [10.0, 50.0, 20.0, 30.0, 40.0]
+            for i, score in enumerate(scores):
+                weights = [np.full(4, float(i))]
+                writer.save_checkpoint((i + 1) * 100, weights, score)
+                # A lista enfileirada é uma cópia: o chamador pode reutilizar a sua
+                weights[0] = None
+            writer.save_final([np.arange(3.0)])
+            writer.close()
+
+            files = sorted(os.listdir(directory))
+            self.assertEqual(files, ["dqn_model_ep200.h5", "dqn_model_ep400.h5",
+                                     "dqn_model_ep500.h5", "dqn_model_final.h5"])
+            with open(os.path.join(directory, "dqn_model_ep200.h5"), "rb") as f:
+                np.testing.assert_array_equal(np.load(f), np.full(4, 1.0))
+            self.assertEqual([c[0] for c in writer.checkpoints], [200, 400, 500])
+
+    def test_background_and_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            release = threading.Event()
+            def slow_save(weights, path):
+                release.wait(5)
+                save_npy(weights, path)
+            writer = CheckpointWriter(directory, slow_save)
+            # Enfileirar não espera a gravação
+            writer.save_checkpoint(100, [np.zeros(2)], 0.0)
+            self.assertEqual(os.listdir(directory), [])
+            release.set()
+            writer.flush()
+            self.assertEqual(os.listdir(directory), ["dqn_model_ep100.h5"])
+
+            def failing_save(weights, path):
+                with open(path, "wb") as f:
+                    f.write(b"parcial")
+                raise OSError("disco cheio")
+            writer.save_weights = failing_save
+            writer.save_checkpoint(200, [np.zeros(2)], 0.0)
+            with self.assertRaises(OSError):
+                writer.flush()
+            # O temporário da gravação que falhou é removido
+            self.assertEqual(os.listdir(directory), ["dqn_model_ep100.h5"])
+
+            # Sem flush(), o erro aparece na próxima gravação pedida pelo treinamento
+            writer.save_checkpoint(300, [np.zeros(2)], 0.0)
+            writer._queue.join()
+            with self.assertRaises(OSError):
+                writer.save_plot(300, [0.0], [0.0], [1.0])
+            writer.save_weights = save_npy
+            writer.save_final([np.zeros(2)])
+            writer.close()
+            self.assertEqual(sorted(os.listdir(directory)), ["dqn_model_ep100.h5", "dqn_model_final.h5"])
+
+if __name__ == "__main__":
+    unittest.main()
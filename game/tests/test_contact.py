@@ -0,0 +1,119 @@
+import unittest
+import numpy as np
+from game.src import contact
+from game.src.environment import RocketEnvironment
+
+class TestContact(unittest.TestCase):
+    def setUp(self):
+        self.env = RocketEnvironment()
+        self.args = (self.env.rocket_height / 2, self.env.platform_spans,
+                     RocketEnvironment.LANDING_PLATFORM_INDEX, self.env.landing_speed_threshold)
+
+    def test_outcomes(self):
+        landing_x = (self.env.platform_spans[1][0] + self.env.platform_spans[1][1]) / 2
+        initial_x = (self.env.platform_spans[0][0] + self.env.platform_spans[0][1]) / 2
+        cases = [
+            ((landing_x, 100, 0, -50, 0), contact.FLYING),
+            ((landing_x, 20, 0, -500, 0), contact.CRASHED),
+            ((800, 20, 0, -50, 0), contact.CRASHED),
+            ((landing_x, 20, 0, -50, 40), contact.RESTING),
+            ((initial_x, 20, 0, -50, 0), contact.STOPPED),
+            ((landing_x, 20, 10, -50, 0), contact.LANDED),
+        ]
+        for (x, y, vx, vy, power), expected in cases:
+            self.assertEqual(contact.ground_contact(x, y, vx, vy, power, *self.args), expected)
+
+    def test_batch_matches_scalar(self):
+        # Uma chamada vetorizada deve dar o mesmo resultado que o caminho escalar de cada foguete
+        rng = np.random.default_rng(0)
+        n = 2000
+        x = rng.uniform(0, self.env.width, n)
+        y = rng.uniform(0, 40, n)
+        vx = rng.normal(0, 150, n)
+        vy = rng.normal(0, 150, n)
+        power = rng.integers(0, 3, n) * 10
+
+        batch = contact.ground_contact(x, y, vx, vy, power, *self.args)
+        scalar = [contact.ground_contact(float(x[i]), float(y[i]), float(vx[i]), float(vy[i]), int(power[i]), *self.args)
+                  for i in range(n)]
+        np.testing.assert_array_equal(batch, scalar)
+        self.assertEqual(set(np.unique(batch)), {contact.FLYING, contact.CRASHED, contact.RESTING,
+                                                 contact.STOPPED, contact.LANDED})
+
+        target = self.env.target
+        captured = contact.target_captured(x, y, target.posicao[0], target.posicao[1], target.altura / 2)
+        for i in range(0, n, 50):
+            self.assertEqual(captured[i], contact.target_captured(float(x[i]), float(y[i]), target.posicao[0],
+                                                                 target.posicao[1], target.altura / 2))
+
+    def test_swept_capture(self):
+        # O teste contínuo contém o do ponto final e acha as passagens pelo meio do segmento
+        rng = np.random.default_rng(1)
+        n = 3000
+        x0, y0 = rng.uniform(0, 200, n), rng.uniform(0, 200, n)
+        x1, y1 = rng.uniform(0, 200, n), rng.uniform(0, 200, n)
+        hit, fraction = contact.swept_target_capture(x0, y0, x1, y1, 100.0, 100.0, 15.0)
+        self.assertTrue(np.all(hit[contact.target_captured(x1, y1, 100.0, 100.0, 15.0)]))
+
+        s = np.linspace(0, 1, 2001)[:, None]
+        sampled = contact.target_captured(x0 + s * (x1 - x0), y0 + s * (y1 - y0), 100.0, 100.0, 15.0)
+        np.testing.assert_array_equal(hit, sampled.any(axis=0))
+        first = np.argmax(sampled, axis=0) / 2000.0
+        np.testing.assert_allclose(fraction[hit], first[hit], atol=1e-3)
+        for i in range(0, n, 100):
+            self.assertEqual((bool(hit[i]), float(fraction[i])), contact.swept_target_capture(
+                float(x0[i]), float(y0[i]), float(x1[i]), float(y1[i]), 100.0, 100.0, 15.0))
+
+    def test_swept_ground_contact(self):
+        crossing, fraction, x, y, vx, vy = contact.swept_ground_contact(0.0, 100.0, 10.0, -100.0,
+                                                                        20.0, -60.0, 30.0, -300.0, 20.0)
+        self.assertTrue(crossing)
+        self.assertAlmostEqual(fraction, 0.5)
+        self.assertEqual((x, y, vx, vy), (10.0, 20.0, 20.0, -200.0))
+        # Sem cruzamento, o estado é o do fim do passo
+        self.assertEqual(contact.swept_ground_contact(0.0, 100.0, 10.0, -100.0, 20.0, 60.0, 30.0, -300.0, 20.0),
+                         (False, 1.0, 20.0, 60.0, 30.0, -300.0))
+
+    def test_environment_ccd(self):
+        target_x, target_y = self.env.target.posicao
+        results = {}
+        for ccd in (False, True):
+            # Passo grosso: o foguete atravessa o target entre o início e o fim do passo
+            env = RocketEnvironment(dt=0.1, ccd=ccd)
+            env.rocket.posicao = [target_x - 100.0, float(target_y)]
+            env.rocket.velocidade = [1200.0, 0.0]
+            env.step(0)
+            results[ccd] = env.rocket.target_reached
+        self.assertEqual(results, {False: False, True: True})
+
+        # Queda na plataforma de pouso: o contato é avaliado no instante do impacto
+        half_height = self.env.rocket_height / 2
+        landing_x = (self.env.platform_spans[1][0] + self.env.platform_spans[1][1]) / 2
+        env = RocketEnvironment(dt=0.1, ccd=True)
+        env.rocket.posicao = [landing_x, half_height + 5.0]
+        env.rocket.velocidade = [0.0, -10.0]
+        env.step(0)
+        self.assertTrue(env.rocket.landed)
+        self.assertEqual(env.rocket.posicao, [landing_x, half_height])
+
+        env = RocketEnvironment(dt=0.5, ccd=True)
+        env.rocket.posicao = [landing_x, 100.0]
+        env.rocket.velocidade = [50.0, -100.0]
+        _, _, done, _ = env.step(0)
+        self.assertTrue(done and env.rocket.crashed)
+        self.assertEqual(env.rocket.posicao[1], half_height)
+        self.assertTrue(landing_x < env.rocket.posicao[0] < landing_x + 25.0)
+
+    def test_action_repeat(self):
+        # action_repeat=k equivale a k passos com a mesma ação, com uma única recompensa
+        repeated = RocketEnvironment(action_repeat=4)
+        single = RocketEnvironment()
+        for action in (1, 1, 5, 0, 6, 3):
+            repeated.step(action)
+            for _ in range(4):
+                single.step(action)
+        np.testing.assert_array_equal(repeated.snapshot()[:11], single.snapshot()[:11])
+        self.assertEqual(repeated.total_steps, 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import numpy as np
+from game.src import contact
+from game.src.course import Course
+from game.src.entities.platform import Platform
+from game.src.entities.target import Target
+from game.src.environment import RocketEnvironment
+
+def make_course(rng, targets=40, platforms=12, ordered=True):
+    # Plataformas de 60 pixels a cada 200, fora de ordem; pouso nas de índice par
+    starts = rng.permutation(platforms) * 200.0 + 50.0
+    pads = [Platform(float(x), 60.0) for x in starts]
+    waypoints = [Target(float(x), float(y), 30, 30)
+                 for x, y in zip(rng.uniform(0, 2400, targets), rng.uniform(100, 800, targets))]
+    return Course(waypoints, pads, landing=range(0, platforms, 2), start=1, ordered=ordered)
+
+class TestCourse(unittest.TestCase):
+    def test_platform_lookup(self):
+        rng = np.random.default_rng(0)
+        course = make_course(rng)
+        x = rng.uniform(-100, 2600, 3000)
+        expected = np.full(len(x), -1)
+        for index, (start, end) in enumerate(course.platform_spans):
+            expected[(x >= start) & (x <= end)] = index
+        np.testing.assert_array_equal(course.platform_indices(x), expected)
+        self.assertEqual([course.platform_at(float(v)) for v in x], expected.tolist())
+        with self.assertRaises(ValueError):
+            Course(course.targets, [Platform(0, 100), Platform(100, 100)])
+
+    def test_ground_contact_matches_contact_module(self):
+        env = RocketEnvironment()
+        rng = np.random.default_rng(1)
+        n = 2000
+        args = (rng.uniform(0, env.width, n), rng.uniform(0, 40, n), rng.normal(0, 150, n),
+                rng.normal(0, 150, n), rng.integers(0, 3, n) * 10)
+        expected = contact.ground_contact(*args, env.rocket_height / 2, env.platform_spans,
+                                          RocketEnvironment.LANDING_PLATFORM_INDEX, env.landing_speed_threshold)
+        batch = env.course.ground_contact(*args, env.rocket_height / 2, env.landing_speed_threshold)
+        np.testing.assert_array_equal(batch, expected)
+        scalar = [env.course.ground_contact(*(float(a[i]) for a in args), env.rocket_height / 2,
+                                            env.landing_speed_threshold) for i in range(n)]
+        np.testing.assert_array_equal(scalar, expected)
+
+    def test_any_order_capture_batch(self):
+        rng = np.random.default_rng(2)
+        course = make_course(rng, targets=60, ordered=False)
+        n = 500
+        # Metade dos foguetes perto de algum target
+        near = rng.integers(len(course), size=n)
+        x = np.where(np.arange(n) % 2, course.target_x[near] + rng.normal(0, 12, n), rng.uniform(0, 2400, n))
+        y = np.where(np.arange(n) % 2, course.target_y[near] + rng.normal(0, 12, n), rng.uniform(100, 800, n))
+        collected, next_target = course.new_progress(n)
+        collected[:, ::3] = True  # targets já coletados não contam
+
+        captured = course.capture_batch(x, y, collected, next_target)
+        for i in range(n):
+            inside = ((x[i] - course.target_x) ** 2 + (y[i] - course.target_y) ** 2
+                      <= course.target_radius ** 2) & ~collected[i]
+            if inside.any():
+                self.assertTrue(inside[captured[i]])
+            else:
+                self.assertEqual(captured[i], -1)
+            self.assertEqual(course.capture(x[i], y[i], collected[i], next_target[i]) >= 0, captured[i] >= 0)
+        self.assertGreater((captured >= 0).sum(), 50)
+
+        course.collect_batch(x, y, collected, next_target, captured)
+        hit = np.flatnonzero(captured >= 0)
+        self.assertTrue(collected[hit, captured[hit]].all())
+        self.assertTrue((~collected[hit, next_target[hit]]).all())
+
+    def test_environment_ordered_course(self):
+        targets = [Target(400, 300, 30, 30), Target(800, 500, 30, 30), Target(1200, 300, 30, 30)]
+        platforms = [Platform(1300, 200), Platform(100, 200)]
+        env = RocketEnvironment(course=Course(targets, platforms, landing=(0,), start=1), reward_terms=True)
+        env.reset()
+        self.assertIs(env.landing_platform, platforms[0])
+        self.assertEqual(env.landing_platform_index, 1)
+        self.assertEqual(env.rocket_initial_x, 200)
+
+        rewards = []
+        # Passa pelo segundo target antes do primeiro: fora de ordem não conta
+        for index in (1, 0, 1, 2):
+            env.rocket.posicao = list(targets[index].posicao)
+            env.rocket.velocidade = [0.0, 0.0]
+            state, reward, done, info = env.step(0)
+            rewards.append(info["reward_terms"][0])
+            if index == 1 and not env.collected[0]:
+                self.assertIs(env.target, targets[0])
+        self.assertEqual(rewards, [0, 100, 100, 100])
+        self.assertTrue(env.rocket.target_reached)
+        self.assertEqual(env.next_target, -1)
+
+        # Snapshot com o progresso no percurso
+        env.reset()
+        env.rocket.posicao = list(targets[0].posicao)
+        env.step(0)
+        snapshot = env.snapshot()
+        self.assertEqual(len(snapshot), 13 + 1 + len(targets))
+        env.reset()
+        env.restore(snapshot)
+        np.testing.assert_array_equal(env.collected, [True, False, False])
+        self.assertIs(env.target, targets[1])
+
+if __name__ == "__main__":
+    unittest.main()
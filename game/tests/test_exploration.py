@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+from game.src.exploration import apex_epsilons, epsilon_greedy
+
+class TestExploration(unittest.TestCase):
+    def setUp(self):
+        # Valores Q lineares no estado: a melhor ação é o índice do maior componente
+        self.calls = []
+
+        def q_values(states):
+            self.calls.append(len(states))
+            return states
+        self.q_values = q_values
+
+    def test_single_call_with_greedy_rows_only(self):
+        rng = np.random.default_rng(0)
+        states = rng.random((256, 9))
+        epsilons = apex_epsilons(256)
+        actions, predicted = epsilon_greedy(np.random.default_rng(1), states, epsilons, 9, self.q_values)
+        self.assertEqual(self.calls, [predicted])
+        self.assertEqual(actions.shape, (256,))
+
+        # Mesmo sorteio: as linhas gulosas recebem o argmax, as outras a ação aleatória
+        replay = np.random.default_rng(1)
+        explore = replay.random(256) <= epsilons
+        random_actions = replay.integers(9, size=256)
+        self.assertEqual(predicted, int((~explore).sum()))
+        np.testing.assert_array_equal(actions[~explore], np.argmax(states[~explore], axis=1))
+        np.testing.assert_array_equal(actions[explore], random_actions[explore])
+
+    def test_epsilon_extremes(self):
+        states = np.random.default_rng(2).random((64, 9))
+        actions, predicted = epsilon_greedy(np.random.default_rng(3), states, 1.0, 9, self.q_values)
+        self.assertEqual((predicted, self.calls), (0, []))
+        actions, predicted = epsilon_greedy(np.random.default_rng(3), states, 0.0, 9, self.q_values)
+        self.assertEqual(self.calls, [64])
+        np.testing.assert_array_equal(actions, np.argmax(states, axis=1))
+
+    def test_per_environment_rates(self):
+        epsilons = np.array([0.9, 0.5, 0.1])
+        states = np.zeros((3, 9))
+        rng = np.random.default_rng(4)
+        explored = np.zeros(3)
+        for _ in range(4000):
+            # Com Q = 0 a ação gulosa é 0; ações diferentes de 0 vêm da exploração
+            actions, _ = epsilon_greedy(rng, states, epsilons, 9, self.q_values)
+            explored += actions != 0
+        np.testing.assert_allclose(explored / 4000, epsilons * 8 / 9, atol=0.03)
+
+    def test_apex_epsilons(self):
+        epsilons = apex_epsilons(8, base=0.4, alpha=7.0)
+        self.assertAlmostEqual(epsilons[0], 0.4)
+        self.assertAlmostEqual(epsilons[-1], 0.4 ** 8)
+        self.assertTrue(np.all(np.diff(epsilons) < 0))
+        np.testing.assert_array_equal(apex_epsilons(1), [0.4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.frame_recorder import record_episodes, read_frames
+
+class TestFrameRecorder(unittest.TestCase):
+    def test_round_trip(self):
+        # Grava um episódio curto e confere que cada frame lido é idêntico ao renderizado
+        actions = [1] * 40 + [3] * 10 + [0] * 20
+        env = RocketEnvironment(render_mode='rgb_array')
+        env.max_steps = len(actions)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'episode.rktf')
+            action_iter = iter(actions)
+            record_episodes(env, lambda state: next(action_iter), path, episodes=1)
+
+            reference_env = RocketEnvironment(render_mode='rgb_array')
+            reference_env.max_steps = len(actions)
+            reference_env.reset()
+            count = 0
+            for episode, step, frame in read_frames(path):
+                self.assertEqual(step, count)
+                np.testing.assert_array_equal(frame, reference_env.render())
+                if step < len(actions):
+                    reference_env.step(actions[step])
+                count += 1
+
+        # Um frame por ação mais o frame final do episódio
+        self.assertEqual(count, len(actions) + 1)
+
+if __name__ == '__main__':
+    unittest.main()
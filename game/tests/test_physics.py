@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.physics import RocketBatch, world_from_environment
+from game.src.policies import ScriptedPolicy
+
+class TestRocketBatch(unittest.TestCase):
+    def test_matches_environment_bit_for_bit(self):
+        # Episódio completo (decolagem, target e pouso) com ações variadas
+        env = RocketEnvironment(seed=0)
+        policy = ScriptedPolicy(env.width, env.height)
+        rng = np.random.default_rng(1)
+        state = env.reset()
+        batch = RocketBatch(3, world_from_environment(env))
+        batch.fill_from_rocket(env.rocket)
+        done = False
+        while not done:
+            action = policy.act(state) if rng.random() < 0.7 else int(rng.integers(env.ACTION_SPACE_SIZE))
+            state, reward, done, info = env.step(action)
+            batch.step(np.full(3, action))
+            snapshot = env.snapshot()
+            for i in range(3):
+                np.testing.assert_array_equal(snapshot[:11], [
+                    batch.x[i], batch.y[i], batch.vx[i], batch.vy[i], batch.orientacao[i],
+                    batch.angular_velocity[i], batch.potencia[i], batch.fuel[i],
+                    batch.target_reached[i], batch.landed[i], batch.crashed[i]])
+        self.assertTrue(batch.done.all())
+        self.assertTrue(env.rocket.landed)
+
+    def test_metrics_match_rocket(self):
+        env = RocketEnvironment()
+        rng = np.random.default_rng(2)
+        batch = RocketBatch(200, world_from_environment(env))
+        batch.x[:] = rng.uniform(0, env.width, 200)
+        batch.y[:] = rng.uniform(0, env.height, 200)
+        batch.orientacao[:] = rng.uniform(-720, 720, 200)
+        metrics = batch.metrics()
+        rocket = env.rocket
+        for i in range(0, 200, 7):
+            rocket.posicao = [float(batch.x[i]), float(batch.y[i])]
+            rocket.orientacao = float(batch.orientacao[i])
+            rocket.compute_metrics(env.target, env.landing_platform)
+            for name, values in metrics.items():
+                self.assertAlmostEqual(getattr(rocket, name), values[i], places=9)
+        self.assertEqual(list(batch.metrics(['angle_difference'])), ['angle_difference'])
+
+    def test_finished_rockets_stay_put(self):
+        env = RocketEnvironment()
+        batch = RocketBatch(2, world_from_environment(env))
+        batch.fill(800, 100, 0, -600, 90, 0, 0)
+        batch.x[1] = env.landing_platform_x + 100
+        batch.y[1] = 300
+        while not batch.crashed[0]:
+            batch.step(np.zeros(2, dtype=int))
+        x, y = batch.x[0], batch.y[0]
+        for _ in range(10):
+            batch.step(np.ones(2, dtype=int))
+        self.assertEqual((batch.x[0], batch.y[0], batch.potencia[0]), (x, y, 0))
+        self.assertFalse(batch.done[1])
+        self.assertEqual(batch.potencia[1], 10)
+
+if __name__ == '__main__':
+    unittest.main()
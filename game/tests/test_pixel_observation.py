@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.pixel_observation import PixelRasterizer, FrameStack, ROCKET_VALUE, TARGET_VALUE
+from game.src.course import Course
+from game.src.entities.platform import Platform
+from game.src.entities.target import Target
+
+class TestPixelObservation(unittest.TestCase):
+    def setUp(self):
+        self.env = RocketEnvironment()
+        self.rasterizer = PixelRasterizer(self.env, (84, 84))
+
+    def test_batch_matches_single(self):
+        # O caminho em lote deve produzir exatamente as mesmas imagens que o caminho escalar
+        rng = np.random.default_rng(0)
+        n = 64
+        x = rng.uniform(-50, self.env.width + 50, n)
+        y = rng.uniform(-50, self.env.height + 50, n)
+        orientation = rng.uniform(0, 360, n)
+        target_reached = rng.random(n) < 0.5
+
+        batch = np.zeros((n, 84, 84), dtype=np.uint8)
+        self.rasterizer.render_batch(batch, x, y, orientation, target_reached)
+        single = np.zeros((84, 84), dtype=np.uint8)
+        for i in range(n):
+            self.rasterizer.render(single, x[i], y[i], orientation[i], target_reached[i])
+            np.testing.assert_array_equal(single, batch[i])
+
+    def test_rocket_and_target_visible(self):
+        image = np.zeros((84, 84), dtype=np.uint8)
+        self.rasterizer.render(image, 800, 450, 90, False)
+        self.assertTrue((image == ROCKET_VALUE).any())
+        self.assertTrue((image == TARGET_VALUE).any())
+
+        self.rasterizer.render(image, 800, 450, 90, True)
+        self.assertFalse((image == TARGET_VALUE).any())
+
+    def test_course_targets_follow_progress(self):
+        # Só os targets que faltam aparecem; depois de coletar o primeiro, só o segundo
+        course = Course([Target(400, 300, 30, 30), Target(800, 500, 30, 30)],
+                        [Platform(100, 200), Platform(1300, 200)])
+        env = RocketEnvironment(course=course, observation_mode='pixels', frame_stack=1)
+        rasterizer = env.pixel_rasterizer
+
+        def target_center(image):
+            rows, cols = np.nonzero(image == TARGET_VALUE)
+            return (cols.mean() + 0.5) * rasterizer.scale_x, env.height - (rows.mean() + 0.5) * rasterizer.scale_y
+
+        env.rocket.posicao = [600.0, 700.0]
+        env.rocket.velocidade = [0.0, 0.0]
+        frame = env.step(0)[0][-1]
+        for pixels in rasterizer._target_pixels:
+            self.assertTrue((frame[pixels] == TARGET_VALUE).all())
+
+        env.rocket.posicao = [400.0, 300.0]
+        env.rocket.velocidade = [0.0, 0.0]
+        frame = env.step(0)[0][-1]
+        self.assertTrue(env.collected[0])
+        np.testing.assert_allclose(target_center(frame), (800, 500), atol=max(rasterizer.scale_x, rasterizer.scale_y))
+
+        # O lote desenha o mesmo conjunto de targets de cada foguete
+        collected = np.array([[False, False], [True, False], [True, True]])
+        x, y, orientation = np.full(3, 600.0), np.full(3, 700.0), np.full(3, 90.0)
+        batch = np.zeros((3, 84, 84), dtype=np.uint8)
+        rasterizer.render_batch(batch, x, y, orientation, collected.all(axis=1), collected)
+        single = np.zeros((84, 84), dtype=np.uint8)
+        for i in range(3):
+            rasterizer.render(single, x[i], y[i], orientation[i], collected[i].all(), collected[i])
+            np.testing.assert_array_equal(single, batch[i])
+        self.assertFalse((batch[2] == TARGET_VALUE).any())
+
+    def test_frame_stack_order(self):
+        stack = FrameStack(2, 3, 1, 1)
+        stack.reset(np.zeros((2, 1, 1), dtype=np.uint8))
+        for value in (1, 2, 3, 4):
+            stack.push(np.full((2, 1, 1), value, dtype=np.uint8))
+        # Os frames mais antigos vêm primeiro
+        np.testing.assert_array_equal(stack.frames()[0, :, 0, 0], [2, 3, 4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.policies import make_policy, RandomPolicy, ScriptedPolicy
+from game.src.mpc import CEMController
+
+class TestPolicies(unittest.TestCase):
+    def test_make_policy(self):
+        rng = np.random.default_rng(0)
+        self.assertIsInstance(make_policy('random', rng), RandomPolicy)
+        self.assertIsInstance(make_policy('scripted', rng), ScriptedPolicy)
+        self.assertIsInstance(make_policy('mpc', rng), CEMController)
+        controller = make_policy('mpc:horizon=5,population=32,elites=4,smoothing=0.5', rng)
+        self.assertEqual((controller.horizon, controller.population, controller.smoothing), (5, 32, 0.5))
+        with self.assertRaises(ValueError):
+            make_policy('unknown', rng)
+
+    def test_scripted_policy_lands(self):
+        # O controlador manual deve pegar o target e pousar na plataforma de pouso
+        env = RocketEnvironment()
+        policy = make_policy('scripted', None)
+        state = env.reset()
+        done = False
+        while not done:
+            state, reward, done, info = env.step(policy.act(state))
+        self.assertTrue(env.rocket.target_reached)
+        self.assertTrue(env.rocket.landed)
+        self.assertFalse(env.rocket.crashed)
+
+    def test_mpc_controller(self):
+        # Mesma semente, mesmas ações; do chão, o controlador começa a subir
+        env = RocketEnvironment()
+        runs = []
+        for _ in range(2):
+            policy = make_policy('mpc:population=64,elites=8', np.random.default_rng(0))
+            state = env.reset()
+            actions = []
+            for _ in range(150):
+                actions.append(policy.act(state))
+                state, reward, done, info = env.step(actions[-1])
+            runs.append(actions)
+        self.assertEqual(runs[0], runs[1])
+        self.assertTrue(all(0 <= a < env.ACTION_SPACE_SIZE for a in runs[0]))
+        self.assertGreater(env.rocket.potencia_motor, 0)
+        self.assertFalse(env.rocket.crashed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import math
+import unittest
+import numpy as np
+from game.src.entities.rocket import Rocket
+from game.src.environment import RocketEnvironment
+from game.src.predictor import predict_impact, predict_impact_single
+
+GROUND = 20.0
+DT = 1.0 / 60
+
+def simulate_impact(rocket, max_steps=5000):
+    """Integra a física discreta até o contato com o chão."""
+    for step in range(1, max_steps + 1):
+        rocket.atualizar(DT)
+        if rocket.posicao[1] <= GROUND and rocket.velocidade[1] <= 0:
+            return step * DT, rocket.posicao[0], math.hypot(*rocket.velocidade)
+    return math.inf, math.nan, math.nan
+
+def make_rocket(x, y, vx, vy, orientacao, potencia):
+    rocket = Rocket(x, y, 50)
+    rocket.velocidade = np.array([vx, vy], dtype=float)
+    rocket.orientacao = orientacao
+    rocket.potencia_motor = potencia
+    return rocket
+
+class TestPredictor(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 200
+        self.cases = np.column_stack([
+            rng.uniform(100, 1100, n), rng.uniform(30, 800, n),
+            rng.normal(0, 100, n), rng.normal(0, 100, n),
+            rng.uniform(0, 180, n), rng.integers(0, 11, n) * 10,
+        ])
+
+    def test_batch_matches_single(self):
+        t, impact_x, speed = predict_impact(*self.cases.T, ground=GROUND)
+        for i, case in enumerate(self.cases):
+            expected = predict_impact_single(make_rocket(*case), GROUND)
+            if math.isinf(expected[0]):
+                self.assertTrue(np.isinf(t[i]))
+                continue
+            np.testing.assert_allclose((t[i], impact_x[i], speed[i]), expected, rtol=1e-9, atol=1e-9)
+
+    def test_matches_discrete_simulation(self):
+        # A integração a 60 Hz atrasa o contato em no máximo um passo; o erro
+        # de posição cresce com a duração, então só voos de até 10 s são comparados
+        hits = 0
+        for case in self.cases:
+            predicted = predict_impact_single(make_rocket(*case), GROUND)
+            if predicted[0] > RocketEnvironment.PREDICTION_HORIZON:
+                continue
+            rocket = make_rocket(*case)
+            simulated = simulate_impact(rocket)
+            self.assertAlmostEqual(predicted[0], simulated[0], delta=0.05)
+            self.assertAlmostEqual(predicted[1], simulated[1], delta=25)
+            self.assertAlmostEqual(predicted[2], simulated[2], delta=0.03 * simulated[2] + 1)
+            hits += 1
+        self.assertGreater(hits, 50)
+
+    def test_no_impact_when_climbing(self):
+        t, impact_x, speed = predict_impact_single(make_rocket(600, 300, 0, 50, 90, 100), GROUND)
+        self.assertTrue(math.isinf(t))
+        self.assertTrue(math.isnan(impact_x))
+        batch = predict_impact([600, 600], [300, 300], [0, 0], [50, -50], [90, 90], [100, 0], ground=GROUND)
+        self.assertTrue(np.isinf(batch[0][0]))
+        self.assertTrue(np.isfinite(batch[0][1]))
+
+    def test_environment_features(self):
+        env = RocketEnvironment(seed=0, prediction_features=True)
+        state = env.reset()
+        self.assertEqual(len(state), RocketEnvironment(seed=0).get_state_size() + 3)
+        self.assertEqual(len(state), env.get_state_size())
+        for _ in range(30):
+            state, reward, done, info = env.step(0)  # só reduz a potência: o foguete cai
+            if done:
+                break
+        self.assertTrue(np.all(np.isfinite(state)))
+        self.assertTrue(0 <= state[-3] <= 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import time
+from game.src.profiling import PhaseProfiler, EpisodeRangeProfiler, parse_episode_range
+
+class TestProfiling(unittest.TestCase):
+    def test_phase_totals(self):
+        profiler = PhaseProfiler()
+        for _ in range(2):
+            profiler.start()
+            time.sleep(0.01)
+            profiler.lap('env')
+            profiler.lap('act')
+            profiler.count('steps', 10)
+            summary = profiler.end_episode()
+            self.assertIn('env', summary)
+            self.assertIn('steps: 10', summary)
+
+        self.assertGreaterEqual(profiler.totals['env'], 0.02)
+        self.assertLess(profiler.totals['act'], profiler.totals['env'])
+        self.assertEqual(profiler.counters['steps'], 20)
+        self.assertEqual(profiler.episode_totals, {})
+
+    def test_episode_range(self):
+        self.assertEqual(parse_episode_range('3-5'), (3, 5))
+        self.assertEqual(parse_episode_range('7'), (7, 7))
+
+        episode_profiler = EpisodeRangeProfiler(1, 2)
+        for e in range(5):
+            episode_profiler.begin_episode(e)
+            sum(range(1000))
+            episode_profiler.end_episode(e)
+        self.assertEqual(episode_profiler.captured, 2)
+        self.assertIn('function calls', episode_profiler.close())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.replay_memory import ReplayMemory
+from game.src.course import Course
+from game.src.entities.platform import Platform
+from game.src.entities.target import Target
+
+class TestReplayMemory(unittest.TestCase):
+    def collect(self, env, episodes, rng, truncate=None):
+        """Transições de episódios com ações aleatórias; `truncate` corta episódios sem done."""
+        transitions = []
+        for _ in range(episodes):
+            state = env.reset()
+            done = False
+            steps = 0
+            while not done and steps != truncate:
+                action = int(rng.integers(env.ACTION_SPACE_SIZE))
+                next_state, reward, done, _ = env.step(action)
+                transitions.append((state, action, reward, next_state, done))
+                state = next_state
+                steps += 1
+        return transitions
+
+    def stored(self, memory):
+        """Transições válidas em ordem de gravação, a partir do slot mais antigo."""
+        slots = (np.arange(memory.capacity) + memory.head) % memory.capacity
+        slots = slots[memory.valid[slots]]
+        return (memory.dequantize(memory.observations[slots]), memory.actions[slots], memory.rewards[slots],
+                memory.dequantize(memory.observations[(slots + 1) % memory.capacity]), memory.dones[slots])
+
+    def test_quantization_error(self):
+        env = RocketEnvironment(seed=0, prediction_features=True)
+        low, high = env.state_bounds()
+        transitions = self.collect(env, 3, np.random.default_rng(0), truncate=400)
+        reference = np.array([t[0] for t in transitions] + [transitions[-1][3]])
+        # Trajetórias aleatórias ficam dentro dos limites
+        self.assertTrue(np.all((reference >= low) & (reference <= high)))
+
+        for dtype in ('uint16', 'uint8'):
+            memory = ReplayMemory(len(transitions) + 10, env.get_state_size(), dtype, low, high)
+            for transition in transitions:
+                memory.append(*transition)
+            states, actions, rewards, next_states, dones = self.stored(memory)
+            self.assertEqual(len(memory), len(transitions))
+            bound = memory.scale / 2 + 1e-6 * np.maximum(np.abs(low), np.abs(high))
+            self.assertTrue(np.all(np.abs(states - reference[:-1]) <= bound), dtype)
+            expected_next = np.array([t[3] for t in transitions])
+            self.assertTrue(np.all(np.abs(next_states - expected_next) <= bound), dtype)
+            np.testing.assert_array_equal(actions, [t[1] for t in transitions])
+            np.testing.assert_allclose(rewards, [t[2] for t in transitions], rtol=1e-6)
+            np.testing.assert_array_equal(dones, [t[4] for t in transitions])
+
+        memory = ReplayMemory(len(transitions) + 10, env.get_state_size(), 'float16')
+        for transition in transitions:
+            memory.append(*transition)
+        states = self.stored(memory)[0]
+        np.testing.assert_allclose(states, reference[:-1], rtol=2.0 ** -11, atol=1e-7)
+
+        # Fora dos limites, o valor é saturado
+        memory = ReplayMemory(4, env.get_state_size(), 'uint8', low, high)
+        np.testing.assert_allclose(memory.dequantize(memory.quantize(high + 1.0)), high, rtol=1e-6)
+
+    def test_wraparound_sampling(self):
+        env = RocketEnvironment(seed=1)
+        rng = np.random.default_rng(1)
+        transitions = self.collect(env, 4, rng, truncate=150)
+        memory = ReplayMemory(200, env.get_state_size(), 'float32')
+        for transition in transitions:
+            memory.append(*transition)
+            self.assertLessEqual(len(memory), memory.capacity)
+        # Cada next_state amostrado é o sucessor de seu state em alguma transição gravada
+        pairs = {(np.float32(t[0]).tobytes(), np.float32(t[3]).tobytes()) for t in transitions}
+        states, _, _, next_states, _ = memory.sample(len(memory), rng)
+        for state, next_state in zip(states, next_states):
+            self.assertIn((state.tobytes(), next_state.tobytes()), pairs)
+
+    def test_multi_target_round_trip(self):
+        # Depois da primeira captura, as features do target atual mudam e não podem ser saturadas
+        course = Course([Target(300, 300, 30, 30), Target(900, 500, 30, 30)],
+                        [Platform(100, 200), Platform(1300, 200)])
+        env = RocketEnvironment(course=course)
+        low, high = env.state_bounds()
+        env.rocket.posicao = [300.0, 300.0]
+        state, _, _, _ = env.step(0)
+        self.assertEqual(env.next_target, 1)
+        np.testing.assert_allclose(state[7:9], [900 / env.width, 500 / env.height])
+        for dtype in ('uint16', 'uint8'):
+            memory = ReplayMemory(4, env.get_state_size(), dtype, low, high)
+            decoded = memory.dequantize(memory.quantize(state[None]))[0]
+            np.testing.assert_allclose(decoded[7:9], state[7:9], atol=1e-2, err_msg=dtype)
+
+    def test_compact_size(self):
+        env = RocketEnvironment()
+        low, high = env.state_bounds()
+        state_size = env.get_state_size()
+        # Duas observações float64 por transição na memória de tuplas
+        payload = 2 * state_size * 8
+        for dtype, ratio in (('float16', 4), ('uint16', 4), ('uint8', 8)):
+            memory = ReplayMemory(1000, state_size, dtype, low, high)
+            self.assertLessEqual(memory.nbytes / memory.capacity, payload / ratio, dtype)
+        with self.assertRaises(ValueError):
+            ReplayMemory(10, state_size, 'uint8')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.policies import ScriptedPolicy
+from game.src.rewards import (DEFAULT_REWARD_SPEC, METRICS, RewardSpec, Event, FuelBonus, Improvement, Linear,
+                              stack_metrics)
+
+class TestRewards(unittest.TestCase):
+    def run_episode(self, env, explore):
+        # Controlador manual com ações aleatórias: passa por captura, pouso e quedas
+        policy = ScriptedPolicy(env.width, env.height)
+        rng = np.random.default_rng(int(explore * 10))
+        state = env.reset()
+        steps = []
+        done = False
+        while not done:
+            previous = env.reward_metrics
+            action = policy.act(state) if rng.random() > explore else int(rng.integers(env.ACTION_SPACE_SIZE))
+            state, reward, done, info = env.step(action)
+            steps.append((previous, env.reward_metrics, reward, info))
+        return steps
+
+    def test_default_spec_terms(self):
+        env = RocketEnvironment(reward_terms=True)
+        steps = self.run_episode(env, 0.0)
+        self.assertTrue(env.rocket.landed and env.rocket.target_reached)
+        totals = np.sum([info["reward_terms"] for _, _, _, info in steps], axis=0)
+        breakdown = DEFAULT_REWARD_SPEC.breakdown(totals)
+        self.assertEqual(breakdown["target"], 100)
+        self.assertEqual(breakdown["crash"], 0)
+        self.assertAlmostEqual(breakdown["mission"], 500 - env.rocket.fuel_consumed)
+        for _, _, reward, info in steps:
+            self.assertEqual(reward, sum(info["reward_terms"]))
+
+    def test_vectorized_matches_steps(self):
+        # Todas as transições de vários episódios avaliadas numa única chamada; as
+        # recompensas do ambiente vêm de evaluate_scalar, sem os termos
+        env = RocketEnvironment()
+        steps = [step for explore in (0.0, 0.3, 0.6) for step in self.run_episode(env, explore)
+                 if step[3]["status"] == "in_progress"]
+        self.assertNotIn("reward_terms", steps[0][3])
+        previous = stack_metrics([step[0] for step in steps])
+        current = stack_metrics([step[1] for step in steps])
+        total, values = DEFAULT_REWARD_SPEC.evaluate(previous, current)
+        np.testing.assert_array_equal(total, [step[2] for step in steps])
+        self.assertEqual(len(values), len(DEFAULT_REWARD_SPEC.names))
+
+    def test_custom_spec(self):
+        spec = RewardSpec([
+            Event('target', 'target_captured', 1.0),
+            Improvement('approach_target', 'distance_to_target', 0.01, penalty=0.01),
+        ], timeout=0)
+        env = RocketEnvironment(reward_spec=spec, reward_terms=True)
+        env.max_steps = 50
+        steps = self.run_episode(env, 0.0)
+        self.assertEqual(steps[-1][3]["status"], "timeout")
+        self.assertEqual(steps[-1][2], 0)
+        for _, _, reward, info in steps[:-1]:
+            self.assertIn(reward, (0.01, -0.01))
+            self.assertEqual(len(info["reward_terms"]), 2)
+
+    def test_scalar_matches_evaluate(self):
+        # A função compilada e o caminho por dicionários dão a mesma recompensa,
+        # inclusive com um termo sem `source` (que usa o caminho por dicionários)
+        class Speed:
+            name = 'speed'
+
+            def evaluate(self, previous, current):
+                return 0.001 * current['power']
+
+        for terms in ([Improvement('approach', 'distance_to_target', 1.0, penalty=0.5, gate='target_reached'),
+                       FuelBonus('mission', 'landed_with_target', 100), Linear('fuel', 'power', -1.0)],
+                      [Event('target', 'target_captured', 1.0), Speed()]):
+            spec = RewardSpec(terms)
+            env = RocketEnvironment(reward_spec=spec)
+            for previous, current, reward, info in self.run_episode(env, 0.3):
+                if info["status"] == "in_progress":
+                    values = tuple(previous[name] for name in METRICS), tuple(current[name] for name in METRICS)
+                    self.assertEqual(spec.evaluate_scalar(*values), reward)
+                    self.assertEqual(spec.evaluate(previous, current)[0], reward)
+
+if __name__ == '__main__':
+    unittest.main()
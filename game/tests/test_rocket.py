@@ -29,6 +29,35 @@ class TestRocketPhysics(unittest.TestCase):
         self.assertAlmostEqual(self.rocket.distance_to_landing_platform_x, abs(100 - 500))
         self.assertAlmostEqual(self.rocket.distance_to_landing_platform_y, abs(100 - 0))
 
+    def test_metrics_follow_physics_steps(self):
+        # As métricas são calculadas na leitura e acompanham cada passo de física
+        self.rocket.potencia_motor = 80
+        self.rocket.angular_velocity = 30
+        self.rocket.compute_metrics(self.target, self.platform)
+        for _ in range(5):
+            self.rocket.atualizar(1 / 60)
+            dx = self.target.posicao[0] - self.rocket.posicao[0]
+            dy = self.target.posicao[1] - self.rocket.posicao[1]
+            self.assertEqual(self.rocket.distance_to_target, math.sqrt(dx**2 + dy**2))
+            self.assertEqual(self.rocket.angle_difference,
+                             abs((self.rocket.orientacao - math.degrees(math.atan2(dy, dx)) + 180) % 360 - 180))
+            self.assertEqual(self.rocket.distance_to_landing_platform_y, abs(self.rocket.posicao[1]))
+            self.assertEqual(self.rocket.metrics(), (
+                self.rocket.distance_to_target, self.rocket.angle_difference,
+                self.rocket.distance_to_landing_platform_x, self.rocket.distance_to_landing_platform_y))
+        self.rocket.reset()
+        self.assertIsNone(self.rocket.distance_to_target)
+
+    def test_direct_writes_invalidate_metrics(self):
+        # Atribuir posição ou orientação fora de update_physics invalida as métricas já lidas
+        self.rocket.compute_metrics(self.target, self.platform)
+        self.assertAlmostEqual(self.rocket.distance_to_target, math.sqrt(2) * 100)
+        self.rocket.posicao = [200, 150]
+        self.assertEqual(self.rocket.distance_to_target, 50)
+        self.assertEqual(self.rocket.distance_to_landing_platform_x, 300)
+        self.rocket.orientacao = 0.0
+        self.assertEqual(self.rocket.angle_difference, 90)
+
     def test_update_physics(self):
         # Testa se a atualização da física altera posição, velocidade e orientação
         initial_position = self.rocket.posicao.copy()
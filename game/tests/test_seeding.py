@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.main_headless import run_batch
+
+class TestSeeding(unittest.TestCase):
+    def test_environment_seed(self):
+        a = RocketEnvironment(seed=7)
+        b = RocketEnvironment(seed=7)
+        np.testing.assert_array_equal(a.np_random.random(5), b.np_random.random(5))
+
+        # reset(seed=...) reinicia o gerador
+        a.reset(seed=3)
+        b.reset(seed=3)
+        self.assertEqual(a.np_random.random(), b.np_random.random())
+        self.assertEqual(a.seed, 3)
+
+    def test_batch_runner_is_reproducible(self):
+        # Mesma semente: mesma sequência de episódios, episódio a episódio
+        first = run_batch('random', 30, workers=1, max_steps=300, seed=11, chunk_size=10)
+        second = run_batch('random', 30, workers=1, max_steps=300, seed=11, chunk_size=10)
+        np.testing.assert_array_equal(first["steps"], second["steps"])
+        np.testing.assert_array_equal(first["rewards"], second["rewards"])
+
+        other = run_batch('random', 30, workers=1, max_steps=300, seed=12, chunk_size=10)
+        self.assertFalse(np.array_equal(first["rewards"], other["rewards"]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.physics import RocketBatch, world_from_environment
+from game.src.spatial_hash import SpatialHash
+from game.src.swarm import SwarmWorld
+
+def brute_force_pairs(x, y, distance):
+    dx = x[:, None] - x[None, :]
+    dy = y[:, None] - y[None, :]
+    i, j = np.nonzero(np.triu(dx * dx + dy * dy < distance * distance, k=1))
+    return {(int(a), int(b)) for a, b in zip(i, j)}
+
+class TestSwarm(unittest.TestCase):
+    def test_pairs_match_brute_force(self):
+        rng = np.random.default_rng(0)
+        # Pontos espalhados (com coordenadas negativas e muito distantes) e aglomerados
+        x = np.concatenate([rng.uniform(-3000, 3000, 500), rng.normal(200, 30, 200), [1e6, 1e6 + 5]])
+        y = np.concatenate([rng.uniform(-500, 2000, 500), rng.normal(100, 30, 200), [-1e6, -1e6]])
+        spatial_hash = SpatialHash(50.0, len(x))
+        spatial_hash.build(x, y)
+        for distance in (20.0, 50.0):
+            pairs = spatial_hash.pairs(distance)
+            found = {(int(i), int(j)) for i, j in pairs}
+            self.assertEqual(len(found), len(pairs))  # sem pares repetidos
+            self.assertEqual(found, brute_force_pairs(x, y, distance))
+        with self.assertRaises(ValueError):
+            spatial_hash.pairs(60.0)
+
+    def test_matches_batch_without_collision_crashes(self):
+        env = RocketEnvironment()
+        n = 50
+        swarm = SwarmWorld(n, env, collisions_crash=False)
+        batch = RocketBatch(n, world_from_environment(env))
+        x = 100.0 + 200.0 * np.arange(n)
+        swarm.reset(x, 400.0, potencia=80)
+        batch.fill(x, 400.0, 0.0, 0.0, 90.0, 0.0, 80)
+        actions = np.random.default_rng(1).integers(env.ACTION_SPACE_SIZE, size=(300, n))
+        for row in actions:
+            _, outcome, _ = swarm.step(row)
+            _, expected = batch.step(row)
+            np.testing.assert_array_equal(outcome, expected)
+        np.testing.assert_array_equal(swarm.batch.x, batch.x)
+        np.testing.assert_array_equal(swarm.batch.y, batch.y)
+
+    def test_collisions_crash_both_rockets(self):
+        swarm = SwarmWorld(3)
+        # Dois foguetes em rota de colisão e um terceiro afastado
+        swarm.reset(np.array([500.0, 560.0, 900.0]), 400.0, vx=np.array([300.0, -300.0, 0.0]), potencia=83)
+        crashed_at = None
+        for step in range(60):
+            _, _, collisions = swarm.step(np.zeros(3, dtype=int))
+            if len(collisions):
+                crashed_at = step
+                np.testing.assert_array_equal(collisions, [[0, 1]])
+                break
+        self.assertIsNotNone(crashed_at)
+        np.testing.assert_array_equal(swarm.batch.crashed, [True, True, False])
+        np.testing.assert_array_equal(swarm.collided, [True, True, False])
+        # Os destroços não geram novas colisões
+        _, _, collisions = swarm.step(np.zeros(3, dtype=int))
+        self.assertEqual(len(collisions), 0)
+        # Vizinhança com raio maior que o de colisão
+        self.assertEqual({tuple(p) for p in swarm.neighbors()}, {(0, 1)})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from game.src.sweep import (expand_grid, sample_space, partition_cores, window_averages, ranking_key,
+                            MedianStoppingRule)
+
+class TestSweep(unittest.TestCase):
+    def test_expand_grid(self):
+        trials = expand_grid({"gamma": [0.95, 0.99], "hidden_units": [[64], [128, 128]]})
+        self.assertEqual(len(trials), 4)
+        self.assertEqual(trials[0], {"gamma": 0.95, "hidden_units": [64]})
+        self.assertEqual(trials[-1], {"gamma": 0.99, "hidden_units": [128, 128]})
+        with self.assertRaises(ValueError):
+            expand_grid({"learning_rate": {"log_uniform": [1e-4, 1e-2]}})
+
+    def test_sample_space(self):
+        space = {
+            "learning_rate": {"log_uniform": [1e-4, 1e-2]},
+            "gamma": {"uniform": [0.9, 0.999]},
+            "memory_size": {"int_uniform": [1000, 5000]},
+            "batch_size": [32, 64],
+        }
+        trials = sample_space(space, 50, np.random.default_rng(0))
+        self.assertEqual(len(trials), 50)
+        for params in trials:
+            self.assertTrue(1e-4 <= params["learning_rate"] <= 1e-2)
+            self.assertTrue(0.9 <= params["gamma"] <= 0.999)
+            self.assertIsInstance(params["memory_size"], int)
+            self.assertTrue(1000 <= params["memory_size"] <= 5000)
+            self.assertIn(params["batch_size"], (32, 64))
+        # Mesma semente, mesmos trials
+        self.assertEqual(trials, sample_space(space, 50, np.random.default_rng(0)))
+        with self.assertRaises(ValueError):
+            sample_space({"gamma": {"normal": [0.99, 0.01]}}, 1, np.random.default_rng(0))
+
+    def test_partition_cores(self):
+        self.assertEqual(partition_cores({3, 0, 2, 1}, 2), [[0, 1], [2, 3]])
+        self.assertEqual(partition_cores(range(5), 2), [[0, 1], [2, 3]])
+        # Menos núcleos que o pedido: um único grupo com todos
+        self.assertEqual(partition_cores([0], 4), [[0]])
+
+    def test_window_averages(self):
+        # Um episódio de sorte no início não vira a melhor média: só janelas completas contam
+        scores = [500.0] + [0.0] * 9 + [10.0] * 5
+        averages = window_averages(scores, 10)
+        self.assertEqual(len(averages), 6)
+        self.assertAlmostEqual(averages[0], 50.0)
+        self.assertAlmostEqual(averages[-1], 5.0)
+        self.assertEqual(window_averages(scores[:9], 10), [])
+
+        # Trials sem janela completa (NaN) ficam por último
+        values = [3.0, float("nan"), 7.0, -1.0]
+        self.assertEqual(sorted(values, key=ranking_key, reverse=True)[:3], [7.0, 3.0, -1.0])
+        self.assertEqual(max(values, key=ranking_key), 7.0)
+
+    def test_median_stopping_rule(self):
+        history = {}
+        rule = MedianStoppingRule(history, grace_episodes=50, interval=25, min_trials=2)
+        # Fora do intervalo e antes da carência nunca para
+        self.assertFalse(rule.should_stop(10, -1000.0))
+        for value in (10.0, 20.0):
+            self.assertFalse(rule.should_stop(25, value))
+        self.assertFalse(rule.should_stop(25, -1000.0))
+        self.assertEqual(history[25], [10.0, 20.0, -1000.0])
+        # Depois da carência, compara com a mediana dos trials anteriores
+        self.assertFalse(rule.should_stop(50, 10.0))
+        self.assertFalse(rule.should_stop(50, 30.0))
+        self.assertTrue(rule.should_stop(50, 15.0))
+        self.assertFalse(rule.should_stop(50, 25.0))
+
+if __name__ == "__main__":
+    unittest.main()
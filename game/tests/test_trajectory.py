@@ -0,0 +1,88 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from game.src.environment import RocketEnvironment
+from game.src.trajectory import TrajectoryWriter, read_trajectories, replay, seek
+from game.src.course import Course
+from game.src.entities.platform import Platform
+from game.src.entities.target import Target
+from game.replay_trajectory import make_environment
+
+class TestTrajectory(unittest.TestCase):
+    def record(self, path, seed, external_change_at=None):
+        # Grava um episódio com ações aleatórias; opcionalmente zera a potência por fora do env.step()
+        rng = np.random.default_rng(seed)
+        env = RocketEnvironment()
+        env.max_steps = 300
+        states = []
+        with TrajectoryWriter(path, snapshot_interval=50) as writer:
+            env.reset()
+            writer.begin_episode(env, seed=seed)
+            done = False
+            while not done:
+                if writer.step_count == external_change_at:
+                    env.rocket.potencia_motor = 0
+                states.append(env.snapshot())
+                action = 1 if rng.random() < 0.7 else int(rng.integers(9))
+                state, reward, done, info = writer.step(env, action)
+            writer.end_episode(env, info["status"])
+        return states, env.snapshot()
+
+    def test_replay_and_seek(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'episodes.rktj')
+            states, final = self.record(path, seed=0, external_change_at=120)
+            self.record(path, seed=1)
+
+            trajectories = read_trajectories(path)
+            self.assertEqual(len(trajectories), 2)
+            trajectory = trajectories[0]
+            self.assertEqual(len(trajectory), len(states))
+            self.assertTrue(trajectory.forced[trajectory.snapshot_steps == 120].all())
+
+            # Replay completo reproduz o estado final e a recompensa gravados
+            env = RocketEnvironment()
+            env.max_steps = 300
+            env.reset()
+            reward = replay(env, trajectory)
+            np.testing.assert_array_equal(env.snapshot(), final)
+            self.assertEqual(reward, trajectory.end["reward"])
+
+            # Seek para qualquer passo reproduz o estado gravado
+            self.assertGreater(len(states), 121)
+            for step in (0, 49, 50, 119, 120, 121, len(states) - 1):
+                seek(env, trajectory, step)
+                np.testing.assert_array_equal(env.snapshot(), states[step])
+
+    def test_course_is_recorded(self):
+        # O percurso vai na configuração do episódio e o replay recria o mesmo mundo
+        course = Course([Target(350, 120, 30, 30), Target(380, 260, 30, 30)],
+                        [Platform(900, 200), Platform(100, 200)], landing=(0,), start=1, ordered=False)
+        env = RocketEnvironment(course=course)
+        env.max_steps = 300
+        rng = np.random.default_rng(2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'course.rktj')
+            with TrajectoryWriter(path, snapshot_interval=50) as writer:
+                env.reset()
+                writer.begin_episode(env, seed=0)
+                done = False
+                while not done:
+                    action = 1 if rng.random() < 0.6 else int(rng.integers(9))
+                    state, reward, done, info = writer.step(env, action)
+                writer.end_episode(env, info["status"])
+            trajectory = read_trajectories(path)[0]
+
+        self.assertEqual(trajectory.config["course"], course.to_config())
+        replayed = make_environment(trajectory)
+        self.assertEqual(replayed.course.to_config(), course.to_config())
+        self.assertIs(replayed.landing_platform, replayed.course.landing_platforms[0])
+        self.assertEqual(replayed.landing_platform.posicao[0], 900)
+        reward = replay(replayed, trajectory)
+        np.testing.assert_array_equal(replayed.snapshot(), env.snapshot())
+        self.assertEqual(reward, trajectory.end["reward"])
+        self.assertEqual(len(replayed.snapshot()), 13 + 1 + len(course))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,14 +5,17 @@ import tensorflow as tf
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import Dense
 from tensorflow.keras.optimizers import Adam
-import random
 from collections import deque
-import matplotlib.pyplot as plt
 
 # Garantir que o diretório atual está no path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.environment import RocketEnvironment
+from src.trajectory import TrajectoryWriter
+from src.profiling import PhaseProfiler, EpisodeRangeProfiler, parse_episode_range
+from src.replay_memory import ReplayMemory, STORAGE_DTYPES
+from src.checkpoint_writer import CheckpointWriter
+from src.exploration import epsilon_greedy
 
 # Configura o TensorFlow para usar a GPU e mostrar informações sobre o dispositivo
 print("Verificando dispositivos disponíveis para TensorFlow:")
@@ -34,24 +37,57 @@ else:
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 
 class DQNAgent:
-    def __init__(self, state_size, action_size):
+    def __init__(self, state_size, action_size, seed=None, gamma=0.99, epsilon_decay=0.995,
+                 epsilon_min=0.01, learning_rate=0.001, memory_size=10000, hidden_units=(64, 64),
+                 replay_storage=None, state_bounds=None):
+        """
+        Args:
+            state_size: Tamanho do vetor de estado
+            action_size: Número de ações
+            seed: Semente do agente (None = não determinístico)
+            gamma: Fator de desconto
+            epsilon_decay: Fator aplicado ao epsilon após cada replay
+            epsilon_min: Epsilon mínimo
+            learning_rate: Taxa de aprendizado do Adam
+            memory_size: Capacidade da memória de replay (transições)
+            hidden_units: Neurônios de cada camada oculta
+            replay_storage: None para a memória de tuplas, ou o tipo das observações
+                            na memória compacta (ver src.replay_memory.STORAGE_DTYPES)
+            state_bounds: Par (low, high) de RocketEnvironment.state_bounds(),
+                          obrigatório para replay_storage 'uint16' ou 'uint8'
+        """
+        # Com seed, a exploração, a amostragem do replay e a inicialização dos
+        # pesos ficam determinísticas
+        if seed is not None:
+            tf.keras.utils.set_random_seed(seed)
+        self.rng = np.random.default_rng(seed)
         self.state_size = state_size
         self.action_size = action_size
-        self.memory = deque(maxlen=10000)
-        self.gamma = 0.99    # fator de desconto
+        if replay_storage is None:
+            self.memory = deque(maxlen=memory_size)
+        else:
+            low, high = state_bounds if state_bounds is not None else (None, None)
+            self.memory = ReplayMemory(memory_size, state_size, replay_storage, low, high)
+        self.gamma = gamma    # fator de desconto
         self.epsilon = 1.0   # taxa de exploração inicial
-        self.epsilon_min = 0.01
-        self.epsilon_decay = 0.995
-        self.learning_rate = 0.001
+        self.epsilon_min = epsilon_min
+        self.epsilon_decay = epsilon_decay
+        self.learning_rate = learning_rate
+        self.hidden_units = tuple(hidden_units)
         self.model = self._build_model()
         self.target_model = self._build_model()
         self.update_target_model()
+        # PhaseProfiler opcional (None = sem instrumentação)
+        self.profiler = None
         
     def _build_model(self):
         # Rede neural para aproximar a função Q-valor
         model = Sequential()
-        model.add(Dense(64, input_dim=self.state_size, activation='relu'))
-        model.add(Dense(64, activation='relu'))
+        for i, units in enumerate(self.hidden_units):
+            if i == 0:
+                model.add(Dense(units, input_dim=self.state_size, activation='relu'))
+            else:
+                model.add(Dense(units, activation='relu'))
         model.add(Dense(self.action_size, activation='linear'))
         model.compile(loss='mse', optimizer=Adam(learning_rate=self.learning_rate))
         return model
@@ -61,24 +97,58 @@ class DQNAgent:
         self.target_model.set_weights(self.model.get_weights())
     
     def remember(self, state, action, reward, next_state, done):
-        self.memory.append((state, action, reward, next_state, done))
+        if isinstance(self.memory, ReplayMemory):
+            self.memory.append(state, action, reward, next_state, done)
+        else:
+            self.memory.append((state, action, reward, next_state, done))
     
     def act(self, state):
-        if np.random.rand() <= self.epsilon:
-            return random.randrange(self.action_size)
+        if self.rng.random() <= self.epsilon:
+            return int(self.rng.integers(self.action_size))
         act_values = self.model.predict(state.reshape(1, -1), verbose=0)
+        if self.profiler is not None:
+            self.profiler.count('predict')
         return np.argmax(act_values[0])
     
+    def act_batch(self, states, epsilons=None):
+        """
+        Versão de act para vários ambientes: um sorteio de exploração para o lote
+        inteiro e uma única inferência, só nos estados gulosos.
+        
+        Args:
+            states: Array (n, state_size), um estado por ambiente
+            epsilons: Epsilon de cada ambiente (escalar ou array (n,), ex.:
+                      src.exploration.apex_epsilons); padrão: self.epsilon
+        
+        Returns:
+            Array (n,) de ações
+        """
+        states = np.asarray(states)
+        epsilons = self.epsilon if epsilons is None else epsilons
+        actions, predicted = epsilon_greedy(self.rng, states, epsilons, self.action_size,
+                                            lambda batch: self.model.predict(batch, verbose=0))
+        if predicted and self.profiler is not None:
+            self.profiler.count('predict')
+        return actions
+    
     def replay(self, batch_size):
         if len(self.memory) < batch_size:
             return
+        profiler = self.profiler
         
-        minibatch = random.sample(self.memory, batch_size)
-        states = np.array([experience[0] for experience in minibatch])
-        actions = np.array([experience[1] for experience in minibatch])
-        rewards = np.array([experience[2] for experience in minibatch])
-        next_states = np.array([experience[3] for experience in minibatch])
-        dones = np.array([experience[4] for experience in minibatch])
+        if isinstance(self.memory, ReplayMemory):
+            # Memória compacta: os estados do lote são convertidos para float32 de uma vez
+            states, actions, rewards, next_states, dones = self.memory.sample(batch_size, self.rng)
+        else:
+            indices = self.rng.choice(len(self.memory), batch_size, replace=False)
+            minibatch = [self.memory[i] for i in indices]
+            states = np.array([experience[0] for experience in minibatch])
+            actions = np.array([experience[1] for experience in minibatch])
+            rewards = np.array([experience[2] for experience in minibatch])
+            next_states = np.array([experience[3] for experience in minibatch])
+            dones = np.array([experience[4] for experience in minibatch])
+        if profiler is not None:
+            profiler.lap('replay_sample')
         
         # Predição do modelo atual
         state_values = self.model.predict(states, verbose=0)
@@ -89,22 +159,32 @@ class DQNAgent:
         next_actions = np.argmax(next_action_values, axis=1)
         
         target_next_state_values = self.target_model.predict(next_states, verbose=0)
+        if profiler is not None:
+            profiler.lap('replay_predict')
         
-        for i in range(len(minibatch)):
+        for i in range(batch_size):
             if dones[i]:
                 state_values[i][actions[i]] = rewards[i]
             else:
                 # Double Q-Learning
                 state_values[i][actions[i]] = rewards[i] + self.gamma * target_next_state_values[i][next_actions[i]]
         
+        if profiler is not None:
+            profiler.lap('replay_targets')
+        
         # Treina o modelo
         self.model.fit(states, state_values, epochs=1, verbose=0)
+        if profiler is not None:
+            profiler.lap('fit')
+            profiler.count('fit_samples', batch_size)
         
         # Decai a taxa de exploração
         if self.epsilon > self.epsilon_min:
             self.epsilon *= self.epsilon_decay
 
-def train_dqn(batch_size=64, episodes=1000, use_gpu=True):
+def train_dqn(batch_size=64, episodes=1000, use_gpu=True, record_path=None, seed=None,
+              profile=False, profile_episodes=None, profile_output="train_dqn.prof", reward_spec=None,
+              agent_params=None, output_dir=".", episode_callback=None, keep_checkpoints=3):
     """
     Treina um agente DQN para o ambiente RocketEnvironment
     
@@ -112,6 +192,20 @@ def train_dqn(batch_size=64, episodes=1000, use_gpu=True):
         batch_size: Tamanho do lote de dados para treinamento (maior = melhor utilização da GPU)
         episodes: Número de episódios de treinamento
         use_gpu: Define se deve utilizar GPU (quando disponível)
+        record_path: Arquivo (.rktj) onde gravar as trajetórias dos episódios (opcional)
+        seed: Semente para um treinamento reprodutível (ambiente, agente e TensorFlow)
+        profile: Mede o tempo de cada fase (env, act, remember, replay, fit, checkpoint)
+                 e imprime o resumo junto com a linha de progresso de cada episódio
+        profile_episodes: Par (primeiro, último) de episódios a capturar com o cProfile
+        profile_output: Arquivo onde salvar o perfil do cProfile
+        reward_spec: Especificação da recompensa (src.rewards.RewardSpec); padrão: a do ambiente
+        agent_params: Hiperparâmetros repassados ao DQNAgent (gamma, epsilon_decay,
+                      learning_rate, memory_size, hidden_units, ...)
+        output_dir: Diretório dos modelos e gráficos salvos
+        episode_callback: Função chamada ao fim de cada episódio com
+                          (episódio, recompensa, média dos últimos 100); se retornar
+                          True, o treinamento para (ex.: parada antecipada de um sweep)
+        keep_checkpoints: Checkpoints periódicos mantidos além do melhor (None = todos)
     """
     # Se o usuário não quiser usar GPU
     if not use_gpu:
@@ -123,12 +217,35 @@ def train_dqn(batch_size=64, episodes=1000, use_gpu=True):
     print(f"Dispositivos disponíveis: {[d.name for d in devices]}")
     print(f"Dispositivo que será usado: {tf.config.get_visible_devices()}")
     
+    # Sementes independentes para o ambiente e para o agente, derivadas da semente principal
+    env_seed, agent_seed = None, None
+    if seed is not None:
+        tf.config.experimental.enable_op_determinism()
+        env_seed, agent_seed = (int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(2))
+    
     # Configurações do ambiente e treinamento
-    env = RocketEnvironment(render_mode=None)  # Modo headless
+    env = RocketEnvironment(render_mode=None, seed=env_seed, reward_spec=reward_spec,
+                            reward_terms=True)  # Modo headless
     state_size = env.get_state_size()
     action_size = env.ACTION_SPACE_SIZE
-    agent = DQNAgent(state_size, action_size)
+    agent = DQNAgent(state_size, action_size, seed=agent_seed, state_bounds=env.state_bounds(),
+                     **(agent_params or {}))
     max_steps = 2000
+    recorder = TrajectoryWriter(record_path) if record_path else None
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Gravação de checkpoints e gráficos em segundo plano, com um modelo próprio
+    # para serializar os pesos copiados
+    checkpoint_model = agent._build_model()
+    def save_weights(weights, path):
+        checkpoint_model.set_weights(weights)
+        checkpoint_model.save(path)
+    writer = CheckpointWriter(output_dir, save_weights, keep_last=keep_checkpoints)
+    
+    # Instrumentação opcional; desligada, o loop só testa `profiler is not None`
+    profiler = PhaseProfiler() if profile else None
+    agent.profiler = profiler
+    episode_profiler = EpisodeRangeProfiler(*profile_episodes, profile_output) if profile_episodes else None
     
     # Para salvar os dados de desempenho
     scores = []
@@ -141,19 +258,50 @@ def train_dqn(batch_size=64, episodes=1000, use_gpu=True):
     last_time = start_time
     
     for e in range(episodes):
+        if episode_profiler is not None:
+            episode_profiler.begin_episode(e)
+        if profiler is not None:
+            profiler.start()
+        
         state = env.reset()
         total_reward = 0
+        # Soma de cada termo da recompensa no episódio (mais a penalidade de timeout)
+        term_totals = np.zeros(len(env.reward_spec.names))
+        timeout_reward = 0
+        if recorder is not None:
+            recorder.begin_episode(env, metadata={"source": "train_dqn", "episode": e, "epsilon": agent.epsilon})
+        if profiler is not None:
+            profiler.lap('reset')
         
         for step in range(max_steps):
             action = agent.act(state)
-            next_state, reward, done, info = env.step(action)
+            if profiler is not None:
+                profiler.lap('act')
+            if recorder is not None:
+                next_state, reward, done, info = recorder.step(env, action)
+            else:
+                next_state, reward, done, info = env.step(action)
+            if profiler is not None:
+                profiler.lap('env')
             
             agent.remember(state, action, reward, next_state, done)
             state = next_state
             total_reward += reward
+            if "reward_terms" in info:
+                term_totals += info["reward_terms"]
+            elif info["status"] == "timeout":
+                timeout_reward += reward
+            if profiler is not None:
+                profiler.lap('remember')
             
             if done:
                 break
+        
+        if recorder is not None:
+            recorder.end_episode(env)
+        if profiler is not None:
+            profiler.count('steps', step + 1)
+            profiler.lap('env')
                 
         # Treina com replay após cada episódio    
         agent.replay(batch_size)
@@ -161,6 +309,8 @@ def train_dqn(batch_size=64, episodes=1000, use_gpu=True):
         # Atualiza o modelo alvo periodicamente
         if e % 10 == 0:
             agent.update_target_model()
+        if profiler is not None:
+            profiler.lap('target_update')
         
         # Salva métricas
         scores.append(total_reward)
@@ -176,36 +326,40 @@ def train_dqn(batch_size=64, episodes=1000, use_gpu=True):
         
         print(f"Episode: {e+1}/{episodes}, Score: {total_reward:.2f}, Epsilon: {agent.epsilon:.2f}, " +
               f"Avg Score: {avg_score:.2f}, Time: {elapsed:.2f}s, Total: {total_elapsed:.2f}s")
+        breakdown = env.reward_spec.breakdown(term_totals)
+        breakdown["timeout"] = timeout_reward
+        print("  Termos: " + ", ".join(f"{name}: {value:.2f}" for name, value in breakdown.items() if value))
+        if profiler is not None:
+            profiler.lap('log')
         
-        # Salva o modelo a cada 100 episódios
+        # Salva o modelo e o gráfico a cada 100 episódios; o loop só copia os
+        # pesos e as métricas, a gravação é feita em segundo plano
         if (e+1) % 100 == 0:
-            agent.model.save(f"dqn_model_ep{e+1}.h5")
-            
-            # Plota gráficos
-            plt.figure(figsize=(12, 5))
-            
-            plt.subplot(1, 2, 1)
-            plt.plot(scores)
-            plt.plot(avg_scores)
-            plt.title('Recompensas por Episódio')
-            plt.xlabel('Episódio')
-            plt.ylabel('Recompensa')
-            plt.legend(['Recompensa', 'Média 100 episódios'])
-            
-            plt.subplot(1, 2, 2)
-            plt.plot(epsilons)
-            plt.title('Epsilon por Episódio')
-            plt.xlabel('Episódio')
-            plt.ylabel('Epsilon')
-            
-            plt.tight_layout()
-            plt.savefig(f"training_progress_ep{e+1}.png")
-            plt.close()
+            writer.save_checkpoint(e + 1, agent.model.get_weights(), avg_score)
+            writer.save_plot(e + 1, scores, avg_scores, epsilons)
+        
+        if profiler is not None:
+            profiler.lap('checkpoint')
+            print(f"  Fases: {profiler.end_episode()}")
+        if episode_profiler is not None:
+            episode_profiler.end_episode(e)
+        
+        if episode_callback is not None and episode_callback(e + 1, total_reward, avg_score):
+            print(f"Treinamento interrompido no episódio {e+1}")
+            break
     
-    # Salva o modelo final
-    agent.model.save("dqn_model_final.h5")
+    # Salva o modelo final e espera as gravações pendentes
+    writer.save_final(agent.model.get_weights())
+    writer.close()
+    if recorder is not None:
+        recorder.close()
     
     print(f"Treinamento concluído em {time.time() - start_time:.2f} segundos.")
+    if profiler is not None:
+        print(f"Tempo por fase (total): {profiler.report()}")
+    if episode_profiler is not None:
+        print(episode_profiler.close())
+        print(f"Perfil dos episódios {profile_episodes[0]}-{profile_episodes[1]} salvo em {profile_output}")
     return agent
 
 if __name__ == "__main__":
@@ -215,11 +369,44 @@ if __name__ == "__main__":
     parser.add_argument('--batch-size', type=int, default=64, help='Tamanho do batch (padrão: 64)')
     parser.add_argument('--episodes', type=int, default=1000, help='Número de episódios (padrão: 1000)')
     parser.add_argument('--no-gpu', action='store_true', help='Desabilita uso da GPU')
+    parser.add_argument('--record', default=None, help='Grava as trajetórias dos episódios neste arquivo (.rktj)')
+    parser.add_argument('--seed', type=int, default=None, help='Semente para um treinamento reprodutível')
+    parser.add_argument('--profile', action='store_true', help='Mede o tempo de cada fase do treinamento')
+    parser.add_argument('--profile-episodes', default=None,
+                        help='Captura um perfil cProfile destes episódios, ex.: 10-12')
+    parser.add_argument('--profile-output', default='train_dqn.prof',
+                        help='Arquivo do perfil cProfile (padrão: train_dqn.prof)')
+    parser.add_argument('--gamma', type=float, default=0.99, help='Fator de desconto (padrão: 0.99)')
+    parser.add_argument('--epsilon-decay', type=float, default=0.995, help='Decaimento do epsilon (padrão: 0.995)')
+    parser.add_argument('--learning-rate', type=float, default=0.001, help='Taxa de aprendizado (padrão: 0.001)')
+    parser.add_argument('--memory-size', type=int, default=10000, help='Capacidade da memória de replay (padrão: 10000)')
+    parser.add_argument('--hidden-units', type=int, nargs='+', default=[64, 64],
+                        help='Neurônios de cada camada oculta (padrão: 64 64)')
+    parser.add_argument('--replay-storage', choices=STORAGE_DTYPES, default=None,
+                        help='Memória de replay compacta com observações neste tipo (padrão: tuplas float64)')
+    parser.add_argument('--keep-checkpoints', type=int, default=3,
+                        help='Checkpoints periódicos mantidos além do melhor (padrão: 3)')
+    parser.add_argument('--output-dir', default='.', help='Diretório dos modelos e gráficos salvos')
     args = parser.parse_args()
     
     # Treina o modelo com os parâmetros especificados
     agent = train_dqn(
         batch_size=args.batch_size,
         episodes=args.episodes,
-        use_gpu=not args.no_gpu
+        use_gpu=not args.no_gpu,
+        record_path=args.record,
+        seed=args.seed,
+        profile=args.profile,
+        profile_episodes=parse_episode_range(args.profile_episodes) if args.profile_episodes else None,
+        profile_output=args.profile_output,
+        agent_params={
+            "gamma": args.gamma,
+            "epsilon_decay": args.epsilon_decay,
+            "learning_rate": args.learning_rate,
+            "memory_size": args.memory_size,
+            "hidden_units": args.hidden_units,
+            "replay_storage": args.replay_storage,
+        },
+        output_dir=args.output_dir,
+        keep_checkpoints=args.keep_checkpoints
     )